@@ -6,6 +6,7 @@ Builder -- Base builder object to build objects in DCC.
 """
 
 import logging
+from collections import OrderedDict
 
 from kraken.log import getLogger
 
@@ -13,7 +14,7 @@ from kraken.core.kraken_system import KrakenSystem
 from kraken.core.configs.config import Config
 from kraken.core.profiler import Profiler
 
-from kraken.core.objects.scene_item import SceneItem
+from kraken.core.objects.scene_item import SceneItem, getPathCacheStats
 
 logger = getLogger('kraken')
 
@@ -26,6 +27,9 @@ class Builder(object):
     def __init__(self, debugMode=False):
         super(Builder, self).__init__()
         self._buildElements = []
+        self._dccSceneItemIndex = {}
+        self._kSceneItemIndex = {}
+        self._buildMethodCache = {}
 
         self.config = Config.getInstance()
 
@@ -55,8 +59,49 @@ class Builder(object):
 
         self._buildElements.append(pairing)
 
+        # The first pairing registered for an item is the one returned by the
+        # lookups. The pair list holds a reference to the kraken item so its
+        # id stays unique while it is registered.
+        self._dccSceneItemIndex.setdefault(id(kSceneItem), dccSceneItem)
+        self._kSceneItemIndex.setdefault(self._getDCCSceneItemKey(dccSceneItem), kSceneItem)
+
+        return True
+
+    def _clearSceneItemPairs(self):
+        """Clears the registered scene item pairs.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._buildElements = []
+        self._dccSceneItemIndex = {}
+        self._kSceneItemIndex = {}
+
         return True
 
+    def _getDCCSceneItemKey(self, dccSceneItem):
+        """Returns the key of a dcc scene item in the reverse lookup index.
+
+        Hashable dcc items are compared by value so that different wrappers of
+        the same DCC node match. Other items are compared by identity.
+
+        Args:
+            dccSceneItem (object): dcc scene item to get the key for.
+
+        Returns:
+            object: The key of the dcc scene item.
+
+        """
+
+        try:
+            hash(dccSceneItem)
+        except TypeError:
+            return ('id', id(dccSceneItem))
+
+        return dccSceneItem
+
     def deleteBuildElements(self):
         """Clear out all dcc built elements from the scene if exist."""
 
@@ -74,12 +119,41 @@ class Builder(object):
         """
 
         if isinstance(kSceneItem, SceneItem):
-            for builtElement in self._buildElements:
-                if builtElement['src'] == kSceneItem:
-                    return builtElement['tgt']
+            return self._dccSceneItemIndex.get(id(kSceneItem))
 
         return None
 
+    def getDCCSceneItems(self, kSceneItems):
+        """Given a list of kSceneItems, returns the built dcc scene items, i.e.
+        for the constrainers of a constraint.
+
+        Args:
+            kSceneItems (list): kSceneItems to base the search.
+
+        Returns:
+            list: The DCC Scene Items that correspond to the given scene items,
+                None for the items that were not built.
+
+        """
+
+        index = self._dccSceneItemIndex
+
+        return [index.get(id(x)) if isinstance(x, SceneItem) else None for x in kSceneItems]
+
+    def getKSceneItem(self, dccSceneItem):
+        """Given a built dcc scene item, returns the kraken scene item it was
+        built from.
+
+        Args:
+            dccSceneItem (object): dcc scene item to base the search.
+
+        Returns:
+            object: The kraken Scene Item that corresponds to the given dcc scene item.
+
+        """
+
+        return self._kSceneItemIndex.get(self._getDCCSceneItemKey(dccSceneItem))
+
     def getDCCSceneItemPairs(self):
         """Returns all of the built dcc scene item pairs.
 
@@ -501,6 +575,194 @@ class Builder(object):
 
         return True
 
+    # ====================
+    # Build Order Methods
+    # ====================
+    def getComponentDependencies(self, kRig):
+        """Returns the components of the rig with the components they depend
+        on through their connected inputs.
+
+        Args:
+            kRig (object): The rig to get the component dependencies of.
+
+        Returns:
+            OrderedDict: The components in child order, each mapped to the list
+                of the components it takes inputs from.
+
+        """
+
+        components = kRig.getChildrenByType('Component')
+        componentSet = set(components)
+
+        dependencies = OrderedDict()
+        for component in components:
+            componentDeps = []
+            for componentInput in component.getInputs():
+                if componentInput.isConnected() is False:
+                    continue
+
+                connComp = componentInput.getConnection().getParent()
+                if connComp in componentSet and connComp not in componentDeps:
+                    componentDeps.append(connComp)
+
+            dependencies[component] = componentDeps
+
+        return dependencies
+
+    def getComponentBuildLevels(self, kRig):
+        """Returns the components of the rig grouped in dependency levels.
+
+        The components of a level only depend on components of the previous
+        levels so the components of one level can be built, connected and
+        evaluated together. Components keep their child order in a level.
+
+        Args:
+            kRig (object): The rig to get the build levels of.
+
+        Returns:
+            list: The levels, each a list of components.
+
+        """
+
+        dependencies = self.getComponentDependencies(kRig)
+
+        # Kahn's algorithm, processing one level of components at a time.
+        numDeps = {}
+        dependents = {}
+        for component, componentDeps in dependencies.iteritems():
+            numDeps[component] = len(componentDeps)
+            for connComp in componentDeps:
+                dependents.setdefault(connComp, []).append(component)
+
+        childOrder = dict([(x, i) for i, x in enumerate(dependencies)])
+
+        levels = []
+        level = [x for x in dependencies if numDeps[x] == 0]
+        numOrdered = 0
+        while len(level) > 0:
+            levels.append(level)
+            numOrdered += len(level)
+
+            nextLevel = []
+            for component in level:
+                for dependent in dependents.get(component, []):
+                    numDeps[dependent] -= 1
+                    if numDeps[dependent] == 0:
+                        nextLevel.append(dependent)
+
+            level = sorted(nextLevel, key=childOrder.get)
+
+        if numOrdered != len(dependencies):
+            remaining = [x for x in dependencies if numDeps[x] > 0]
+            cycles = self._findComponentCycles(remaining, dependencies)
+            raise Exception("Circular Dependencies Detected:" +
+                            "".join(["\n > Circular Dependency " + " -> ".join([x.getName() for x in cycle])
+                                     for cycle in cycles]))
+
+        return levels
+
+    def getComponentBuildOrder(self, kRig):
+        """Returns the components of the rig in an order where each component
+        comes after the components it takes inputs from.
+
+        This also checks the components for cycles and raises an exception if
+        any are found.
+
+        Args:
+            kRig (object): The rig to get the build order of.
+
+        Returns:
+            list: List of components in build order.
+
+        """
+
+        return [x for level in self.getComponentBuildLevels(kRig) for x in level]
+
+    def _findComponentCycles(self, components, dependencies):
+        """Returns the dependency cycles between the given components.
+
+        The strongly connected components of the dependency graph are found
+        with Tarjan's algorithm and one cycle is reported for each of them.
+
+        Args:
+            components (list): Components that could not be ordered.
+            dependencies (dict): The dependencies of each component.
+
+        Returns:
+            list: The cycles, each a list of components starting and ending
+                with the same component.
+
+        """
+
+        componentSet = set(components)
+        indices = {}
+        lowLinks = {}
+        stack = []
+        onStack = set()
+        stronglyConnected = []
+
+        for root in components:
+            if root in indices:
+                continue
+
+            # Iterative depth first walk, each entry holds a component and the
+            # iterator over its dependencies.
+            indices[root] = lowLinks[root] = len(indices)
+            stack.append(root)
+            onStack.add(root)
+            walk = [(root, iter(dependencies[root]))]
+            while len(walk) > 0:
+                component, depIter = walk[-1]
+                for connComp in depIter:
+                    if connComp not in componentSet:
+                        continue
+
+                    if connComp not in indices:
+                        indices[connComp] = lowLinks[connComp] = len(indices)
+                        stack.append(connComp)
+                        onStack.add(connComp)
+                        walk.append((connComp, iter(dependencies[connComp])))
+                        break
+                    elif connComp in onStack:
+                        lowLinks[component] = min(lowLinks[component], indices[connComp])
+                else:
+                    walk.pop()
+                    if len(walk) > 0:
+                        parent = walk[-1][0]
+                        lowLinks[parent] = min(lowLinks[parent], lowLinks[component])
+
+                    if lowLinks[component] == indices[component]:
+                        group = []
+                        while True:
+                            member = stack.pop()
+                            onStack.discard(member)
+                            group.append(member)
+                            if member is component:
+                                break
+
+                        if len(group) > 1 or component in dependencies[component]:
+                            stronglyConnected.append(set(group))
+
+        cycles = []
+        for group in stronglyConnected:
+            start = [x for x in components if x in group][0]
+            cycle = [start]
+            visited = set([start])
+            component = start
+            while True:
+                component = [x for x in dependencies[component] if x in group][0]
+                if component in visited:
+                    cycle = cycle[cycle.index(component):]
+                    cycle.append(component)
+                    break
+
+                visited.add(component)
+                cycle.append(component)
+
+            cycles.append(cycle)
+
+        return cycles
+
     # =====================
     # Build Object Methods
     # =====================
@@ -522,65 +784,122 @@ class Builder(object):
 
         return True
 
-    def buildHierarchy(self, kObject, component=None):
-        """Builds the hierarchy for the supplied kObject.
+    # ========================
+    # Build Method Dispatch
+    # ========================
+
+    # Build methods of the hierarchy objects, keyed by type name. The types
+    # are tested in order so new classes should be added above the classes
+    # they are derived from. No new types should be added below SceneItem.
+    # A method name of None means objects of that type are not built.
+    hierarchyBuildMethods = (
+        ('Layer', 'buildLayer'),
+        ('Component', None),
+        ('ComponentGroup', 'buildGroup'),
+        ('HierarchyGroup', 'buildHierarchyGroup'),
+        ('CtrlSpace', 'buildGroup'),
+        ('Transform', 'buildGroup'),
+        ('Locator', 'buildLocator'),
+        ('Joint', 'buildJoint'),
+        ('Control', 'buildControl'),
+        ('Curve', 'buildCurve'),
+        ('SceneItem', 'buildLocator')
+    )
+
+    constraintBuildMethods = (
+        ('OrientationConstraint', 'buildOrientationConstraint'),
+        ('PoseConstraint', 'buildPoseConstraint'),
+        ('PositionConstraint', 'buildPositionConstraint'),
+        ('ScaleConstraint', 'buildScaleConstraint')
+    )
+
+    def _getBuildMethod(self, kSceneItem, buildMethods):
+        """Returns the method of this builder that builds the given scene item.
+
+        The method is resolved once per class of scene item and cached.
 
         Args:
-            kObject (object): kraken object to build.
-            component (Component): component that this object belongs to.
+            kSceneItem (object): kraken scene item to get the build method for.
+            buildMethods (tuple): (type name, method name) pairs tested in order.
 
         Returns:
-            object: DCC object that was created.
+            method: The bound build method, None if the item is not built.
 
         """
 
+        cacheKey = (id(buildMethods), type(kSceneItem))
+        cache = self._buildMethodCache
+        if cacheKey in cache:
+            return cache[cacheKey]
 
-        dccSceneItem = None
+        for typeName, methodName in buildMethods:
+            if kSceneItem.isTypeOf(typeName):
+                break
+        else:
+            raise NotImplementedError(kSceneItem.getName() + ' has an unsupported type: ' + str(type(kSceneItem)))
 
-        buildName = kObject.getBuildName()
+        method = None
+        if methodName is not None:
+            method = getattr(self, methodName)
 
-        logger.debug("building: " + kObject.getPath() + " as: " + buildName + " type: " + kObject.getTypeName())
+        cache[cacheKey] = method
 
-        # Build Object
-        if kObject.isTypeOf("Layer"):
-            dccSceneItem = self.buildLayer(kObject, buildName)
+        return method
 
-        elif kObject.isTypeOf("Component"):
-            pass
+    def getHierarchyBuildMethod(self, kSceneItem):
+        """Returns the method that builds the given hierarchy object, i.e.
+        buildLocator() for a Locator.
 
-        elif kObject.isTypeOf("ComponentGroup"):
-            dccSceneItem = self.buildGroup(kObject, buildName)
-            component = kObject
+        Args:
+            kSceneItem (object): kraken scene item to get the build method for.
 
-        elif kObject.isTypeOf("HierarchyGroup"):
-            dccSceneItem = self.buildHierarchyGroup(kObject, buildName)
+        Returns:
+            method: The bound build method, None if the item is not built.
 
-        elif kObject.isTypeOf("CtrlSpace"):
-            dccSceneItem = self.buildGroup(kObject, buildName)
+        """
 
-        elif kObject.isTypeOf("Transform"):
-            dccSceneItem = self.buildGroup(kObject, buildName)
+        return self._getBuildMethod(kSceneItem, self.hierarchyBuildMethods)
 
-        elif kObject.isTypeOf("Locator"):
-            dccSceneItem = self.buildLocator(kObject, buildName)
+    def getConstraintBuildMethod(self, kConstraint):
+        """Returns the method that builds the given constraint, i.e.
+        buildPoseConstraint() for a PoseConstraint.
 
-        elif kObject.isTypeOf("Joint"):
-            dccSceneItem = self.buildJoint(kObject, buildName)
+        Args:
+            kConstraint (object): kraken constraint to get the build method for.
 
-        elif kObject.isTypeOf("Control"):
-            dccSceneItem = self.buildControl(kObject, buildName)
+        Returns:
+            method: The bound build method.
 
-        elif kObject.isTypeOf("Curve"):
-            dccSceneItem = self.buildCurve(kObject, buildName)
+        """
 
-        # Important Note: The order of these tests is important.
-        # New classes should be added above the classes they are derrived from.
-        # No new types should be added below SceneItem here.
-        elif kObject.isTypeOf("SceneItem"):
-            dccSceneItem = self.buildLocator(kObject, buildName)
+        return self._getBuildMethod(kConstraint, self.constraintBuildMethods)
 
-        else:
-            raise NotImplementedError(kObject.getName() + ' has an unsupported type: ' + str(type(kObject)))
+    def buildHierarchy(self, kObject, component=None):
+        """Builds the hierarchy for the supplied kObject.
+
+        Args:
+            kObject (object): kraken object to build.
+            component (Component): component that this object belongs to.
+
+        Returns:
+            object: DCC object that was created.
+
+        """
+
+
+        dccSceneItem = None
+
+        buildName = kObject.getBuildName()
+
+        logger.debug("building: " + kObject.getPath() + " as: " + buildName + " type: " + kObject.getTypeName())
+
+        # Build Object
+        buildMethod = self.getHierarchyBuildMethod(kObject)
+        if buildMethod is not None:
+            dccSceneItem = buildMethod(kObject, buildName)
+
+        if kObject.isTypeOf("ComponentGroup"):
+            component = kObject
 
         if dccSceneItem is not None:
             self.buildAttributes(kObject)
@@ -613,22 +932,7 @@ class Builder(object):
             constraint = kObject.getConstraintByIndex(i)
 
             # Build Object
-            if constraint.isTypeOf("OrientationConstraint"):
-                self.buildOrientationConstraint(constraint)
-
-            elif constraint.isTypeOf("PoseConstraint"):
-                self.buildPoseConstraint(constraint)
-
-            elif constraint.isTypeOf("PositionConstraint"):
-                self.buildPositionConstraint(constraint)
-
-            elif constraint.isTypeOf("ScaleConstraint"):
-                self.buildScaleConstraint(constraint)
-
-            else:
-                raise NotImplementedError(constraint.getName() +
-                                          ' has an unsupported type: ' +
-                                          str(type(constraint)))
+            self.getConstraintBuildMethod(constraint)(constraint)
 
         # Build children
         for i in xrange(kObject.getNumChildren()):
@@ -719,6 +1023,7 @@ class Builder(object):
         """
 
         Profiler.getInstance().push("buildRig:" + kRig.getName())
+        pathCacheStats = getPathCacheStats()
 
         try:
             self._preBuild(kRig)
@@ -745,83 +1050,7 @@ class Builder(object):
                     self.setObjectColor(layer)
 
 
-            def dep_walk(comp, visited, unseen):
-                """Recursively walks the input connections for the specified
-                component while adding visited components to the visited list.
-
-                Args:
-                    comp (Component): the component to walk.
-                    visited (list): list that holds the visited components.
-                    unseen (list): list that holds the unseen components.
-
-                """
-
-                unseen.append(comp)
-
-                connectedInputs = [x for x in comp.getInputs() if x.isConnected() is True]
-                connectedComps = [x.getConnection().getParent() for x in connectedInputs]
-                for connComp in connectedComps:
-                    if connComp not in visited:
-                        if connComp in unseen:
-                            raise Exception("Circular Dependency " + comp.getName() + " <-> " + connComp.getName())
-
-                        dep_walk(connComp, visited, unseen)
-
-                visited.append(comp)
-                unseen.remove(comp)
-
-            def getBuildOrder():
-                """Returns the build order for the components.
-
-                This also checks the components for cycles and raises an exception if any are found.
-
-                Returns:
-                    list: List of components in build order.
-
-                """
-
-                # Get the components with no output connections.
-                # We start with the leaf components and walk up the graph to ensure that
-                # proper build order is generated.
-                leafComps = []
-                components = kRig.getChildrenByType('Component')
-                for comp in components:
-                    connectedOutputs = [x for x in comp.getOutputs() if x.isConnected() is True]
-                    if len(connectedOutputs) == 0:
-                        leafComps.append(comp)
-
-                unseen = []
-                orderedComponents = []
-                for comp in leafComps:
-                    dep_walk(comp, orderedComponents, unseen)
-
-                cyclicMessages = []
-                cyclicComponents = list(set(components) - set(orderedComponents))
-                for comp in cyclicComponents:
-                    connectedInputs = [x for x in comp.getInputs() if x.isConnected() is True]
-                    connInputComps = [x.getConnection().getParent() for x in connectedInputs]
-
-                    connCyclicComps = []
-                    connectedOutputs = [x for x in comp.getOutputs() if x.isConnected() is True]
-                    for connOutput in connectedOutputs:
-                        for i in xrange(connOutput.getNumConnections()):
-                            connComp = connOutput.getConnection(i).getParent()
-                            if connComp in connInputComps:
-                                if connComp not in connCyclicComps:
-                                    connCyclicComps.append(connComp)
-                                    cyclicMessages.append("\n > Circular Dependency " + comp.getName() + " <-> " + connComp.getName())
-
-                if len(cyclicMessages) > 0:
-                    raise Exception("Circular Dependencies Detected:" + "".join([x for x in cyclicMessages]))
-
-                return orderedComponents
-
-            # TODO: Implement code to more thoroughly  walk each component to check
-            # for cycles
-            #
-            # orderedComponents = getBuildOrder()
-
-            orderedComponents = kRig.getChildrenByType('Component')  # getBuildOrder()
+            orderedComponents = self.getComponentBuildOrder(kRig)
 
             # Build Components in the correct order
             for component in orderedComponents:
@@ -859,6 +1088,12 @@ class Builder(object):
 
         Profiler.getInstance().pop()
 
+        hits = getPathCacheStats()['hits'] - pathCacheStats['hits']
+        misses = getPathCacheStats()['misses'] - pathCacheStats['misses']
+        if hits + misses > 0:
+            logger.debug("Path cache hit rate: " + str(round(100.0 * hits / (hits + misses), 1)) +
+                         "% (" + str(hits) + " hits, " + str(misses) + " misses)")
+
         return self.getDCCSceneItem(kRig)
 
     def buildComponent(self, kComponent):
@@ -6,6 +6,13 @@ Config -- Base config object used to configure builders.
 """
 
 
+# Compiled name formatters are stamped with the generation they were compiled
+# in. Any change to the name template, explicit naming or the current config
+# starts a new generation, which invalidates the build names memoized on the
+# objects.
+_nameFormatGeneration = 0
+
+
 class Config(object):
     """Base Configuration for Kraken builders."""
 
@@ -24,6 +31,7 @@ class Config(object):
         self._colors = self.initColors()
         self._colorMap = self.initColorMap()
         self._nameTemplate = self.initNameTemplate()
+        self.invalidateNameFormatters()
         self._controlShapes = self.initControlShapes()
         self._metaData = {}
 
@@ -184,6 +192,176 @@ class Config(object):
         return self._nameTemplate
 
 
+    def setNameTemplate(self, nameTemplate):
+        """Sets the naming template for this configuration.
+
+        Args:
+            nameTemplate (dict): naming template.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._nameTemplate = nameTemplate
+        self.invalidateNameFormatters()
+
+        return True
+
+
+    def invalidateNameFormatters(self):
+        """Clears the compiled name formatters.
+
+        Must be called after the dictionary returned by getNameTemplate() is
+        modified in place.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        global _nameFormatGeneration
+
+        self._nameFormatters = {}
+        _nameFormatGeneration += 1
+
+        return True
+
+
+    def getNameFormatGeneration(self):
+        """Returns the generation of the compiled name formatters.
+
+        Returns:
+            int: generation, changes each time the formatters are invalidated.
+
+        """
+
+        return _nameFormatGeneration
+
+
+    def getNameFormatter(self, cls):
+        """Returns the compiled name formatter for a class of object.
+
+        Args:
+            cls (type): class of the objects to format the names of.
+
+        Returns:
+            function: formatter taking an object and returning its build name.
+
+        """
+
+        formatter = self._nameFormatters.get(cls)
+        if formatter is None:
+            formatter = self.compileNameFormatter(cls)
+            self._nameFormatters[cls] = formatter
+
+        return formatter
+
+
+    def compileNameFormatter(self, cls):
+        """Compiles the name template for a class of object.
+
+        The format and type of the class are resolved once, separators and
+        type names become constant strings. The returned formatter only
+        resolves the tokens that depend on the object and joins the parts.
+
+        Args:
+            cls (type): class of the objects to format the names of.
+
+        Returns:
+            function: formatter taking an object and returning its build name.
+
+        """
+
+        if self._explicitNaming is True:
+            return _formatExplicitName
+
+        mro = type.mro(cls)
+        typeNameHierarchy = [x.__name__ for x in mro[:mro.index(object)]]
+
+        nameTemplate = self._nameTemplate
+
+        # Get the token list for this type of object
+        format = None
+        for typeName in nameTemplate['formats'].keys():
+            if typeName in typeNameHierarchy:
+                format = nameTemplate['formats'][typeName]
+                break
+
+        if format is None:
+            format = nameTemplate['formats']['default']
+
+        objectType = None
+        for eachType in typeNameHierarchy:
+            if eachType in nameTemplate['types'].keys():
+                objectType = eachType
+                break
+
+        if objectType is None:
+            objectType = 'default'
+
+        separator = nameTemplate['separator']
+        locations = frozenset(nameTemplate['locations'])
+        isComponent = 'Component' in typeNameHierarchy
+
+        # Each step is a constant string, None for a separator or a function
+        # returning the string of a token, or None to skip all following
+        # separators.
+        steps = []
+        for token in format:
+
+            if token == 'sep':
+                steps.append(None)
+
+            elif token == 'location':
+                steps.append(_makeLocationResolver(isComponent, locations))
+
+            elif token == 'type':
+                if objectType == 'Locator':
+                    steps.append(_makeLocatorTypeResolver(nameTemplate['types']))
+                else:
+                    steps.append(nameTemplate['types'][objectType])
+
+            elif token == 'name':
+                steps.append(_resolveName)
+
+            elif token == 'component':
+                steps.append(_resolveComponent)
+
+            elif token == 'container':
+                steps.append(_resolveContainer)
+
+            else:
+                steps.append(_makeInvalidTokenResolver(token))
+
+        steps = tuple(steps)
+
+        def formatter(kObject):
+            if kObject.testFlag('EXPLICIT_NAME'):
+                return kObject.getName()
+
+            parts = []
+            skipSep = False
+            for step in steps:
+                if step is None:
+                    if not skipSep:
+                        parts.append(separator)
+
+                elif isinstance(step, basestring):
+                    parts.append(step)
+
+                else:
+                    part = step(kObject)
+                    if part is None:
+                        skipSep = True
+                    else:
+                        parts.append(part)
+
+            return ''.join(parts)
+
+        return formatter
+
+
     # ======================
     # Control Shape Methods
     # ======================
@@ -963,6 +1141,9 @@ class Config(object):
 
         """
 
+        if value != self._explicitNaming:
+            self.invalidateNameFormatters()
+
         self._explicitNaming = value
 
         return True
@@ -981,6 +1162,17 @@ class Config(object):
         return self._metaData.get(key, value)
 
 
+    def getAllMetaData(self):
+        """Returns all the metaData flags of the config.
+
+        Returns:
+            dict: A copy of the metaData flags by key.
+
+        """
+
+        return dict(self._metaData)
+
+
     def setMetaData(self, key, value):
         """Set the config to contain a metaData flag.
 
@@ -1044,3 +1236,138 @@ class Config(object):
         Config.__instance = None
 
         return True
+
+
+# ==========================
+# Name Token Resolvers
+# ==========================
+def _formatExplicitName(kObject):
+    """Formats the name of an object when explicit naming is enabled.
+
+    Args:
+        kObject (object): Object to name.
+
+    Returns:
+        str: The name of the object, unchanged.
+
+    """
+
+    return kObject.getName()
+
+
+def _resolveName(kObject):
+    """Resolves the 'name' token.
+
+    Args:
+        kObject (object): Object to name.
+
+    Returns:
+        str: The name of the object.
+
+    """
+
+    return kObject.getName()
+
+
+def _resolveComponent(kObject):
+    """Resolves the 'component' token.
+
+    Args:
+        kObject (object): Object to name.
+
+    Returns:
+        str: The name of the component of the object, None if it has none.
+
+    """
+
+    component = kObject.getComponent()
+    if component is None:
+        return None
+
+    return component.getName()
+
+
+def _resolveContainer(kObject):
+    """Resolves the 'container' token.
+
+    Args:
+        kObject (object): Object to name.
+
+    Returns:
+        str: The name of the container of the object, None if it has none.
+
+    """
+
+    container = kObject.getContainer()
+    if container is None:
+        return None
+
+    return container.getName()
+
+
+def _makeLocationResolver(isComponent, locations):
+    """Makes the resolver of the 'location' token.
+
+    Args:
+        isComponent (bool): Whether the named objects are components, which
+            hold the location themselves.
+        locations (list): Valid locations of the name template.
+
+    Returns:
+        func: Resolver returning the location, raises ValueError for invalid
+            locations.
+
+    """
+
+    def resolveLocation(kObject):
+        if isComponent:
+            location = kObject.getLocation()
+        else:
+            location = kObject.getComponent().getLocation()
+
+        if location not in locations:
+            raise ValueError("Invalid location on: " + kObject.getPath())
+
+        return location
+
+    return resolveLocation
+
+
+def _makeLocatorTypeResolver(types):
+    """Makes the resolver of the 'type' token for locators, which are typed as
+    component inputs or outputs by their flags.
+
+    Args:
+        types (dict): Type names of the name template.
+
+    Returns:
+        func: Resolver returning the type name of a locator.
+
+    """
+
+    def resolveLocatorType(kObject):
+        if kObject.testFlag('inputObject'):
+            return types['ComponentInput']
+        elif kObject.testFlag('outputObject'):
+            return types['ComponentOutput']
+
+        return types['Locator']
+
+    return resolveLocatorType
+
+
+def _makeInvalidTokenResolver(token):
+    """Makes the resolver of a token the name template can't resolve.
+
+    Args:
+        token (str): The unresolvable token.
+
+    Returns:
+        func: Resolver raising ValueError when the token is used.
+
+    """
+
+    def resolveInvalidToken(kObject):
+        raise ValueError("Unresolvabled token '" + token + "' used on: " + kObject.getPath())
+
+    return resolveInvalidToken
@@ -12,7 +12,10 @@ import json
 import importlib
 from collections import OrderedDict
 
-import FabricEngine.Core
+try:
+    import FabricEngine.Core
+except ImportError:
+    FabricEngine = None
 
 # import kraken
 from kraken.core.profiler import Profiler
@@ -27,8 +30,9 @@ krakenDir = os.path.abspath(os.path.join(krakenSystemModuleDir, '..', '..', '..'
 os.environ['KRAKEN_PATH'] = krakenDir
 
 krakenExtsDir = os.path.join(krakenDir, 'Exts')
-if krakenExtsDir not in os.environ['FABRIC_EXTS_PATH']:
-    os.environ['FABRIC_EXTS_PATH'] = krakenExtsDir + os.pathsep + os.environ['FABRIC_EXTS_PATH']
+fabricExtsPath = os.environ.get('FABRIC_EXTS_PATH', '')
+if krakenExtsDir not in fabricExtsPath:
+    os.environ['FABRIC_EXTS_PATH'] = krakenExtsDir + os.pathsep + fabricExtsPath
 
 canvasPresetsDir = os.path.join(krakenDir, 'Presets')
 if 'FABRIC_DFG_PATH' in os.environ:
@@ -40,6 +44,8 @@ else:
 
 logger = getLogger('kraken')
 
+COMPONENT_MANIFEST_VERSION = 1
+
 
 class KrakenSystem(object):
     """The KrakenSystem is a singleton object used to provide an interface with
@@ -56,9 +62,21 @@ class KrakenSystem(object):
         self.typeDescs = None
         self.registeredTypes = None
         self.loadedExtensions = []
+        self._typeDescsDirty = False
+
+        self._constructorPlans = {}
+        self._rtValClass = None
+        self._rtValTypeNames = {}
+        self._rtValTypeNameStats = {
+            'calls': 0,
+            'fastPath': 0,
+            'cacheHits': 0,
+            'slowPath': 0
+        }
 
         self.registeredConfigs = OrderedDict()
         self.registeredComponents = OrderedDict()
+        self.componentIndex = OrderedDict()
         # self.moduleImportManager = ModuleImportManager()
 
 
@@ -75,6 +93,10 @@ class KrakenSystem(object):
 
             client = getFabricClient()
             if client is None:
+                if FabricEngine is None:
+                    Profiler.getInstance().pop()
+                    raise ImportError("Fabric Engine is not available. Use the 'native' math backend to use Kraken math types without it.")
+
                 options = {
                     'reportCallback': fabricCallback,
                     'guarded': True
@@ -111,19 +133,162 @@ class KrakenSystem(object):
 
         """
 
-        if extension not in self.loadedExtensions:
+        self.loadExtensions([extension])
+
+
+    def loadExtensions(self, extensions):
+        """Loads the given extensions and updates the registeredTypes cache.
+
+        The type descriptions are not fetched from the client here. They are
+        marked as out of date and refreshed once, on the next call to
+        getTypeDescs(), no matter how many extensions were loaded in between.
+
+        Args:
+            extensions (list): The names of the extensions to load.
+
+        """
+
+        loaded = False
+        for extension in extensions:
+            if extension in self.loadedExtensions:
+                continue
+
             Profiler.getInstance().push("loadExtension:" + extension)
             self.client.loadExtension(extension)
-            self.registeredTypes = self.client.RT.types
-            self.typeDescs = self.client.RT.getRegisteredTypes()
             # Cache the loaded extension so that we aviod refreshing the typeDescs cache(costly)
             self.loadedExtensions.append(extension)
+            loaded = True
+            Profiler.getInstance().pop()
+
+        if loaded:
+            self.registeredTypes = self.client.RT.types
+            self._typeDescsDirty = True
+
+
+    def getTypeDescs(self):
+        """Returns the descriptions of the registered KL types.
+
+        After extensions have been loaded, only the types missing from the
+        cache are merged in and only their constructor plans are invalidated.
+
+        Returns:
+            dict: The type descriptions keyed by type name.
+
+        """
+
+        if self._typeDescsDirty:
+            Profiler.getInstance().push("getRegisteredTypes")
+            registeredTypeDescs = self.client.RT.getRegisteredTypes()
+            if self.typeDescs is None:
+                self.typeDescs = registeredTypeDescs
+                self.invalidateConstructorPlans()
+            else:
+                addedTypes = [x for x in registeredTypeDescs if x not in self.typeDescs]
+                for typeName in addedTypes:
+                    self.typeDescs[typeName] = registeredTypeDescs[typeName]
+
+                self.invalidateConstructorPlans(addedTypes)
+
+            self._typeDescsDirty = False
             Profiler.getInstance().pop()
 
+        return self.typeDescs
+
     # ==============
     # RTVal Methods
     # ==============
 
+    def getConstructorPlan(self, dataType):
+        """Returns the plan used to construct RTVals of the given type.
+
+        The plan is compiled on first use from the registered types and holds
+        the KL type, the names and types of its members, and the construction
+        strategy ('create' or 'construct') once it is known. Types missing from
+        the registered types, such as arrays, have no members.
+
+        Args:
+            dataType (str): The name of the data type.
+
+        Returns:
+            dict: The constructor plan.
+
+        """
+
+        plan = self._constructorPlans.get(dataType)
+        if plan is None:
+            self.loadCoreClient()
+
+            typeDesc = self.getTypeDescs().get(dataType, {})
+            if 'members' in typeDesc:
+                members = tuple([(member['name'], member['type']) for member in typeDesc['members']])
+            else:
+                members = None
+
+            plan = {
+                'klType': getattr(self.registeredTypes, dataType),
+                'members': members,
+                'strategy': None
+            }
+
+            self._constructorPlans[dataType] = plan
+
+        return plan
+
+
+    def invalidateConstructorPlans(self, dataTypes=None):
+        """Clears the cached constructor plans so they are compiled again from
+        the registered types. Called when an extension is loaded.
+
+        Args:
+            dataTypes (list): Names of the data types to invalidate, all plans
+                are cleared if None.
+
+        """
+
+        if dataTypes is None:
+            self._constructorPlans.clear()
+            return
+
+        for dataType in dataTypes:
+            self._constructorPlans.pop(dataType, None)
+
+
+    def _constructFromPlan(self, plan, dataType):
+        """Constructs a new RTVal with the strategy recorded in the plan.
+
+        The strategy is found by trying 'create()' first and falling back to
+        the constructor, then stored so later calls skip the exception
+        handling.
+
+        Args:
+            plan (dict): The constructor plan of the data type.
+            dataType (str): The name of the data type.
+
+        Returns:
+            object: The constructed RTVal.
+
+        """
+
+        klType = plan['klType']
+        strategy = plan['strategy']
+        if strategy == 'create':
+            return klType.create()
+        elif strategy == 'construct':
+            return klType()
+
+        try:
+            value = klType.create()
+            plan['strategy'] = 'create'
+            return value
+        except:
+            try:
+                value = klType()
+                plan['strategy'] = 'construct'
+                return value
+            except Exception as e:
+                raise Exception("Error constructing RTVal:" + dataType)
+
+
     def constructRTVal(self, dataType, defaultValue=None):
         """Constructs a new RTVal using the given name and optional devault value.
 
@@ -136,41 +301,29 @@ class KrakenSystem(object):
 
         """
 
-        self.loadCoreClient()
-        klType = getattr(self.registeredTypes, dataType)
+        if defaultValue is not None and hasattr(defaultValue, '_rtval'):
+            return defaultValue.getRTVal()
 
-        if defaultValue is not None:
-            if hasattr(defaultValue, '_rtval'):
-                return defaultValue._rtval
+        plan = self._constructorPlans.get(dataType)
+        if plan is None:
+            plan = self.getConstructorPlan(dataType)
 
-            typeDesc = self.typeDescs[dataType]
-            if 'members' in typeDesc:
-                try:
-                    value = klType.create()
-                except:
-                    try:
-                        return klType()
-                    except Exception as e:
-                        raise Exception("Error constructing RTVal:" + dataType)
-
-                for i in xrange(0, len(typeDesc['members'])):
-                    memberName = typeDesc['members'][i]['name']
-                    memberType = typeDesc['members'][i]['type']
-                    if memberName in defaultValue:
-                        setattr(value, memberName, self.constructRTVal(memberType, getattr(defaultValue, memberName)))
+        if defaultValue is None:
+            return self._constructFromPlan(plan, dataType)
 
-                return value
+        members = plan['members']
+        if members is None:
+            return plan['klType'](defaultValue)
 
-            else:
-                return klType(defaultValue)
-        else:
-            try:
-                return klType.create()
-            except:
-                try:
-                    return klType()
-                except Exception as e:
-                    raise Exception("Error constructing RTVal:" + dataType)
+        value = self._constructFromPlan(plan, dataType)
+        if plan['strategy'] == 'construct':
+            return value
+
+        for memberName, memberType in members:
+            if memberName in defaultValue:
+                setattr(value, memberName, self.constructRTVal(memberType, getattr(defaultValue, memberName)))
+
+        return value
 
 
     def rtVal(self, dataType, defaultValue=None):
@@ -191,6 +344,9 @@ class KrakenSystem(object):
     def isRTVal(self, value):
         """Returns true if the given value is an RTVal.
 
+        The class of the first RTVal found is cached so that later checks are
+        a single type comparison.
+
         Args:
             value (value): value to test.
 
@@ -199,25 +355,100 @@ class KrakenSystem(object):
 
         """
 
-        return str(type(value)) == "<type 'PyRTValObject'>"
+        valueType = type(value)
+        if self._rtValClass is not None:
+            return valueType is self._rtValClass
+
+        if str(valueType) == "<type 'PyRTValObject'>":
+            self._rtValClass = valueType
+            return True
+
+        return False
+
+
+    def isRTValOfType(self, value, typeName):
+        """Returns true if the given value is an RTVal of the given KL type.
+
+        This is the check used by the math type constructors. Values that are
+        not RTVals are rejected without looking up a type name.
+
+        Args:
+            value (value): value to test.
+            typeName (str): The name of the KL type.
+
+        Returns:
+            bool: True if the value is an RTVal of the given type.
+
+        """
+
+        if not self.isRTVal(value):
+            return False
+
+        return self.getRTValTypeName(value) == typeName
 
 
     def getRTValTypeName(self, rtval):
         """Returns the name of the type, handling extracting the name from KL RTVals.
 
+        The name is read with RTVal.getTypeNameStr() when the Fabric client
+        provides it. Otherwise the JSON description of the type is requested,
+        which crosses the bridge on every call, and the names are cached by the
+        description so each description is only parsed once. The Type RTVals
+        returned by rtval.type() are new wrappers on every call and can't be
+        used as cache keys.
+
         Args:
             rtval (rtval): The rtval to extract the name from.
 
         Returns:
-            bool: True if successful.
+            str: The name of the type, 'None' if the value is not an RTVal.
 
         """
 
-        if ks.isRTVal(rtval):
-            return json.loads(rtval.type("Type").jsonDesc("String").getSimpleType())['name']
-        else:
+        if not self.isRTVal(rtval):
             return "None"
 
+        stats = self._rtValTypeNameStats
+        stats['calls'] += 1
+
+        if hasattr(rtval, 'getTypeNameStr'):
+            stats['fastPath'] += 1
+            return rtval.getTypeNameStr()
+
+        typeDesc = rtval.type("Type").jsonDesc("String").getSimpleType()
+        typeName = self._rtValTypeNames.get(typeDesc)
+        if typeName is not None:
+            stats['cacheHits'] += 1
+            return typeName
+
+        stats['slowPath'] += 1
+        typeName = json.loads(typeDesc)['name']
+        self._rtValTypeNames[typeDesc] = typeName
+
+        return typeName
+
+
+    def getRTValTypeNameStats(self):
+        """Returns counters for the RTVal type name lookups.
+
+        'calls' is the number of lookups on RTVals, 'fastPath' the lookups that
+        used RTVal.getTypeNameStr(), 'cacheHits' the lookups served from the
+        cache and 'slowPath' the lookups that had to parse the type description.
+
+        Returns:
+            dict: The lookup counters.
+
+        """
+
+        return dict(self._rtValTypeNameStats)
+
+
+    def resetRTValTypeNameStats(self):
+        """Resets the counters for the RTVal type name lookups."""
+
+        for key in self._rtValTypeNameStats:
+            self._rtValTypeNameStats[key] = 0
+
     # ==================
     # Config Methods
     # ==================
@@ -289,6 +520,9 @@ class KrakenSystem(object):
     def getComponentClass(self, className):
         """Returns the registered Python component class with the given name
 
+        Components found by loadComponentModules() are imported on the first
+        request for one of their classes.
+
         Args:
             className (str): The name of the Python component class
 
@@ -297,6 +531,11 @@ class KrakenSystem(object):
 
         """
 
+        if className not in self.registeredComponents and className in self.componentIndex:
+            module = self.componentIndex[className]['module']
+            logger.info("Importing component module: " + module)
+            importlib.import_module(module)
+
         if className not in self.registeredComponents:
             raise Exception("Component with that class not registered:" + className)
 
@@ -311,7 +550,166 @@ class KrakenSystem(object):
 
         """
 
-        return self.registeredComponents.keys()
+        classNames = self.componentIndex.keys()
+        for className in self.registeredComponents:
+            if className not in self.componentIndex:
+                classNames.append(className)
+
+        return classNames
+
+
+    def getComponentType(self, className):
+        """Returns the type of the given component class ('Guide', 'Base', ...)
+        without importing its module.
+
+        Args:
+            className (str): The name of the Python component class
+
+        Returns:
+            str: The type of the component.
+
+        """
+
+        if className in self.componentIndex:
+            return self.componentIndex[className]['type']
+
+        return self.getComponentClass(className).getComponentType()
+
+
+    def getComponentFilePath(self, className):
+        """Returns the path of the file defining the given component class
+        without importing its module.
+
+        Args:
+            className (str): The name of the Python component class
+
+        Returns:
+            str: The path of the component module file.
+
+        """
+
+        if className in self.componentIndex:
+            return self.componentIndex[className]['filePath']
+
+        module = sys.modules[self.getComponentClass(className).__module__]
+        return module.__file__
+
+
+    def getComponentManifestPath(self):
+        """Returns the path of the component manifest file.
+
+        The manifest caches the component classes found in each component
+        module so that unchanged modules are not imported by
+        loadComponentModules(). The path is read from the
+        'KRAKEN_COMPONENT_MANIFEST' environment variable, an empty value
+        disables the manifest.
+
+        Returns:
+            str: The path of the manifest file, None if disabled.
+
+        """
+
+        manifestPath = os.environ.get('KRAKEN_COMPONENT_MANIFEST',
+            os.path.join(os.path.expanduser('~'), '.kraken', 'componentManifest.json'))
+
+        if manifestPath == '':
+            return None
+
+        return manifestPath
+
+
+    def _readComponentManifest(self):
+        """Reads the component manifest file.
+
+        Returns:
+            dict: The manifest entries keyed by module file path.
+
+        """
+
+        manifestPath = self.getComponentManifestPath()
+        if manifestPath is None or not os.path.exists(manifestPath):
+            return {}
+
+        try:
+            with open(manifestPath, 'r') as manifestFile:
+                manifest = json.load(manifestFile)
+        except (IOError, ValueError):
+            logger.warning("Invalid component manifest, it will be rebuilt: " + manifestPath)
+            return {}
+
+        if manifest.get('version') != COMPONENT_MANIFEST_VERSION:
+            return {}
+
+        return manifest.get('files', {})
+
+
+    def _writeComponentManifest(self, files):
+        """Writes the component manifest file.
+
+        Args:
+            files (dict): The manifest entries keyed by module file path.
+
+        """
+
+        manifestPath = self.getComponentManifestPath()
+        if manifestPath is None:
+            return
+
+        try:
+            manifestDir = os.path.dirname(manifestPath)
+            if manifestDir != '' and not os.path.exists(manifestDir):
+                os.makedirs(manifestDir)
+
+            with open(manifestPath, 'w') as manifestFile:
+                json.dump({'version': COMPONENT_MANIFEST_VERSION, 'files': files}, manifestFile, indent=2, sort_keys=True)
+        except (IOError, OSError):
+            logger.warning("Unable to write the component manifest: " + manifestPath)
+
+
+    def _importComponentModule(self, module, filePath):
+        """Imports a component module and returns its manifest entry.
+
+        The module is removed from sys.modules first so that edited modules are
+        re-imported and their classes registered again.
+
+        Args:
+            module (str): The path of the module to import.
+            filePath (str): The path of the module file.
+
+        Returns:
+            dict: The manifest entry of the module, None if the import failed.
+
+        """
+
+        for className in self.registeredComponents.keys():
+            if self.registeredComponents[className].__module__ == module:
+                del self.registeredComponents[className]
+
+        if module in sys.modules:
+            del(sys.modules[module])
+
+        try:
+            logger.info("  " + module)
+            importlib.import_module(module)
+
+        except ImportError, e:
+            logging.exception("Error importing '" + module)
+            return None
+
+        except Exception, e:
+            logging.exception("Error Loading Modules'" + module)
+            return None
+
+        components = {}
+        for className, componentClass in self.registeredComponents.iteritems():
+            if componentClass.__module__ == module:
+                components[className] = componentClass.getComponentType()
+
+        return {
+            'module': module,
+            'mtime': os.path.getmtime(filePath),
+            'components': components
+        }
 
 
     def loadComponentModules(self):
@@ -319,22 +717,20 @@ class KrakenSystem(object):
 
         The kraken_components are loaded at all times.
 
+        The component classes of each module are cached in a manifest keyed by
+        the module file path and modification time. Only new and edited modules
+        are imported, the others are imported when one of their classes is
+        requested with getComponentClass().
+
         Returns:
             bool: True if all components loaded, else False.
 
         """
 
-        for componentClassPath in self.registeredComponents:
-            componentModulePath = self.registeredComponents[componentClassPath].__module__
-            if componentModulePath in sys.modules:
-                del(sys.modules[componentModulePath])
-
-        self.registeredComponents = {}
-
         logger.info("Loading component modules...")
 
-        def __importDirRecursive(path, parentModulePath=''):
-            isSuccessful = True
+        def __findModulesRecursive(path, parentModulePath=''):
+            modules = []
 
             contents = os.listdir(path)
             moduleFilefound = False
@@ -353,8 +749,7 @@ class KrakenSystem(object):
 
 
             if moduleFilefound:
-                logger.info(" " + path + ":")
-                for i, item in enumerate(contents):
+                for item in contents:
                     if os.path.isfile(os.path.join(path, item)):
 
                         # Parse all the files of given path and import python
@@ -366,37 +761,22 @@ class KrakenSystem(object):
                         # component modules.
 
                         if item.endswith(".py") and item != "__init__.py":
-                            module = modulePath + "." + item[:-3]
-                            try:
-                                logger.info("  " + module)
-                                importlib.import_module(module)
-
-                            except ImportError, e:
-                                isSuccessful = False
-                                logging.exception("Error importing '" + module)
-
-                            except Exception, e:
-                                isSuccessful = False
-                                logging.exception("Error Loading Modules'" + module)
-
-                logging.info("")
+                            modules.append((modulePath + "." + item[:-3], os.path.join(path, item)))
 
 
             for item in contents:
                 if os.path.isdir(os.path.join(path, item)):
                     if moduleFilefound:
-                        if not __importDirRecursive(os.path.join(path, item), modulePath):
-                            isSuccessful = False
+                        modules.extend(__findModulesRecursive(os.path.join(path, item), modulePath))
                     else:
-                        if not __importDirRecursive(os.path.join(path, item)):
-                            isSuccessful = False
+                        modules.extend(__findModulesRecursive(os.path.join(path, item)))
 
-            return isSuccessful
+            return modules
 
 
         # find the kraken examples module in the same folder as the kraken module.
         default_component_path = os.path.normpath(os.path.join(os.environ.get('KRAKEN_PATH'), 'Python', 'kraken_components'))
-        isSuccessful = __importDirRecursive(default_component_path)
+        modules = __findModulesRecursive(default_component_path)
 
         pathsVar = os.getenv('KRAKEN_PATHS')
         if pathsVar is not None:
@@ -410,8 +790,32 @@ class KrakenSystem(object):
                     logging.info("Invalid Kraken Path: " + path)
                     continue
 
-                if not __importDirRecursive(path):
+                modules.extend(__findModulesRecursive(path))
+
+        isSuccessful = True
+        manifest = self._readComponentManifest()
+        files = {}
+        componentIndex = OrderedDict()
+        for module, filePath in modules:
+            entry = manifest.get(filePath)
+            if entry is None or entry['module'] != module or entry['mtime'] != os.path.getmtime(filePath):
+                entry = self._importComponentModule(module, filePath)
+                if entry is None:
                     isSuccessful = False
+                    continue
+
+            files[filePath] = entry
+            for className, componentType in entry['components'].iteritems():
+                componentIndex[className] = {
+                    'module': module,
+                    'filePath': filePath,
+                    'type': componentType
+                }
+
+        self.componentIndex = componentIndex
+
+        if files != manifest:
+            self._writeComponentManifest(files)
 
         return isSuccessful
 
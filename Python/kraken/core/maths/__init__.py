@@ -1,6 +1,8 @@
 """Kraken - math module."""
 
 from math_object import MathObject
+from math_object import RTVAL_BACKEND, NATIVE_BACKEND
+from math_object import getMathBackend, setMathBackend, isNativeBackend
 from vec2 import Vec2
 from vec3 import Vec3
 from vec4 import Vec4
@@ -11,6 +13,9 @@ from mat33 import Mat33
 from mat44 import Mat44
 from rotation_order import RotationOrder
 from color import Color
+from vec3_array import Vec3Array
+from quat_array import QuatArray
+from xfo_array import XfoArray
 
 
 PI = 3.141592653589793
@@ -8,7 +8,8 @@ Color -- Color object.
 import random
 import math
 from kraken.core.kraken_system import ks
-from math_object import MathObject
+from math_object import MathObject, isNativeBackend
+import native_math
 
 
 class Color(MathObject):
@@ -18,12 +19,21 @@ class Color(MathObject):
         """Initializes r, g b and a values for Color object."""
 
         super(Color, self).__init__()
-        if ks.getRTValTypeName(r) == 'Color':
-            self._rtval = r
+        if ks.isRTValOfType(r, 'Color'):
+            if isNativeBackend():
+                self._data = [r.r.getSimpleType(), r.g.getSimpleType(),
+                              r.b.getSimpleType(), r.a.getSimpleType()]
+            else:
+                self._rtval = r
+        elif isNativeBackend():
+            if isinstance(r, Color):
+                self._data = list(r._getData())
+            else:
+                self._data = native_math.toFloat32List((r, g, b, a))
         else:
             self._rtval = ks.rtVal('Color')
             if isinstance(r, Color):
-                self.set(r=r.r, g=r.g, b=r.b, a=r.b)
+                self.set(r=r.r, g=r.g, b=r.b, a=r.a)
             else:
 
                 self.set(r=r, g=g, b=b, a=a)
@@ -44,6 +54,35 @@ class Color(MathObject):
         return stringRep
 
 
+    def _getData(self):
+        """Returns the channels of this color.
+
+        Returns:
+            tuple: The r, g, b and a channels.
+
+        """
+
+        if self._rtval is None:
+            return tuple(self._data)
+
+        return (self.r, self.g, self.b, self.a)
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this color.
+
+        Returns:
+            object: Color RTVal.
+
+        """
+
+        rtval = ks.rtVal('Color')
+        rtval.set('', ks.rtVal('Scalar', self._data[0]), ks.rtVal('Scalar', self._data[1]),
+                  ks.rtVal('Scalar', self._data[2]), ks.rtVal('Scalar', self._data[3]))
+
+        return rtval
+
+
     @property
     def r(self):
         """Gets red channel of this color.
@@ -53,6 +92,9 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[0]
+
         return self._rtval.r.getSimpleType()
 
 
@@ -68,7 +110,10 @@ class Color(MathObject):
 
         """
 
-        self._rtval.r = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[0] = native_math.toFloat32(value)
+        else:
+            self._rtval.r = ks.rtVal('Scalar', value)
 
         return True
 
@@ -82,6 +127,9 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[1]
+
         return self._rtval.g.getSimpleType()
 
 
@@ -97,7 +145,10 @@ class Color(MathObject):
 
         """
 
-        self._rtval.g = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[1] = native_math.toFloat32(value)
+        else:
+            self._rtval.g = ks.rtVal('Scalar', value)
 
         return True
 
@@ -111,10 +162,13 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[2]
+
         return self._rtval.b.getSimpleType()
 
 
-    @g.setter
+    @b.setter
     def b(self, value):
         """Sets blue channel from the input channel.
 
@@ -126,7 +180,10 @@ class Color(MathObject):
 
         """
 
-        self._rtval.b = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[2] = native_math.toFloat32(value)
+        else:
+            self._rtval.b = ks.rtVal('Scalar', value)
 
         return True
 
@@ -140,6 +197,9 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[3]
+
         return self._rtval.a.getSimpleType()
 
 
@@ -162,7 +222,7 @@ class Color(MathObject):
         return self.divide(other)
 
 
-    @g.setter
+    @a.setter
     def a(self, value):
         """Sets a channel from the input channel.
 
@@ -174,7 +234,12 @@ class Color(MathObject):
 
         """
 
-        self._rtval.a = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[3] = native_math.toFloat32(value)
+        else:
+            self._rtval.a = ks.rtVal('Scalar', value)
+
+        return True
 
 
     def clone(self):
@@ -185,10 +250,15 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Color(self)
+
         color = Color()
         color.r = self.r
         color.g = self.g
         color.b = self.b
+        color.a = self.a
+
         return color
 
 
@@ -206,6 +276,10 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data = native_math.toFloat32List((r, g, b, a))
+            return True
+
         self._rtval.set('', ks.rtVal('Scalar', r), ks.rtVal('Scalar', g),
                         ks.rtVal('Scalar', b), ks.rtVal('Scalar', a))
 
@@ -223,7 +297,10 @@ class Color(MathObject):
 
         """
 
-        return self._rtval.equal('Boolean', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecEqual(self._data, other._getData())
+
+        return self._rtval.equal('Boolean', other.getRTVal()).getSimpleType()
 
 
     def almostEqual(self, other, precision):
@@ -238,7 +315,10 @@ class Color(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval,
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._data, other._getData(), precision)
+
+        return self._rtval.almostEqual('Boolean', other.getRTVal(),
                                        ks.rtVal('Scalar', precision)).getSimpleType()
 
 
@@ -253,6 +333,9 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[i]
+
         return self._rtval.component('Scalar', ks.rtVal('Size', i)).getSimpleType()
 
 
@@ -268,6 +351,10 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data[i] = native_math.toFloat32(v)
+            return
+
         return self._rtval.setComponent('', ks.rtVal('Size', i),
                                         ks.rtVal('Scalar', v))
 
@@ -284,7 +371,10 @@ class Color(MathObject):
 
         """
 
-        return Color(self._rtval.add('Color', other._rtval))
+        if self._rtval is None:
+            return Color(*native_math.vecAdd(self._data, other._getData()))
+
+        return Color(self._rtval.add('Color', other.getRTVal()))
 
 
     def subtract(self, other):
@@ -298,7 +388,10 @@ class Color(MathObject):
 
         """
 
-        return Color(self._rtval.subtract('Color', other._rtval))
+        if self._rtval is None:
+            return Color(*native_math.vecSubtract(self._data, other._getData()))
+
+        return Color(self._rtval.subtract('Color', other.getRTVal()))
 
 
     def multiply(self, other):
@@ -312,7 +405,10 @@ class Color(MathObject):
 
         """
 
-        return Color(self._rtval.multiply('Color', other._rtval))
+        if self._rtval is None:
+            return Color(*native_math.vecMultiply(self._data, other._getData()))
+
+        return Color(self._rtval.multiply('Color', other.getRTVal()))
 
 
     def divide(self, other):
@@ -326,7 +422,10 @@ class Color(MathObject):
 
         """
 
-        return Color(self._rtval.divide('Color', other._rtval))
+        if self._rtval is None:
+            return Color(*native_math.vecDivide(self._data, other._getData()))
+
+        return Color(self._rtval.divide('Color', other.getRTVal()))
 
 
     def multiplyScalar(self, other):
@@ -340,6 +439,9 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Color(*native_math.vecMultiplyScalar(self._data, other))
+
         return Color(self._rtval.multiplyScalar('Color', ks.rtVal('Scalar', other)))
 
 
@@ -354,6 +456,9 @@ class Color(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Color(*native_math.vecDivideScalar(self._data, other))
+
         return Color(self._rtval.divideScalar('Color', ks.rtVal('Scalar', other)))
 
 
@@ -370,7 +475,10 @@ class Color(MathObject):
 
         """
 
-        return Color(self._rtval.linearInterpolate('Color', ks.rtVal('Color', other), ks.rtVal('Scalar', t)))
+        if self._rtval is None:
+            return Color(*native_math.vecLinearInterpolate(self._data, other._getData(), t))
+
+        return Color(self._rtval.linearInterpolate('Color', other.getRTVal(), ks.rtVal('Scalar', t)))
 
 
     @classmethod
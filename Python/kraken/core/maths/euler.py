@@ -7,7 +7,8 @@ Euler -- Euler rotation.
 import math
 
 from kraken.core.kraken_system import ks
-from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.math_object import MathObject, isNativeBackend
+from kraken.core.maths import native_math
 from kraken.core.maths.mat33 import Mat33
 from kraken.core.maths.rotation_order import RotationOrder
 
@@ -45,8 +46,12 @@ class Euler(MathObject):
 
         super(Euler, self).__init__()
 
-        if ks.getRTValTypeName(x) == 'Euler':
-            self._rtval = x
+        if ks.isRTValOfType(x, 'Euler'):
+            if isNativeBackend():
+                self._data = [x.x.getSimpleType(), x.y.getSimpleType(), x.z.getSimpleType()]
+                self._ro = RotationOrder(x.ro)
+            else:
+                self._rtval = x
         else:
 
             if x is not None and not isinstance(x, (int, float)) and not isinstance(x, Euler):
@@ -65,7 +70,12 @@ class Euler(MathObject):
                 if isinstance(ro, basestring) or isinstance(ro, (int)):
                     ro = RotationOrder(order=ro)
 
-            self._rtval = ks.rtVal('Euler')
+            if isNativeBackend():
+                self._data = [0.0, 0.0, 0.0]
+                self._ro = RotationOrder()
+            else:
+                self._rtval = ks.rtVal('Euler')
+
             if isinstance(x, Euler):
                 self.set(x=x.x, y=x.y, z=x.z, ro=x.ro)
             elif x is not None and y is not None and z is not None:
@@ -81,6 +91,35 @@ class Euler(MathObject):
         return "Euler(x=" + str(self.x) + ", y=" + str(self.y) + ", z=" + str(self.z) + ", ro= '" + str(self.ro) + "')"
 
 
+    def _getData(self):
+        """Returns the angles of this Euler.
+
+        Returns:
+            tuple: The x, y and z angles.
+
+        """
+
+        if self._rtval is None:
+            return tuple(self._data)
+
+        return (self.x, self.y, self.z)
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this Euler.
+
+        Returns:
+            object: Euler RTVal.
+
+        """
+
+        rtval = ks.rtVal('Euler')
+        rtval.set('', ks.rtVal('Scalar', self._data[0]), ks.rtVal('Scalar', self._data[1]),
+                  ks.rtVal('Scalar', self._data[2]), self._ro.getRTVal())
+
+        return rtval
+
+
     @property
     def x(self):
         """X parameter property.
@@ -90,6 +129,9 @@ class Euler(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[0]
+
         return self._rtval.x.getSimpleType()
 
 
@@ -102,7 +144,10 @@ class Euler(MathObject):
 
         """
 
-        self._rtval.x = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[0] = native_math.toFloat32(value)
+        else:
+            self._rtval.x = ks.rtVal('Scalar', value)
 
 
     @property
@@ -114,6 +159,9 @@ class Euler(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[1]
+
         return self._rtval.y.getSimpleType()
 
 
@@ -126,7 +174,10 @@ class Euler(MathObject):
 
         """
 
-        self._rtval.y = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[1] = native_math.toFloat32(value)
+        else:
+            self._rtval.y = ks.rtVal('Scalar', value)
 
 
     @property
@@ -138,6 +189,9 @@ class Euler(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[2]
+
         return self._rtval.z.getSimpleType()
 
 
@@ -150,7 +204,10 @@ class Euler(MathObject):
 
         """
 
-        self._rtval.z = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[2] = native_math.toFloat32(value)
+        else:
+            self._rtval.z = ks.rtVal('Scalar', value)
 
 
     @property
@@ -161,6 +218,9 @@ class Euler(MathObject):
             object: Rotation Order of this Euler.
 
         """
+        if self._rtval is None:
+            return self._ro
+
         return RotationOrder(self._rtval.ro)
 
 
@@ -173,7 +233,10 @@ class Euler(MathObject):
 
         """
 
-        self._rtval.ro = ks.rtVal('RotationOrder', value)
+        if self._rtval is None:
+            self._ro = RotationOrder(value)
+        else:
+            self._rtval.ro = ks.rtVal('RotationOrder', value)
 
 
     def __eq__(self, other):
@@ -191,6 +254,9 @@ class Euler(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Euler(self)
+
         euler = Euler()
         euler.x = self.x
         euler.y = self.y
@@ -215,7 +281,11 @@ class Euler(MathObject):
 
         """
 
-        if ro is None:
+        if self._rtval is None:
+            self._data = native_math.toFloat32List((x, y, z))
+            if ro is not None:
+                self._ro = RotationOrder(ro)
+        elif ro is None:
             self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y), ks.rtVal('Scalar', z))
         else:
             self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y), ks.rtVal('Scalar', z), ks.rtVal('RotationOrder', ro))
@@ -234,6 +304,9 @@ class Euler(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.vecEqual(self._data, other._getData()) and self.ro == other.ro
+
         return self._rtval.equal('Boolean', ks.rtVal('Euler', other)).getSimpleType()
 
 
@@ -249,7 +322,10 @@ class Euler(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', ks.rtVal('Euler', other), ks.rtVal('Scalar', precision))
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._data, other._getData(), precision) and self.ro == other.ro
+
+        return self._rtval.almostEqual('Boolean', ks.rtVal('Euler', other), ks.rtVal('Scalar', precision)).getSimpleType()
 
 
     def toMat33(self):
@@ -260,4 +336,9 @@ class Euler(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat33 = Mat33()
+            mat33._setData(native_math.eulerToMat33(self._data, self._ro.order))
+            return mat33
+
         return Mat33(self._rtval.toMat33('Mat33'))
@@ -5,7 +5,8 @@ Mat33 -- Matrix 3 transform object.
 """
 
 from kraken.core.kraken_system import ks
-from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.math_object import MathObject, isNativeBackend
+from kraken.core.maths import native_math
 from kraken.core.maths.vec3 import Vec3
 
 
@@ -17,10 +18,21 @@ class Mat33(MathObject):
 
         super(Mat33, self).__init__()
 
-        if ks.getRTValTypeName(row0) == 'Mat33':
-            self._rtval = row0
+        if ks.isRTValOfType(row0, 'Mat33'):
+            if isNativeBackend():
+                self._row0 = Vec3(row0.row0)
+                self._row1 = Vec3(row0.row1)
+                self._row2 = Vec3(row0.row2)
+            else:
+                self._rtval = row0
         else:
-            self._rtval = ks.rtVal('Mat33')
+            if isNativeBackend():
+                self._row0 = Vec3(1.0, 0.0, 0.0)
+                self._row1 = Vec3(0.0, 1.0, 0.0)
+                self._row2 = Vec3(0.0, 0.0, 1.0)
+            else:
+                self._rtval = ks.rtVal('Mat33')
+
             if isinstance(row0, Mat33):
                 self.setRows(row0=row0.row0, row1=row0.row1, row2=row0.row2)
             elif row0 is not None and row1 is not None and row2 is not None:
@@ -33,6 +45,49 @@ class Mat33(MathObject):
         return "Mat33(" + str(self.row0) + "," + str(self.row1) + "," + str(self.row2) + ")"
 
 
+    def _getData(self):
+        """Returns the components of this matrix.
+
+        Returns:
+            tuple: The 9 components of the matrix, row by row.
+
+        """
+
+        return self.row0._getData() + self.row1._getData() + self.row2._getData()
+
+
+    def _setData(self, values):
+        """Sets the components of a native matrix.
+
+        Args:
+            values (tuple): The 9 components of the matrix, row by row.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.set(values[0], values[1], values[2])
+        self._row1.set(values[3], values[4], values[5])
+        self._row2.set(values[6], values[7], values[8])
+
+        return True
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this matrix.
+
+        Returns:
+            object: Mat33 RTVal.
+
+        """
+
+        rtval = ks.rtVal('Mat33')
+        rtval.setRows('', self._row0.getRTVal(), self._row1.getRTVal(), self._row2.getRTVal())
+
+        return rtval
+
+
     @property
     def row0(self):
         """Gets row 0 of this matrix.
@@ -42,6 +97,9 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._row0
+
         return Vec3(self._rtval.row0)
 
 
@@ -57,7 +115,10 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.row0 = ks.rtVal('Vec3', value)
+        if self._rtval is None:
+            self._row0.set(*value._getData())
+        else:
+            self._rtval.row0 = ks.rtVal('Vec3', value)
 
         return True
 
@@ -71,6 +132,9 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._row1
+
         return Vec3(self._rtval.row1)
 
 
@@ -86,7 +150,10 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.row1 = ks.rtVal('Vec3', value)
+        if self._rtval is None:
+            self._row1.set(*value._getData())
+        else:
+            self._rtval.row1 = ks.rtVal('Vec3', value)
 
         return True
 
@@ -100,6 +167,9 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._row2
+
         return Vec3(self._rtval.row2)
 
 
@@ -115,7 +185,10 @@ class Mat33(MathObject):
 
         """
 
-        self._rtval.row2 = ks.rtVal('Vec3', value)
+        if self._rtval is None:
+            self._row2.set(*value._getData())
+        else:
+            self._rtval.row2 = ks.rtVal('Vec3', value)
 
         return True
 
@@ -144,6 +217,9 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Mat33(self)
+
         mat33 = Mat33()
         mat33.row0 = self.row0.clone()
         mat33.row1 = self.row1.clone()
@@ -165,6 +241,10 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(row0._getData() + row1._getData() + row2._getData())
+            return True
+
         self._rtval.setRows('', ks.rtVal('Vec3', row0), ks.rtVal('Vec3', row1), ks.rtVal('Vec3', row2))
 
         return True
@@ -183,6 +263,10 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.mat33FromColumns(col0._getData(), col1._getData(), col2._getData()))
+            return True
+
         self._rtval.setColumns('', ks.rtVal('Vec3', col0), ks.rtVal('Vec3', col1), ks.rtVal('Vec3', col2))
 
         return True
@@ -196,6 +280,10 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData((0.0,) * 9)
+            return True
+
         self._rtval.setNull('')
 
         return True
@@ -209,6 +297,10 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.IDENTITY_MAT33)
+            return True
+
         self._rtval.setIdentity('')
 
         return True
@@ -225,6 +317,10 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.mat33SetDiagonal(self._getData(), (v, v, v)))
+            return True
+
         self._rtval.setDiagonal('', ks.rtVal('Scalar', v))
 
         return True
@@ -242,6 +338,10 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.mat33SetDiagonal(self._getData(), v._getData()))
+            return True
+
         self._rtval.setDiagonal('', ks.rtVal('Vec3', v))
 
         return True
@@ -258,6 +358,9 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.vecEqual(self._getData(), other._getData())
+
         return self._rtval.equal('Boolean', ks.rtVal('Mat33', other)).getSimpleType()
 
 
@@ -272,6 +375,12 @@ class Mat33(MathObject):
             bool: True if almost equal.
 
         """
+        if self._rtval is None:
+            if precision is not None:
+                return native_math.vecAlmostEqual(self._getData(), other._getData(), precision)
+            else:
+                return native_math.vecAlmostEqual(self._getData(), other._getData())
+
         if precision is not None:
             return self._rtval.almostEqual('Boolean', ks.rtVal('Mat33', other), ks.rtVal('Scalar', precision)).getSimpleType()
         else:
@@ -289,6 +398,11 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.vecAdd(self._getData(), other._getData()))
+            return mat
+
         return Mat33(self._rtval.add('Mat33', ks.rtVal('Mat33', other)))
 
 
@@ -303,6 +417,11 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.vecSubtract(self._getData(), other._getData()))
+            return mat
+
         return Mat33(self._rtval.subtract('Mat33', ks.rtVal('Mat33', other)))
 
 
@@ -317,6 +436,11 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.mat33Multiply(self._getData(), other._getData()))
+            return mat
+
         return Mat33(self._rtval.multiply('Mat33', ks.rtVal('Mat33', other)))
 
 
@@ -331,6 +455,11 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.vecMultiplyScalar(self._getData(), other))
+            return mat
+
         return Mat33(self._rtval.multiplyScalar('Mat33', ks.rtVal('Scalar', other)))
 
 
@@ -345,6 +474,9 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.mat33MultiplyVector(self._getData(), other._getData()))
+
         return Vec3(self._rtval.multiplyVector('Vec3', ks.rtVal('Vec3', other)))
 
 
@@ -359,7 +491,12 @@ class Mat33(MathObject):
 
         """
 
-        return Mat33(self._rtval.divideScalar('Mat33', other))
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.vecDivideScalar(self._getData(), other))
+            return mat
+
+        return Mat33(self._rtval.divideScalar('Mat33', ks.rtVal('Scalar', other)))
 
 
     def determinant(self):
@@ -370,6 +507,9 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.mat33Determinant(self._getData()))
+
         return self._rtval.determinant('Scalar').getSimpleType()
 
 
@@ -381,6 +521,11 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.mat33Adjoint(self._getData()))
+            return mat
+
         return Mat33(self._rtval.adjoint('Mat33'))
 
 
@@ -392,6 +537,11 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.mat33Inverse(self._getData()))
+            return mat
+
         return Mat33(self._rtval.inverse('Mat33'))
 
 
@@ -404,6 +554,11 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.mat33InverseSafe(self._getData()))
+            return mat
+
         return Mat33(self._rtval.inverse_safe('Mat33'))
 
 
@@ -415,4 +570,9 @@ class Mat33(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.mat33Transpose(self._getData()))
+            return mat
+
         return Mat33(self._rtval.transpose('Mat33'))
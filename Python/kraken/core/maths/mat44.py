@@ -4,7 +4,8 @@ Classes:
 Mat44 -- Matrix 3 transform object.
 """
 
-from math_object import MathObject
+from math_object import MathObject, isNativeBackend
+import native_math
 from kraken.core.kraken_system import ks
 from vec import Vec3, Vec4
 from mat33 import Mat33
@@ -18,11 +19,24 @@ class Mat44(MathObject):
 
         super(Mat44, self).__init__()
 
-        if ks.getRTValTypeName(row0) == 'Mat44':
-            self._rtval = row0
+        if ks.isRTValOfType(row0, 'Mat44'):
+            if isNativeBackend():
+                self._row0 = Vec4(row0.row0)
+                self._row1 = Vec4(row0.row1)
+                self._row2 = Vec4(row0.row2)
+                self._row3 = Vec4(row0.row3)
+            else:
+                self._rtval = row0
         else:
-            self._rtval = ks.rtVal('Mat44')
-            if isinstance(row0, Mat33):
+            if isNativeBackend():
+                self._row0 = Vec4(1.0, 0.0, 0.0, 0.0)
+                self._row1 = Vec4(0.0, 1.0, 0.0, 0.0)
+                self._row2 = Vec4(0.0, 0.0, 1.0, 0.0)
+                self._row3 = Vec4(0.0, 0.0, 0.0, 1.0)
+            else:
+                self._rtval = ks.rtVal('Mat44')
+
+            if isinstance(row0, Mat44):
                 self.setRows(row0=row0.row0, row1=row0.row1, row2=row0.row2, row3=row0.row3)
             elif row0 is not None and row1 is not None and row2 is not None and row3 is not None:
                 self.setRows(row0, row1, row2, row3)
@@ -45,6 +59,52 @@ class Mat44(MathObject):
         return stringRep
 
 
+    def _getData(self):
+        """Returns the components of this matrix.
+
+        Returns:
+            tuple: The 16 components of the matrix, row by row.
+
+        """
+
+        return (self.row0._getData() + self.row1._getData() +
+                self.row2._getData() + self.row3._getData())
+
+
+    def _setData(self, values):
+        """Sets the components of a native matrix.
+
+        Args:
+            values (tuple): The 16 components of the matrix, row by row.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._row0.set(values[0], values[1], values[2], values[3])
+        self._row1.set(values[4], values[5], values[6], values[7])
+        self._row2.set(values[8], values[9], values[10], values[11])
+        self._row3.set(values[12], values[13], values[14], values[15])
+
+        return True
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this matrix.
+
+        Returns:
+            object: Mat44 RTVal.
+
+        """
+
+        rtval = ks.rtVal('Mat44')
+        rtval.setRows('', self._row0.getRTVal(), self._row1.getRTVal(),
+                      self._row2.getRTVal(), self._row3.getRTVal())
+
+        return rtval
+
+
     @property
     def row0(self):
         """Gets row 0 of this matrix.
@@ -54,6 +114,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._row0
+
         return Vec4(self._rtval.row0)
 
 
@@ -69,7 +132,10 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.row0 = ks.rtVal('Vec4', value)
+        if self._rtval is None:
+            self._row0.set(*value._getData())
+        else:
+            self._rtval.row0 = ks.rtVal('Vec4', value)
 
         return True
 
@@ -83,6 +149,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._row1
+
         return Vec4(self._rtval.row1)
 
 
@@ -98,7 +167,10 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.row1 = ks.rtVal('Vec4', value)
+        if self._rtval is None:
+            self._row1.set(*value._getData())
+        else:
+            self._rtval.row1 = ks.rtVal('Vec4', value)
 
         return True
 
@@ -112,6 +184,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._row2
+
         return Vec4(self._rtval.row2)
 
 
@@ -127,7 +202,10 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.row2 = ks.rtVal('Vec4', value)
+        if self._rtval is None:
+            self._row2.set(*value._getData())
+        else:
+            self._rtval.row2 = ks.rtVal('Vec4', value)
 
         return True
 
@@ -141,6 +219,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._row3
+
         return Vec4(self._rtval.row3)
 
 
@@ -156,7 +237,10 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.row3 = ks.rtVal('Vec4', value)
+        if self._rtval is None:
+            self._row3.set(*value._getData())
+        else:
+            self._rtval.row3 = ks.rtVal('Vec4', value)
 
         return True
 
@@ -185,6 +269,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Mat44(self)
+
         mat44 = Mat44()
         mat44.row0 = self.row0.clone()
         mat44.row1 = self.row1.clone()
@@ -208,7 +295,11 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setRows('', ks.rtVal('Vec4', row0), ks.rtVal('Vec4', row0),
+        if self._rtval is None:
+            self._setData(row0._getData() + row1._getData() + row2._getData() + row3._getData())
+            return True
+
+        self._rtval.setRows('', ks.rtVal('Vec4', row0), ks.rtVal('Vec4', row1),
                             ks.rtVal('Vec4', row2), ks.rtVal('Vec4', row3))
 
         return True
@@ -228,7 +319,11 @@ class Mat44(MathObject):
 
         """
 
-        self._rtval.setColumns('', ks.rtVal('Vec4', col0), ks.rtVal('Vec4', col0),
+        if self._rtval is None:
+            self._setData(native_math.mat44Transpose(col0._getData() + col1._getData() + col2._getData() + col3._getData()))
+            return True
+
+        self._rtval.setColumns('', ks.rtVal('Vec4', col0), ks.rtVal('Vec4', col1),
                                ks.rtVal('Vec4', col2), ks.rtVal('Vec4', col3))
 
         return True
@@ -242,6 +337,10 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData((0.0,) * 16)
+            return True
+
         self._rtval.setNull('')
 
         return True
@@ -255,6 +354,10 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.IDENTITY_MAT44)
+            return True
+
         self._rtval.setIdentity('')
 
         return True
@@ -271,6 +374,10 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.mat44SetDiagonal(self._getData(), (v, v, v, v)))
+            return True
+
         self._rtval.setDiagonal('', ks.rtVal('Scalar', v))
 
         return True
@@ -288,6 +395,10 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.mat44SetDiagonal(self._getData(), v._getData()))
+            return True
+
         self._rtval.setDiagonal('', ks.rtVal('Vec3', v))
 
         return True
@@ -304,6 +415,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.vecEqual(self._getData(), other._getData())
+
         return self._rtval.equal('Boolean', ks.rtVal('Mat44', other)).getSimpleType()
 
 
@@ -319,6 +433,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._getData(), other._getData(), precision)
+
         return self._rtval.almostEqual('Boolean', ks.rtVal('Mat44', other),
                                        ks.rtVal('Scalar', precision)).getSimpleType()
 
@@ -335,6 +452,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._getData(), other._getData())
+
         return self._rtval.almostEqual('Boolean', ks.rtVal('Mat44', other)).getSimpleType()
 
 
@@ -349,6 +469,11 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.vecAdd(self._getData(), other._getData()))
+            return mat
+
         return Mat44(self._rtval.add('Mat44', ks.rtVal('Mat44', other)))
 
 
@@ -363,6 +488,11 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.vecSubtract(self._getData(), other._getData()))
+            return mat
+
         return Mat44(self._rtval.subtract('Mat44', ks.rtVal('Mat44', other)))
 
 
@@ -377,6 +507,11 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.mat44Multiply(self._getData(), other._getData()))
+            return mat
+
         return Mat44(self._rtval.multiply('Mat44', ks.rtVal('Mat44', other)))
 
 
@@ -391,6 +526,11 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.vecMultiplyScalar(self._getData(), other))
+            return mat
+
         return Mat44(self._rtval.multiplyScalar('Mat44', ks.rtVal('Scalar', other)))
 
 
@@ -405,6 +545,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.mat44MultiplyVector(self._getData(), other._getData()))
+
         return Vec3(self._rtval.multiplyVector('Vec3', ks.rtVal('Vec3', other)))
 
 
@@ -419,7 +562,12 @@ class Mat44(MathObject):
 
         """
 
-        return Mat44(self._rtval.divideScalar('Mat44', other))
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.vecDivideScalar(self._getData(), other))
+            return mat
+
+        return Mat44(self._rtval.divideScalar('Mat44', ks.rtVal('Scalar', other)))
 
 
     def determinant(self):
@@ -430,6 +578,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.mat44Determinant(self._getData()))
+
         return self._rtval.determinant('Scalar').getSimpleType()
 
 
@@ -441,6 +592,11 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.mat44Adjoint(self._getData()))
+            return mat
+
         return Mat44(self._rtval.adjoint('Mat44'))
 
 
@@ -452,6 +608,11 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.mat44Inverse(self._getData()))
+            return mat
+
         return Mat44(self._rtval.inverse('Mat44'))
 
 
@@ -464,6 +625,11 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.mat44InverseSafe(self._getData()))
+            return mat
+
         return Mat44(self._rtval.inverse_safe('Mat44'))
 
 
@@ -475,4 +641,9 @@ class Mat44(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.mat44Transpose(self._getData()))
+            return mat
+
         return Mat44(self._rtval.transpose('Mat44'))
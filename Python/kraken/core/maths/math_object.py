@@ -4,8 +4,61 @@ Classes:
 MathObject -- A base class for all math types.
 """
 
+import os
 import json
-import FabricEngine.Core
+
+
+RTVAL_BACKEND = 'rtval'
+NATIVE_BACKEND = 'native'
+
+_mathBackend = os.environ.get('KRAKEN_MATH_BACKEND', RTVAL_BACKEND)
+
+
+def getMathBackend():
+    """Returns the name of the backend used by newly constructed math objects.
+
+    Returns:
+        str: Either 'rtval' or 'native'.
+
+    """
+
+    return _mathBackend
+
+
+def setMathBackend(backend):
+    """Sets the backend used by newly constructed math objects.
+
+    The 'rtval' backend wraps a Fabric Engine RTVal in every math object. The
+    'native' backend stores the values as Python floats and only constructs an
+    RTVal when getRTVal() is called. The initial backend is read from the
+    'KRAKEN_MATH_BACKEND' environment variable.
+
+    Note:
+        Math objects keep the backend they were constructed with, so the
+        backend should be set before any rig or guide is constructed.
+
+    Args:
+        backend (str): Either 'rtval' or 'native'.
+
+    """
+
+    global _mathBackend
+
+    if backend not in (RTVAL_BACKEND, NATIVE_BACKEND):
+        raise ValueError("Invalid math backend: '" + str(backend) + "'")
+
+    _mathBackend = backend
+
+
+def isNativeBackend():
+    """Returns whether newly constructed math objects use the native backend.
+
+    Returns:
+        bool: True if the native backend is in use.
+
+    """
+
+    return _mathBackend == NATIVE_BACKEND
 
 
 class MathObject(object):
@@ -18,14 +71,32 @@ class MathObject(object):
         self._rtval = None
 
 
+    def isNative(self):
+        """Returns whether this math object stores its values natively instead
+        of in an RTVal.
+
+        Returns:
+            bool: True if the values are stored natively.
+
+        """
+
+        return self._rtval is None
+
+
     def getRTVal(self):
         """Returns the internal RTVal object owned by the math object.
 
+        Native math objects construct a new RTVal from their values on each call
+        so changes made to the returned RTVal are not reflected on the object.
+
         Returns:
             object: RTVal
 
         """
 
+        if self._rtval is None:
+            return self._buildRTVal()
+
         return self._rtval
 
 
@@ -40,6 +111,17 @@ class MathObject(object):
         self._rtval = rtval
 
 
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the values of a native math object.
+
+        Returns:
+            object: RTVal
+
+        """
+
+        raise NotImplementedError(self.__class__.__name__ + " does not support the native backend.")
+
+
     def jsonEncode(self):
         """Encodes object to JSON.
 
@@ -88,5 +170,3 @@ class MathObject(object):
                 setattr(self, key, value)
 
         return True
-
-
@@ -0,0 +1,1534 @@
+"""Kraken - maths.native_math module.
+
+Pure Python implementations of the Fabric Engine Math extension functions used
+by the native math backend.
+
+Values are passed around as plain sequences:
+    vec2, vec3, vec4, color -- (x, y, ...) components.
+    quat -- (x, y, z, w), the vector part followed by the scalar part.
+    mat33 -- 9 components, row-major.
+    mat44 -- 16 components, row-major.
+    xfo -- (tr, ori, sc) where tr and sc are vec3's and ori is a quat.
+
+All functions return tuples and never modify their arguments.
+
+"""
+
+import math
+import struct
+
+
+PRECISION = 1.0e-5
+DIVIDEPRECISION = 1.0e-6
+
+ROTATION_ORDER_AXES = [
+    (0, 1, 2),  # XYZ
+    (1, 2, 0),  # YZX
+    (2, 0, 1),  # ZXY
+    (0, 2, 1),  # XZY
+    (2, 1, 0),  # ZYX
+    (1, 0, 2)   # YXZ
+]
+
+IDENTITY_QUAT = (0.0, 0.0, 0.0, 1.0)
+IDENTITY_MAT33 = (1.0, 0.0, 0.0,
+                  0.0, 1.0, 0.0,
+                  0.0, 0.0, 1.0)
+IDENTITY_MAT44 = (1.0, 0.0, 0.0, 0.0,
+                  0.0, 1.0, 0.0, 0.0,
+                  0.0, 0.0, 1.0, 0.0,
+                  0.0, 0.0, 0.0, 1.0)
+
+_float32Structs = {}
+
+
+# ========
+# Scalars
+# ========
+def toFloat32(value):
+    """Rounds a Python float to the precision of a KL Scalar (Float32).
+
+    Args:
+        value (float): Value to round.
+
+    Returns:
+        float: The rounded value.
+
+    """
+
+    try:
+        return struct.unpack('f', struct.pack('f', value))[0]
+    except OverflowError:
+        return math.copysign(float('inf'), value)
+
+
+def toFloat32List(values):
+    """Rounds a sequence of values to the precision of a KL Scalar (Float32).
+
+    Args:
+        values (list): Values to round.
+
+    Returns:
+        list: The rounded values.
+
+    """
+
+    count = len(values)
+    packer = _float32Structs.get(count)
+    if packer is None:
+        packer = struct.Struct(str(count) + 'f')
+        _float32Structs[count] = packer
+
+    try:
+        return list(packer.unpack(packer.pack(*values)))
+    except OverflowError:
+        return [toFloat32(x) for x in values]
+
+
+def divide(a, b):
+    """Divides two scalars following the IEEE rules used by KL for a zero
+    divisor instead of raising an exception.
+
+    Args:
+        a (float): Dividend.
+        b (float): Divisor.
+
+    Returns:
+        float: The quotient.
+
+    """
+
+    if b == 0.0:
+        if a == 0.0 or a != a:
+            return float('nan')
+
+        return math.copysign(float('inf'), a) * math.copysign(1.0, b)
+
+    return a / b
+
+
+def clamp(value, minValue, maxValue):
+    """Clamps a scalar between a min and a max value.
+
+    Args:
+        value (float): Value to clamp.
+        minValue (float): Minimum value.
+        maxValue (float): Maximum value.
+
+    Returns:
+        float: The clamped value.
+
+    """
+
+    return max(minValue, min(maxValue, value))
+
+
+# ========
+# Storage
+# ========
+class SequenceView(object):
+    """A fixed size window in to a list of floats.
+
+    Native math objects use a SequenceView as their storage to share values
+    with the math arrays without copying them.
+
+    """
+
+    __slots__ = ('values', 'offset', 'size')
+
+    def __init__(self, values, offset, size):
+        """Initializes the view.
+
+        Args:
+            values (list): List of floats to view in to.
+            offset (int): Index of the first viewed value.
+            size (int): Number of viewed values.
+
+        """
+
+        if isinstance(values, SequenceView):
+            offset += values.offset
+            values = values.values
+
+        self.values = values
+        self.offset = offset
+        self.size = size
+
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return iter(self.values[self.offset:self.offset + self.size])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in xrange(*index.indices(self.size))]
+
+        if index < 0:
+            index += self.size
+
+        if index < 0 or index >= self.size:
+            raise IndexError("SequenceView index out of range")
+
+        return self.values[self.offset + index]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            indices = xrange(*index.indices(self.size))
+            value = list(value)
+            if len(value) != len(indices):
+                raise ValueError("SequenceView cannot be resized")
+
+            for i, item in zip(indices, value):
+                self.values[self.offset + i] = item
+
+            return
+
+        if index < 0:
+            index += self.size
+
+        if index < 0 or index >= self.size:
+            raise IndexError("SequenceView index out of range")
+
+        self.values[self.offset + index] = value
+
+
+# ==================
+# Generic Vectors
+# ==================
+def vecAdd(a, b):
+    """Returns the component-wise sum of two vectors.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Second vector.
+
+    Returns:
+        tuple: The sum.
+
+    """
+
+    return tuple([x + y for x, y in zip(a, b)])
+
+
+def vecSubtract(a, b):
+    """Returns the component-wise difference of two vectors.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Vector to subtract.
+
+    Returns:
+        tuple: The difference.
+
+    """
+
+    return tuple([x - y for x, y in zip(a, b)])
+
+
+def vecMultiply(a, b):
+    """Returns the component-wise product of two vectors.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Second vector.
+
+    Returns:
+        tuple: The product.
+
+    """
+
+    return tuple([x * y for x, y in zip(a, b)])
+
+
+def vecDivide(a, b):
+    """Returns the component-wise quotient of two vectors.
+
+    Args:
+        a (tuple): Dividend vector.
+        b (tuple): Divisor vector.
+
+    Returns:
+        tuple: The quotient.
+
+    """
+
+    return tuple([divide(x, y) for x, y in zip(a, b)])
+
+
+def vecMultiplyScalar(a, s):
+    """Returns the product of a vector and a scalar.
+
+    Args:
+        a (tuple): Vector to scale.
+        s (float): Scalar to multiply by.
+
+    Returns:
+        tuple: The scaled vector.
+
+    """
+
+    return tuple([x * s for x in a])
+
+
+def vecDivideScalar(a, s):
+    """Returns the quotient of a vector and a scalar.
+
+    Args:
+        a (tuple): Vector to divide.
+        s (float): Scalar to divide by.
+
+    Returns:
+        tuple: The divided vector.
+
+    """
+
+    return tuple([x / s for x in a])
+
+
+def vecNegate(a):
+    """Returns the negated vector.
+
+    Args:
+        a (tuple): Vector to negate.
+
+    Returns:
+        tuple: The negated vector.
+
+    """
+
+    return tuple([-x for x in a])
+
+
+def vecInverse(a):
+    """Returns the component-wise inverse (1.0 / x) of a vector.
+
+    Args:
+        a (tuple): Vector to invert.
+
+    Returns:
+        tuple: The inverted vector.
+
+    """
+
+    return tuple([1.0 / x for x in a])
+
+
+def vecDot(a, b):
+    """Returns the dot product of two vectors.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Second vector.
+
+    Returns:
+        float: The dot product.
+
+    """
+
+    return sum([x * y for x, y in zip(a, b)])
+
+
+def vecLengthSquared(a):
+    """Returns the squared length of a vector.
+
+    Args:
+        a (tuple): Vector to measure.
+
+    Returns:
+        float: The squared length.
+
+    """
+
+    return sum([x * x for x in a])
+
+
+def vecLength(a):
+    """Returns the length of a vector.
+
+    Args:
+        a (tuple): Vector to measure.
+
+    Returns:
+        float: The length.
+
+    """
+
+    return math.sqrt(vecLengthSquared(a))
+
+
+def vecUnit(a):
+    """Returns the unit vector of a, raising an error for zero length vectors.
+
+    Args:
+        a (tuple): Vector to normalize.
+
+    Returns:
+        tuple: The unit vector.
+
+    """
+
+    length = vecLength(a)
+    if length < DIVIDEPRECISION:
+        raise ZeroDivisionError("Vector has zero length and cannot be made unit: " + str(a))
+
+    return vecDivideScalar(a, length)
+
+
+def vecUnitSafe(a):
+    """Returns the unit vector of a, or a null vector for zero length vectors.
+
+    Args:
+        a (tuple): Vector to normalize.
+
+    Returns:
+        tuple: The unit vector.
+
+    """
+
+    length = vecLength(a)
+    if length < DIVIDEPRECISION:
+        return tuple([0.0 for x in a])
+
+    return vecDivideScalar(a, length)
+
+
+def vecClamp(a, minValues, maxValues):
+    """Clamps a vector per component by a min and max vector.
+
+    Args:
+        a (tuple): Vector to clamp.
+        minValues (tuple): Minimum values.
+        maxValues (tuple): Maximum values.
+
+    Returns:
+        tuple: The clamped vector.
+
+    """
+
+    return tuple([clamp(x, lo, hi) for x, lo, hi in zip(a, minValues, maxValues)])
+
+
+def vecUnitsAngleTo(a, b):
+    """Returns the angle (in radians) between two unit vectors.
+
+    Args:
+        a (tuple): First unit vector.
+        b (tuple): Second unit vector.
+
+    Returns:
+        float: The angle.
+
+    """
+
+    return math.acos(clamp(vecDot(a, b), -1.0, 1.0))
+
+
+def vecAngleTo(a, b):
+    """Returns the angle (in radians) between two vectors.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Second vector.
+
+    Returns:
+        float: The angle.
+
+    """
+
+    return vecUnitsAngleTo(vecUnitSafe(a), vecUnitSafe(b))
+
+
+def vecDistanceTo(a, b):
+    """Returns the distance between two points.
+
+    Args:
+        a (tuple): First point.
+        b (tuple): Second point.
+
+    Returns:
+        float: The distance.
+
+    """
+
+    return vecLength(vecSubtract(a, b))
+
+
+def vecLinearInterpolate(a, b, t):
+    """Linearly interpolates between two vectors.
+
+    Args:
+        a (tuple): Vector to blend from.
+        b (tuple): Vector to blend to.
+        t (float): Blend value.
+
+    Returns:
+        tuple: The blended vector.
+
+    """
+
+    return tuple([x + ((y - x) * t) for x, y in zip(a, b)])
+
+
+def vecDistanceToLine(a, lineP0, lineP1):
+    """Returns the distance of a point to a line defined by two points.
+
+    Args:
+        a (tuple): The point.
+        lineP0 (tuple): First point of the line.
+        lineP1 (tuple): Second point of the line.
+
+    Returns:
+        float: The distance.
+
+    """
+
+    v = vecSubtract(lineP1, lineP0)
+    w = vecSubtract(a, lineP0)
+    c2 = vecDot(v, v)
+    if c2 < DIVIDEPRECISION:
+        return vecDistanceTo(a, lineP0)
+
+    b = vecDot(w, v) / c2
+    return vecDistanceTo(a, vecAdd(lineP0, vecMultiplyScalar(v, b)))
+
+
+def vecDistanceToSegment(a, segmentP0, segmentP1):
+    """Returns the distance of a point to a line segment.
+
+    Args:
+        a (tuple): The point.
+        segmentP0 (tuple): Start point of the segment.
+        segmentP1 (tuple): End point of the segment.
+
+    Returns:
+        float: The distance.
+
+    """
+
+    v = vecSubtract(segmentP1, segmentP0)
+    w = vecSubtract(a, segmentP0)
+    c1 = vecDot(w, v)
+    if c1 <= 0.0:
+        return vecDistanceTo(a, segmentP0)
+
+    c2 = vecDot(v, v)
+    if c2 <= c1:
+        return vecDistanceTo(a, segmentP1)
+
+    return vecDistanceTo(a, vecAdd(segmentP0, vecMultiplyScalar(v, c1 / c2)))
+
+
+def vecEqual(a, b):
+    """Checks the exact equality of two vectors.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Second vector.
+
+    Returns:
+        bool: True if equal.
+
+    """
+
+    return tuple(a) == tuple(b)
+
+
+def vecAlmostEqual(a, b, precision=PRECISION):
+    """Checks the equality of two vectors within a precision.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Second vector.
+        precision (float): Precision value.
+
+    Returns:
+        bool: True if almost equal.
+
+    """
+
+    for x, y in zip(a, b):
+        if abs(x - y) >= precision:
+            return False
+
+    return True
+
+
+def vec2Cross(a, b):
+    """Returns the 2D cross product of two Vec2's.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Second vector.
+
+    Returns:
+        float: The cross product.
+
+    """
+
+    return a[0] * b[1] - a[1] * b[0]
+
+
+def vec3Cross(a, b):
+    """Returns the cross product of two Vec3's.
+
+    Args:
+        a (tuple): First vector.
+        b (tuple): Second vector.
+
+    Returns:
+        tuple: The cross product.
+
+    """
+
+    return (a[1] * b[2] - a[2] * b[1],
+            a[2] * b[0] - a[0] * b[2],
+            a[0] * b[1] - a[1] * b[0])
+
+
+# ============
+# Quaternions
+# ============
+def quatMultiply(a, b):
+    """Returns the product of two quaternions.
+
+    Args:
+        a (tuple): First quaternion.
+        b (tuple): Second quaternion.
+
+    Returns:
+        tuple: The product.
+
+    """
+
+    ax, ay, az, aw = a
+    bx, by, bz, bw = b
+    return (aw * bx + bw * ax + ay * bz - az * by,
+            aw * by + bw * ay + az * bx - ax * bz,
+            aw * bz + bw * az + ax * by - ay * bx,
+            aw * bw - ax * bx - ay * by - az * bz)
+
+
+def quatConjugate(q):
+    """Returns the conjugate of a quaternion.
+
+    Args:
+        q (tuple): Quaternion to conjugate.
+
+    Returns:
+        tuple: The conjugate.
+
+    """
+
+    return (-q[0], -q[1], -q[2], q[3])
+
+
+def quatDivide(a, b):
+    """Divides a quaternion by another (a * b.conjugate()).
+
+    Args:
+        a (tuple): Dividend quaternion.
+        b (tuple): Divisor quaternion.
+
+    Returns:
+        tuple: The quotient.
+
+    """
+
+    return quatMultiply(a, quatConjugate(b))
+
+
+def quatInverse(q):
+    """Returns the inverse of a quaternion.
+
+    Args:
+        q (tuple): Quaternion to invert.
+
+    Returns:
+        tuple: The inverse.
+
+    """
+
+    lengthSquared = vecLengthSquared(q)
+    if lengthSquared < DIVIDEPRECISION:
+        raise ZeroDivisionError("Quaternion has zero length and cannot be inverted: " + str(q))
+
+    return vecDivideScalar(quatConjugate(q), lengthSquared)
+
+
+def quatRotateVector(q, v):
+    """Rotates a vector by the quaternion (q * v * q.conjugate()).
+
+    Args:
+        q (tuple): Quaternion to rotate by.
+        v (tuple): Vector to rotate.
+
+    Returns:
+        tuple: The rotated vector.
+
+    """
+
+    qx, qy, qz, qw = q
+    vx, vy, vz = v
+
+    # q * Quat(v, 0.0)
+    px = qw * vx + qy * vz - qz * vy
+    py = qw * vy + qz * vx - qx * vz
+    pz = qw * vz + qx * vy - qy * vx
+    pw = -qx * vx - qy * vy - qz * vz
+
+    # ... * q.conjugate()
+    return (-pw * qx + qw * px - py * qz + pz * qy,
+            -pw * qy + qw * py - pz * qx + px * qz,
+            -pw * qz + qw * pz - px * qy + py * qx)
+
+
+def quatAlignWith(q, other):
+    """Flips a quaternion so it lies on the same hemisphere as another.
+
+    Args:
+        q (tuple): Quaternion to align.
+        other (tuple): Quaternion to align with.
+
+    Returns:
+        tuple: The aligned quaternion.
+
+    """
+
+    if vecDot(q, other) < 0.0:
+        return vecNegate(q)
+
+    return tuple(q)
+
+
+def quatSphericalLinearInterpolate(a, b, t):
+    """Spherically interpolates (slerp) between two unit quaternions.
+
+    Args:
+        a (tuple): Quaternion to blend from.
+        b (tuple): Quaternion to blend to.
+        t (float): Blend value.
+
+    Returns:
+        tuple: The blended quaternion.
+
+    """
+
+    b = quatAlignWith(b, a)
+    cosAngle = clamp(vecDot(a, b), -1.0, 1.0)
+    if cosAngle > 1.0 - PRECISION:
+        return vecUnitSafe(vecLinearInterpolate(a, b, t))
+
+    angle = math.acos(cosAngle)
+    sinAngle = math.sin(angle)
+    ratioA = math.sin((1.0 - t) * angle) / sinAngle
+    ratioB = math.sin(t * angle) / sinAngle
+
+    return tuple([x * ratioA + y * ratioB for x, y in zip(a, b)])
+
+
+def quatLinearInterpolate(a, b, t):
+    """Linearly interpolates (nlerp) between two quaternions.
+
+    Args:
+        a (tuple): Quaternion to blend from.
+        b (tuple): Quaternion to blend to.
+        t (float): Blend value.
+
+    Returns:
+        tuple: The blended unit quaternion.
+
+    """
+
+    return vecUnitSafe(vecLinearInterpolate(a, quatAlignWith(b, a), t))
+
+
+def quatGetAngle(q):
+    """Returns the angle (in radians) of a unit quaternion.
+
+    Args:
+        q (tuple): The quaternion.
+
+    Returns:
+        float: The angle.
+
+    """
+
+    return math.acos(clamp(q[3], -1.0, 1.0)) * 2.0
+
+
+def quatFromAxisAndAngle(axis, angle):
+    """Returns the rotation defined by an axis and an angle (in radians).
+
+    Args:
+        axis (tuple): Rotation axis.
+        angle (float): Rotation angle.
+
+    Returns:
+        tuple: The unit quaternion.
+
+    """
+
+    halfAngle = angle * 0.5
+    v = vecMultiplyScalar(vecUnit(axis), math.sin(halfAngle))
+    return (v[0], v[1], v[2], math.cos(halfAngle))
+
+
+def quatFrom2Vectors(sourceDirVec, destDirVec, arbitraryIfAmbiguous=True):
+    """Returns the shortest arc rotation from the source to the destination
+    vector (Stan Melax, 'The Shortest Arc Quat').
+
+    Args:
+        sourceDirVec (tuple): Unit source vector.
+        destDirVec (tuple): Unit destination vector.
+        arbitraryIfAmbiguous (bool): Pick an arbitrary axis for opposite vectors.
+
+    Returns:
+        tuple: The rotation quaternion.
+
+    """
+
+    c = vec3Cross(sourceDirVec, destDirVec)
+    d = vecDot(sourceDirVec, destDirVec)
+
+    if d < -1.0 + PRECISION:
+        if not arbitraryIfAmbiguous:
+            return IDENTITY_QUAT
+
+        axis = vec3Cross((1.0, 0.0, 0.0), sourceDirVec)
+        if vecLengthSquared(axis) < PRECISION:
+            axis = vec3Cross((0.0, 1.0, 0.0), sourceDirVec)
+
+        axis = vecUnit(axis)
+        return (axis[0], axis[1], axis[2], 0.0)
+
+    s = math.sqrt((1.0 + d) * 2.0)
+    return (c[0] / s, c[1] / s, c[2] / s, s * 0.5)
+
+
+def quatFromDirectionAndUpvector(direction, upvector):
+    """Returns the rotation with the direction as the Z axis and the upvector in the YZ plane.
+
+    Args:
+        direction (tuple): Direction vector.
+        upvector (tuple): Up vector.
+
+    Returns:
+        tuple: The unit quaternion.
+
+    """
+
+    zAxis = vecUnitSafe(direction)
+    yAxis = vecUnitSafe(upvector)
+    xAxis = vecUnitSafe(vec3Cross(yAxis, zAxis))
+    yAxis = vecUnitSafe(vec3Cross(zAxis, xAxis))
+
+    return quatFromMat33(mat33FromColumns(xAxis, yAxis, zAxis))
+
+
+def quatToMat33(q):
+    """Returns a quaternion as a 3x3 matrix.
+
+    Args:
+        q (tuple): The quaternion.
+
+    Returns:
+        tuple: Row-major 3x3 matrix.
+
+    """
+
+    x, y, z, w = q
+    xx = x * x
+    yy = y * y
+    zz = z * z
+    xy = x * y
+    xz = x * z
+    yz = y * z
+    wx = w * x
+    wy = w * y
+    wz = w * z
+
+    return (1.0 - 2.0 * (yy + zz), 2.0 * (xy - wz), 2.0 * (xz + wy),
+            2.0 * (xy + wz), 1.0 - 2.0 * (xx + zz), 2.0 * (yz - wx),
+            2.0 * (xz - wy), 2.0 * (yz + wx), 1.0 - 2.0 * (xx + yy))
+
+
+def quatFromMat33(m):
+    """Returns the rotation described by a 3x3 rotation matrix.
+
+    Args:
+        m (tuple): Row-major rotation matrix.
+
+    Returns:
+        tuple: The unit quaternion.
+
+    """
+
+    m00, m01, m02, m10, m11, m12, m20, m21, m22 = m
+    trace = m00 + m11 + m22
+    if trace > 0.0:
+        s = 0.5 / math.sqrt(trace + 1.0)
+        q = ((m21 - m12) * s, (m02 - m20) * s, (m10 - m01) * s, 0.25 / s)
+    elif m00 > m11 and m00 > m22:
+        s = 2.0 * math.sqrt(1.0 + m00 - m11 - m22)
+        q = (0.25 * s, (m01 + m10) / s, (m02 + m20) / s, (m21 - m12) / s)
+    elif m11 > m22:
+        s = 2.0 * math.sqrt(1.0 + m11 - m00 - m22)
+        q = ((m01 + m10) / s, 0.25 * s, (m12 + m21) / s, (m02 - m20) / s)
+    else:
+        s = 2.0 * math.sqrt(1.0 + m22 - m00 - m11)
+        q = ((m02 + m20) / s, (m12 + m21) / s, 0.25 * s, (m10 - m01) / s)
+
+    return vecUnitSafe(q)
+
+
+def _axisQuat(axis, angle):
+    """Returns the rotation around a single axis.
+
+    Args:
+        axis (int): Index of the axis.
+        angle (float): Angle in radians.
+
+    Returns:
+        tuple: The unit quaternion.
+
+    """
+
+    halfAngle = angle * 0.5
+    q = [0.0, 0.0, 0.0, math.cos(halfAngle)]
+    q[axis] = math.sin(halfAngle)
+    return tuple(q)
+
+
+def quatFromEulerAngles(angles, order=0):
+    """Returns the rotation described by euler angles (in radians).
+
+    A rotation order 'ABC' composes the rotations as A * B * C, meaning the
+    C rotation is applied first.
+
+    Args:
+        angles (tuple): The x, y and z angles.
+        order (int): The rotation order index.
+
+    Returns:
+        tuple: The unit quaternion.
+
+    """
+
+    i, j, k = ROTATION_ORDER_AXES[order]
+
+    return quatMultiply(quatMultiply(_axisQuat(i, angles[i]), _axisQuat(j, angles[j])),
+                        _axisQuat(k, angles[k]))
+
+
+def quatToEulerAngles(q, order=0):
+    """Returns a quaternion as euler angles (in radians).
+
+    Args:
+        q (tuple): The quaternion.
+        order (int): The rotation order index.
+
+    Returns:
+        tuple: The x, y and z angles.
+
+    """
+
+    return mat33ToEulerAngles(quatToMat33(vecUnitSafe(q)), order)
+
+
+def quatMirror(q, axisIndex):
+    """Reflects the rotation across the plane normal to the given axis.
+
+    Args:
+        q (tuple): Quaternion to mirror.
+        axisIndex (int): 0 for the X axis, 1 for the Y axis, and 2 for the Z axis.
+
+    Returns:
+        tuple: The mirrored quaternion.
+
+    """
+
+    result = [-q[0], -q[1], -q[2], q[3]]
+    result[axisIndex] = q[axisIndex]
+
+    return tuple(result)
+
+
+# ==========
+# Matrices
+# ==========
+def mat33FromColumns(col0, col1, col2):
+    """Returns a 3x3 matrix built from column vectors.
+
+    Args:
+        col0 (tuple): Column 0.
+        col1 (tuple): Column 1.
+        col2 (tuple): Column 2.
+
+    Returns:
+        tuple: Row-major 3x3 matrix.
+
+    """
+
+    return (col0[0], col1[0], col2[0],
+            col0[1], col1[1], col2[1],
+            col0[2], col1[2], col2[2])
+
+
+def mat33Multiply(a, b):
+    """Returns the product of two 3x3 matrices.
+
+    Args:
+        a (tuple): First matrix.
+        b (tuple): Second matrix.
+
+    Returns:
+        tuple: The product.
+
+    """
+
+    return tuple([a[r * 3] * b[c] + a[r * 3 + 1] * b[3 + c] + a[r * 3 + 2] * b[6 + c]
+                  for r in xrange(3) for c in xrange(3)])
+
+
+def mat33MultiplyVector(m, v):
+    """Returns the product of a 3x3 matrix and a vector.
+
+    Args:
+        m (tuple): The matrix.
+        v (tuple): The vector.
+
+    Returns:
+        tuple: The transformed vector.
+
+    """
+
+    return (m[0] * v[0] + m[1] * v[1] + m[2] * v[2],
+            m[3] * v[0] + m[4] * v[1] + m[5] * v[2],
+            m[6] * v[0] + m[7] * v[1] + m[8] * v[2])
+
+
+def mat33Transpose(m):
+    """Returns the transpose of a 3x3 matrix.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        tuple: The transposed matrix.
+
+    """
+
+    return (m[0], m[3], m[6],
+            m[1], m[4], m[7],
+            m[2], m[5], m[8])
+
+
+def mat33Determinant(m):
+    """Returns the determinant of a 3x3 matrix.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        float: The determinant.
+
+    """
+
+    return (m[0] * (m[4] * m[8] - m[5] * m[7]) -
+            m[1] * (m[3] * m[8] - m[5] * m[6]) +
+            m[2] * (m[3] * m[7] - m[4] * m[6]))
+
+
+def mat33Adjoint(m):
+    """Returns the adjoint of a 3x3 matrix.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        tuple: The adjoint matrix.
+
+    """
+
+    return (m[4] * m[8] - m[5] * m[7], m[2] * m[7] - m[1] * m[8], m[1] * m[5] - m[2] * m[4],
+            m[5] * m[6] - m[3] * m[8], m[0] * m[8] - m[2] * m[6], m[2] * m[3] - m[0] * m[5],
+            m[3] * m[7] - m[4] * m[6], m[1] * m[6] - m[0] * m[7], m[0] * m[4] - m[1] * m[3])
+
+
+def mat33Inverse(m):
+    """Returns the inverse of a 3x3 matrix.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        tuple: The inverse matrix.
+
+    """
+
+    det = mat33Determinant(m)
+    if abs(det) < DIVIDEPRECISION:
+        raise ZeroDivisionError("Mat33 is singular and cannot be inverted.")
+
+    return vecDivideScalar(mat33Adjoint(m), det)
+
+
+def mat33InverseSafe(m):
+    """Returns the inverse of a 3x3 matrix, or the identity if it is singular.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        tuple: The inverse matrix.
+
+    """
+
+    if abs(mat33Determinant(m)) < DIVIDEPRECISION:
+        return IDENTITY_MAT33
+
+    return mat33Inverse(m)
+
+
+def mat33SetDiagonal(m, v):
+    """Returns a 3x3 matrix with its diagonal replaced.
+
+    Args:
+        m (tuple): The matrix.
+        v (tuple): The diagonal values.
+
+    Returns:
+        tuple: The new matrix.
+
+    """
+
+    result = list(m)
+    result[0] = v[0]
+    result[4] = v[1]
+    result[8] = v[2]
+
+    return tuple(result)
+
+
+def _axisMat33(axis, angle):
+    """Returns the rotation matrix around a single axis.
+
+    Args:
+        axis (int): Index of the axis.
+        angle (float): Angle in radians.
+
+    Returns:
+        tuple: Row-major 3x3 matrix.
+
+    """
+
+    c = math.cos(angle)
+    s = math.sin(angle)
+    if axis == 0:
+        return (1.0, 0.0, 0.0, 0.0, c, -s, 0.0, s, c)
+    elif axis == 1:
+        return (c, 0.0, s, 0.0, 1.0, 0.0, -s, 0.0, c)
+
+    return (c, -s, 0.0, s, c, 0.0, 0.0, 0.0, 1.0)
+
+
+def eulerToMat33(angles, order=0):
+    """Returns euler angles (in radians) as a 3x3 matrix.
+
+    Args:
+        angles (tuple): The x, y and z angles.
+        order (int): The rotation order index.
+
+    Returns:
+        tuple: Row-major 3x3 matrix.
+
+    """
+
+    i, j, k = ROTATION_ORDER_AXES[order]
+
+    return mat33Multiply(mat33Multiply(_axisMat33(i, angles[i]), _axisMat33(j, angles[j])),
+                         _axisMat33(k, angles[k]))
+
+
+def mat33ToEulerAngles(m, order=0):
+    """Decomposes a rotation matrix in to euler angles for a rotation order.
+
+    Args:
+        m (tuple): Row-major rotation matrix.
+        order (int): The rotation order index.
+
+    Returns:
+        tuple: The x, y and z angles.
+
+    """
+
+    i, j, k = ROTATION_ORDER_AXES[order]
+    if order in (0, 1, 2):
+        sign = 1.0
+    else:
+        sign = -1.0
+
+    angles = [0.0, 0.0, 0.0]
+    sinB = clamp(sign * m[i * 3 + k], -1.0, 1.0)
+    angles[j] = math.asin(sinB)
+    if abs(sinB) < 1.0 - PRECISION:
+        angles[i] = math.atan2(-sign * m[j * 3 + k], m[k * 3 + k])
+        angles[k] = math.atan2(-sign * m[i * 3 + j], m[i * 3 + i])
+    else:
+        angles[i] = math.atan2(sign * m[k * 3 + j], m[j * 3 + j])
+
+    return tuple(angles)
+
+
+def mat44FromMat33(m, translation=(0.0, 0.0, 0.0)):
+    """Returns a 4x4 matrix from a 3x3 matrix and a translation.
+
+    Args:
+        m (tuple): The 3x3 matrix.
+        translation (tuple): The translation.
+
+    Returns:
+        tuple: Row-major 4x4 matrix.
+
+    """
+
+    return (m[0], m[1], m[2], translation[0],
+            m[3], m[4], m[5], translation[1],
+            m[6], m[7], m[8], translation[2],
+            0.0, 0.0, 0.0, 1.0)
+
+
+def mat44UpperLeft(m):
+    """Returns the upper left 3x3 matrix of a 4x4 matrix.
+
+    Args:
+        m (tuple): The 4x4 matrix.
+
+    Returns:
+        tuple: Row-major 3x3 matrix.
+
+    """
+
+    return (m[0], m[1], m[2],
+            m[4], m[5], m[6],
+            m[8], m[9], m[10])
+
+
+def mat44Multiply(a, b):
+    """Returns the product of two 4x4 matrices.
+
+    Args:
+        a (tuple): First matrix.
+        b (tuple): Second matrix.
+
+    Returns:
+        tuple: The product.
+
+    """
+
+    return tuple([a[r * 4] * b[c] + a[r * 4 + 1] * b[4 + c] + a[r * 4 + 2] * b[8 + c] +
+                  a[r * 4 + 3] * b[12 + c]
+                  for r in xrange(4) for c in xrange(4)])
+
+
+def mat44MultiplyVector(m, v):
+    """Transforms a point by a 4x4 matrix.
+
+    Args:
+        m (tuple): The matrix.
+        v (tuple): The point.
+
+    Returns:
+        tuple: The transformed point.
+
+    """
+
+    x = m[0] * v[0] + m[1] * v[1] + m[2] * v[2] + m[3]
+    y = m[4] * v[0] + m[5] * v[1] + m[6] * v[2] + m[7]
+    z = m[8] * v[0] + m[9] * v[1] + m[10] * v[2] + m[11]
+    t = m[12] * v[0] + m[13] * v[1] + m[14] * v[2] + m[15]
+    if t != 1.0 and abs(t) > DIVIDEPRECISION:
+        return (x / t, y / t, z / t)
+
+    return (x, y, z)
+
+
+def mat44Transpose(m):
+    """Returns the transpose of a 4x4 matrix.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        tuple: The transposed matrix.
+
+    """
+
+    return tuple([m[c * 4 + r] for r in xrange(4) for c in xrange(4)])
+
+
+def _mat44Minor(m, row, col):
+    """Returns the determinant of a 4x4 matrix with a row and column removed.
+
+    Args:
+        m (tuple): The matrix.
+        row (int): Row to remove.
+        col (int): Column to remove.
+
+    Returns:
+        float: The minor.
+
+    """
+
+    rows = [r for r in xrange(4) if r != row]
+    cols = [c for c in xrange(4) if c != col]
+    return mat33Determinant([m[r * 4 + c] for r in rows for c in cols])
+
+
+def mat44Determinant(m):
+    """Returns the determinant of a 4x4 matrix.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        float: The determinant.
+
+    """
+
+    return sum([((-1.0) ** c) * m[c] * _mat44Minor(m, 0, c) for c in xrange(4)])
+
+
+def mat44Adjoint(m):
+    """Returns the adjoint of a 4x4 matrix.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        tuple: The adjoint matrix.
+
+    """
+
+    return tuple([((-1.0) ** (r + c)) * _mat44Minor(m, c, r)
+                  for r in xrange(4) for c in xrange(4)])
+
+
+def mat44Inverse(m):
+    """Returns the inverse of a 4x4 matrix.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        tuple: The inverse matrix.
+
+    """
+
+    det = mat44Determinant(m)
+    if abs(det) < DIVIDEPRECISION:
+        raise ZeroDivisionError("Mat44 is singular and cannot be inverted.")
+
+    return vecDivideScalar(mat44Adjoint(m), det)
+
+
+def mat44InverseSafe(m):
+    """Returns the inverse of a 4x4 matrix, or the identity if it is singular.
+
+    Args:
+        m (tuple): The matrix.
+
+    Returns:
+        tuple: The inverse matrix.
+
+    """
+
+    if abs(mat44Determinant(m)) < DIVIDEPRECISION:
+        return IDENTITY_MAT44
+
+    return mat44Inverse(m)
+
+
+def mat44SetDiagonal(m, v):
+    """Returns a 4x4 matrix with its diagonal replaced.
+
+    Args:
+        m (tuple): The matrix.
+        v (tuple): The diagonal values, the 4th defaulting to 1.0.
+
+    Returns:
+        tuple: The new matrix.
+
+    """
+
+    result = list(m)
+    result[0] = v[0]
+    result[5] = v[1]
+    result[10] = v[2]
+    result[15] = v[3] if len(v) > 3 else 1.0
+
+    return tuple(result)
+
+
+# ===========
+# Transforms
+# ===========
+def xfoMultiply(a, b):
+    """Returns the product of two transforms.
+
+    Args:
+        a (tuple): First transform.
+        b (tuple): Second transform.
+
+    Returns:
+        tuple: The product.
+
+    """
+
+    aTr, aOri, aSc = a
+    bTr, bOri, bSc = b
+
+    tr = vecAdd(aTr, quatRotateVector(aOri, vecMultiply(aSc, bTr)))
+    ori = vecUnitSafe(quatMultiply(aOri, bOri))
+    sc = vecMultiply(aSc, bSc)
+
+    return (tr, ori, sc)
+
+
+def xfoTransformVector(xfo, v):
+    """Transforms a vector by a transform.
+
+    Args:
+        xfo (tuple): The transform.
+        v (tuple): The vector.
+
+    Returns:
+        tuple: The transformed vector.
+
+    """
+
+    tr, ori, sc = xfo
+    return vecAdd(tr, quatRotateVector(ori, vecMultiply(sc, v)))
+
+
+def xfoInverse(xfo):
+    """Returns the inverse of a transform.
+
+    Args:
+        xfo (tuple): The transform.
+
+    Returns:
+        tuple: The inverse transform.
+
+    """
+
+    tr, ori, sc = xfo
+    invSc = vecInverse(sc)
+    invOri = quatInverse(ori)
+    invTr = vecMultiply(invSc, quatRotateVector(invOri, vecNegate(tr)))
+
+    return (invTr, invOri, invSc)
+
+
+def xfoInverseTransformVector(xfo, v):
+    """Transforms a vector by the inverse of a transform.
+
+    Args:
+        xfo (tuple): The transform.
+        v (tuple): The vector.
+
+    Returns:
+        tuple: The transformed vector.
+
+    """
+
+    tr, ori, sc = xfo
+    return vecMultiply(vecInverse(sc), quatRotateVector(quatInverse(ori), vecSubtract(v, tr)))
+
+
+def xfoLinearInterpolate(a, b, t):
+    """Interpolates between two transforms, slerping the orientation.
+
+    Args:
+        a (tuple): Transform to blend from.
+        b (tuple): Transform to blend to.
+        t (float): Blend value.
+
+    Returns:
+        tuple: The blended transform.
+
+    """
+
+    return (vecLinearInterpolate(a[0], b[0], t),
+            quatSphericalLinearInterpolate(a[1], b[1], t),
+            vecLinearInterpolate(a[2], b[2], t))
+
+
+def xfoToMat44(xfo):
+    """Returns a transform as a 4x4 matrix.
+
+    Args:
+        xfo (tuple): The transform.
+
+    Returns:
+        tuple: Row-major 4x4 matrix.
+
+    """
+
+    tr, ori, sc = xfo
+    m = quatToMat33(ori)
+
+    return (m[0] * sc[0], m[1] * sc[1], m[2] * sc[2], tr[0],
+            m[3] * sc[0], m[4] * sc[1], m[5] * sc[2], tr[1],
+            m[6] * sc[0], m[7] * sc[1], m[8] * sc[2], tr[2],
+            0.0, 0.0, 0.0, 1.0)
+
+
+def xfoFromMat44(m):
+    """Decomposes a 4x4 matrix in to translation, orientation and scaling.
+
+    Negative scaling is carried on the x axis.
+
+    Args:
+        m (tuple): Row-major 4x4 matrix.
+
+    Returns:
+        tuple: The (tr, ori, sc) transform.
+
+    """
+
+    tr = (m[3], m[7], m[11])
+    upperLeft = mat44UpperLeft(m)
+    sc = [vecLength((upperLeft[0], upperLeft[3], upperLeft[6])),
+          vecLength((upperLeft[1], upperLeft[4], upperLeft[7])),
+          vecLength((upperLeft[2], upperLeft[5], upperLeft[8]))]
+
+    if mat33Determinant(upperLeft) < 0.0:
+        sc[0] = -sc[0]
+
+    invSc = [1.0 / x if abs(x) > DIVIDEPRECISION else 0.0 for x in sc]
+    rotation = tuple([upperLeft[i] * invSc[i % 3] for i in xrange(9)])
+
+    return (tr, quatFromMat33(rotation), tuple(sc))
+
+
+def xfoFromVectors(inVec1, inVec2, inVec3, translation, sc=(1.0, 1.0, 1.0)):
+    """Returns a transform from 3 axis vectors and a translation.
+
+    Args:
+        inVec1 (tuple): X axis vector.
+        inVec2 (tuple): Y axis vector.
+        inVec3 (tuple): Z axis vector.
+        translation (tuple): Translation vector.
+        sc (tuple): Scaling to keep.
+
+    Returns:
+        tuple: The transform.
+
+    """
+
+    return (tuple(translation),
+            quatFromMat33(mat33FromColumns(inVec1, inVec2, inVec3)),
+            tuple(sc))
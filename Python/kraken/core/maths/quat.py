@@ -7,11 +7,13 @@ Quat -- Quaternion rotation.
 import math
 
 from kraken.core.kraken_system import ks
-from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.math_object import MathObject, isNativeBackend
+from kraken.core.maths import native_math
 
 from kraken.core.maths.vec3 import Vec3
 from kraken.core.maths.euler import Euler
 from kraken.core.maths.mat33 import Mat33
+from kraken.core.maths.rotation_order import RotationOrder
 
 
 class Quat(MathObject):
@@ -22,16 +24,25 @@ class Quat(MathObject):
 
         super(Quat, self).__init__()
 
-        if ks.getRTValTypeName(v) == 'Quat':
-            self._rtval = v
+        if ks.isRTValOfType(v, 'Quat'):
+            if isNativeBackend():
+                self._data = list(Vec3(v.v)._getData()) + [v.w.getSimpleType()]
+                self._v = Vec3._fromStorage(native_math.SequenceView(self._data, 0, 3))
+            else:
+                self._rtval = v
         else:
-            if v is not None and not isinstance(v, Vec3) and  not isinstance(v, Euler):
+            if v is not None and not isinstance(v, (Vec3, Euler, Quat)):
                 raise TypeError("Quat: Invalid type for 'v' argument. Must be a Vec3.")
 
             if w is not None and not isinstance(w, (int, float)):
                 raise TypeError("Quat: Invalid type for 'w' argument. Must be a int or float.")
 
-            self._rtval = ks.rtVal('Quat')
+            if isNativeBackend():
+                self._data = [0.0, 0.0, 0.0, 1.0]
+                self._v = Vec3._fromStorage(native_math.SequenceView(self._data, 0, 3))
+            else:
+                self._rtval = ks.rtVal('Quat')
+
             if isinstance(v, Quat):
                 self.set(v=v.v, w=v.w)
             elif isinstance(v, Euler):
@@ -51,6 +62,70 @@ class Quat(MathObject):
         return "Quat(" + str(self.v) + "," + str(self.w) + ")"
 
 
+    def _getData(self):
+        """Returns the components of this quaternion.
+
+        Returns:
+            tuple: The x, y, z and w components.
+
+        """
+
+        if self._rtval is None:
+            return tuple(self._data)
+
+        return self.v._getData() + (self.w,)
+
+
+    def _setData(self, values):
+        """Sets the components of a native quaternion.
+
+        Args:
+            values (tuple): The x, y, z and w components.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._data[:] = native_math.toFloat32List(values)
+
+        return True
+
+
+    @classmethod
+    def _fromStorage(cls, data):
+        """Constructs a native quaternion using the given list as its storage.
+
+        Args:
+            data (list): List or SequenceView of the x, y, z and w components.
+
+        Returns:
+            Quat: Quaternion sharing its values with the storage.
+
+        """
+
+        quat = cls.__new__(cls)
+        MathObject.__init__(quat)
+        quat._data = data
+        quat._v = Vec3._fromStorage(native_math.SequenceView(data, 0, 3))
+
+        return quat
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this quaternion.
+
+        Returns:
+            object: Quat RTVal.
+
+        """
+
+        rtval = ks.rtVal('Quat')
+        rtval.set('', self._v.getRTVal(), ks.rtVal('Scalar', self._data[3]))
+
+        return rtval
+
+
     @property
     def v(self):
         """Gets vector of this quaternion.
@@ -60,6 +135,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._v
+
         return Vec3(self._rtval.v)
 
 
@@ -75,7 +153,10 @@ class Quat(MathObject):
 
         """
 
-        self._rtval.v = ks.rtVal('Vec3', value)
+        if self._rtval is None:
+            self._v.set(*value._getData())
+        else:
+            self._rtval.v = ks.rtVal('Vec3', value)
 
         return True
 
@@ -89,6 +170,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[3]
+
         return self._rtval.w.getSimpleType()
 
 
@@ -104,7 +188,10 @@ class Quat(MathObject):
 
         """
 
-        self._rtval.w = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[3] = native_math.toFloat32(value)
+        else:
+            self._rtval.w = ks.rtVal('Scalar', value)
 
         return True
 
@@ -136,6 +223,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Quat(self)
+
         quat = Quat()
         quat.w = self.w
         quat.v = self.v.clone()
@@ -155,12 +245,17 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self.v = v
+            self.w = w
+            return True
+
         self._rtval.set('', ks.rtVal('Vec3', v), ks.rtVal('Scalar', w))
 
         return True
 
 
-    def setIdentity():
+    def setIdentity(self):
         """Sets this quaternion to the identity.
 
         Returns:
@@ -168,6 +263,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.IDENTITY_QUAT)
+            return True
+
         self._rtval.setIdentity('')
 
         return True
@@ -185,6 +284,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatFromEulerAngles(e._getData(), e.ro.order))
+            return Quat(self)
+
         return Quat(self._rtval.setFromEuler('Quat', ks.rtVal('Euler', e)))
 
 
@@ -201,6 +304,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatFromEulerAngles(angles._getData(), ro.order))
+            return Quat(self)
+
         return Quat(self._rtval.setFromEuler('Quat', ks.rtVal('Vec3', angles),
                     ks.rtVal('RotationOrder', ro)))
 
@@ -217,6 +324,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatFromEulerAngles(angles._getData()))
+            return Quat(self)
+
         return Quat(self._rtval.setFromEuler('Quat', ks.rtVal('Vec3', angles)))
 
 
@@ -233,6 +344,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatFromAxisAndAngle(axis._getData(), angle))
+            return Quat(self)
+
         return Quat(self._rtval.setFromAxisAndAngle('Quat', ks.rtVal('Vec3', axis),
                     ks.rtVal('Scalar', angle)))
 
@@ -248,10 +363,14 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatFromMat33(mat._getData()))
+            return Quat(self)
+
         return Quat(self._rtval.setFromMat33('Quat', ks.rtVal('Mat33', mat)))
 
 
-    def setFrom2Vectors(sourceDirVec, destDirVec, arbitraryIfAmbiguous=True):
+    def setFrom2Vectors(self, sourceDirVec, destDirVec, arbitraryIfAmbiguous=True):
         """Set the quaternion to the rotation required to rotate the source
         vector to the destination vector.
 
@@ -268,6 +387,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatFrom2Vectors(sourceDirVec._getData(), destDirVec._getData(),
+                                                       arbitraryIfAmbiguous))
+            return Quat(self)
+
         return Quat(self._rtval.setFrom2Vectors('Quat', ks.rtVal('Vec3', sourceDirVec),
                     ks.rtVal('Vec3', destDirVec), ks.rtVal('Boolean', arbitraryIfAmbiguous)))
 
@@ -285,6 +409,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatFromDirectionAndUpvector(direction._getData(),
+                                                                   upvector._getData()))
+            return Quat(self)
+
         return Quat(self._rtval.setFromDirectionAndUpvector('Quat',
                     ks.rtVal('Vec3', direction), ks.rtVal('Vec3', upvector)))
 
@@ -300,6 +429,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.vecEqual(self._getData(), other._getData())
+
         return self._rtval.equal('Boolean', ks.rtVal('Quat', other)).getSimpleType()
 
 
@@ -315,6 +447,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._getData(), other._getData(), precision)
+
         return self._rtval.almostEqual('Boolean', ks.rtVal('Quat', other),
                                        ks.rtVal('Scalar', precision)).getSimpleType()
 
@@ -331,6 +466,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._getData(), other._getData())
+
         return self._rtval.almostEqual('Boolean', ks.rtVal('Quat', other)).getSimpleType()
 
 
@@ -345,6 +483,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.vecAdd(self._getData(), other._getData()))
+            return quat
+
         return Quat(self._rtval.add('Quat', ks.rtVal('Quat', other)))
 
 
@@ -359,6 +502,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.vecSubtract(self._getData(), other._getData()))
+            return quat
+
         return Quat(self._rtval.subtract('Quat', ks.rtVal('Quat', other)))
 
 
@@ -373,6 +521,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.quatMultiply(self._getData(), other._getData()))
+            return quat
+
         return Quat(self._rtval.multiply('Quat', ks.rtVal('Quat', other)))
 
 
@@ -387,6 +540,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.quatDivide(self._getData(), other._getData()))
+            return quat
+
         return Quat(self._rtval.divide('Quat', ks.rtVal('Quat', other)))
 
 
@@ -401,6 +559,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.vecMultiplyScalar(self._getData(), other))
+            return quat
+
         return Quat(self._rtval.multiplyScalar('Quat', ks.rtVal('Scalar', other)))
 
 
@@ -415,6 +578,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.vecDivideScalar(self._getData(), other))
+            return quat
+
         return Quat(self._rtval.divideScalar('Quat', ks.rtVal('Scalar', other)))
 
 
@@ -431,6 +599,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.quatRotateVector(self._getData(), v._getData()))
+
         return Vec3(self._rtval.rotateVector('Vec3', ks.rtVal('Vec3', v)))
 
 
@@ -445,6 +616,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDot(self._getData(), other._getData()))
+
         return self._rtval.dot('Scalar', ks.rtVal('Quat', other)).getSimpleType()
 
 
@@ -456,6 +630,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.quatConjugate(self._getData()))
+            return quat
+
         return Quat(self._rtval.conjugate('Quat'))
 
 
@@ -467,6 +646,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecLengthSquared(self._getData()))
+
         return self._rtval.lengthSquared('Scalar').getSimpleType()
 
 
@@ -478,6 +660,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecLength(self._getData()))
+
         return self._rtval.length('Scalar').getSimpleType()
 
 
@@ -489,6 +674,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.vecUnit(self._getData()))
+            return quat
+
         return Quat(self._rtval.unit('Quat'))
 
 
@@ -501,6 +691,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.vecUnitSafe(self._getData()))
+            return quat
+
         return Quat(self._rtval.unit_safe('Quat'))
 
 
@@ -513,6 +708,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            length = native_math.toFloat32(native_math.vecLength(self._getData()))
+            self._setData(native_math.vecUnit(self._getData()))
+            return length
+
         return self._rtval.setUnit('Scalar').getSimpleType()
 
 
@@ -524,6 +724,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.quatInverse(self._getData()))
+            return quat
+
         return Quat(self._rtval.inverse('Quat'))
 
 
@@ -539,6 +744,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatAlignWith(self._getData(), other._getData()))
+            return Quat(self)
+
         return Quat(self._rtval.alignWith('Quat', ks.rtVal('Quat', other)))
 
 
@@ -550,6 +759,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.quatGetAngle(self._getData()))
+
         return self._rtval.getAngle('Scalar').getSimpleType()
 
 
@@ -561,6 +773,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = native_math.quatToMat33(self._getData())
+            return Vec3(mat[0], mat[3], mat[6])
+
         return Vec3(self._rtval.getXaxis('Vec3'))
 
 
@@ -572,6 +788,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = native_math.quatToMat33(self._getData())
+            return Vec3(mat[1], mat[4], mat[7])
+
         return Vec3(self._rtval.getYaxis('Vec3'))
 
 
@@ -583,6 +803,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = native_math.quatToMat33(self._getData())
+            return Vec3(mat[2], mat[5], mat[8])
+
         return Vec3(self._rtval.getZaxis('Vec3'))
 
 
@@ -597,6 +821,10 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.quatMirror(self._getData(), axisIndex))
+            return Quat(self)
+
         return Quat(self._rtval.mirror('Quat', ks.rtVal('Integer', axisIndex)))
 
 
@@ -608,6 +836,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat33()
+            mat._setData(native_math.quatToMat33(self._getData()))
+            return mat
+
         return Mat33(self._rtval.toMat33('Mat33'))
 
 
@@ -622,10 +855,16 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            euler = Euler()
+            euler.ro = rotationOrder
+            euler.set(*native_math.quatToEulerAngles(self._getData(), euler.ro.order))
+            return euler
+
         return Euler(self._rtval.toEuler('Euler', ks.rtVal('RotationOrder', rotationOrder)))
 
 
-    def toEulerAngles(self, order):
+    def toEulerAngles(self, rotationOrder):
         """Gets this quaternion as a Euler angles using the rotationorder XYZ.
 
         Args:
@@ -636,10 +875,13 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.quatToEulerAngles(self._getData(), RotationOrder(rotationOrder).order))
+
         return Vec3(self._rtval.toEulerAngles('Vec3', ks.rtVal('RotationOrder', rotationOrder)))
 
 
-    def toEulerAngles():
+    def toEulerAngles(self):
         """Gets this quaternion as a Euler angles using the rotationorder XYZ.
 
         Returns:
@@ -647,6 +889,9 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.quatToEulerAngles(self._getData()))
+
         return Vec3(self._rtval.toEulerAngles('Vec3'))
 
 
@@ -665,6 +910,11 @@ class Quat(MathObject):
 
         """
 
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.quatSphericalLinearInterpolate(self._getData(), q2._getData(), t))
+            return quat
+
         return Quat(self._rtval.sphericalLinearInterpolate('Quat',
                     ks.rtVal('Quat', q2), ks.rtVal('Scalar', t)))
 
@@ -686,4 +936,9 @@ class Quat(MathObject):
 
         """
 
-        return Quat(self._rtval.sphericalLinearInterpolate('Quat', ks.rtVal('Quat', q2), ks.rtVal('Scalar', t)))
+        if self._rtval is None:
+            quat = Quat()
+            quat._setData(native_math.quatLinearInterpolate(self._getData(), other._getData(), t))
+            return quat
+
+        return Quat(self._rtval.linearInterpolate('Quat', ks.rtVal('Quat', other), ks.rtVal('Scalar', t)))
@@ -0,0 +1,293 @@
+"""Kraken - maths.quat_array module.
+
+Classes:
+QuatArray -- Array of Quaternion objects.
+"""
+
+from kraken.core.kraken_system import ks
+from quat import Quat
+from vec3_array import Vec3Array
+import native_math
+
+
+class QuatArray(object):
+    """Array of Quaternion objects.
+
+    The components of all quaternions are stored in a single flat list of
+    floats (x0, y0, z0, w0, x1, ...). Indexing the array returns a native Quat
+    that shares its values with the array.
+
+    """
+
+    def __init__(self, values=None):
+        """Initializes the array from a list of Quat objects.
+
+        Args:
+            values (list): Quat objects or (x, y, z, w) tuples to fill the array with.
+
+        """
+
+        super(QuatArray, self).__init__()
+        self._data = []
+
+        if values is not None:
+            for value in values:
+                self.append(value)
+
+
+    def __str__(self):
+        """String representation of the QuatArray object.
+
+        Returns:
+            str: String representation of the QuatArray object.
+
+        """
+
+        return "QuatArray(" + ",".join([str(x) for x in self]) + ")"
+
+
+    @classmethod
+    def _fromStorage(cls, data):
+        """Constructs an array using the given list as its storage.
+
+        Args:
+            data (list): Flat list of the quaternion components.
+
+        Returns:
+            QuatArray: Array sharing its values with the storage.
+
+        """
+
+        array = cls.__new__(cls)
+        array._data = data
+
+        return array
+
+
+    def _getItems(self):
+        """Returns the quaternions of this array as tuples.
+
+        Returns:
+            list: The (x, y, z, w) tuples of the quaternions.
+
+        """
+
+        data = self._data
+        return [tuple(data[i:i + 4]) for i in xrange(0, len(data), 4)]
+
+
+    def _getOperands(self, other):
+        """Returns the values to combine with each quaternion of this array.
+
+        Args:
+            other (QuatArray, Quat): Array of the same size, or a single
+                quaternion used for every element.
+
+        Returns:
+            list: The (x, y, z, w) tuples.
+
+        """
+
+        if isinstance(other, QuatArray):
+            if len(other) != len(self):
+                raise ValueError("QuatArray sizes do not match: " + str(len(self)) + " != " + str(len(other)))
+
+            return other._getItems()
+
+        return [other._getData()] * len(self)
+
+
+    @classmethod
+    def _fromItems(cls, items):
+        """Constructs an array from a list of tuples.
+
+        Args:
+            items (list): The (x, y, z, w) tuples of the quaternions.
+
+        Returns:
+            QuatArray: New array.
+
+        """
+
+        data = []
+        for item in items:
+            data.extend(item)
+
+        return cls._fromStorage(native_math.toFloat32List(data))
+
+
+    def __len__(self):
+        return len(self._data) // 4
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("QuatArray index out of range")
+
+        return Quat._fromStorage(native_math.SequenceView(self._data, index * 4, 4))
+
+    def __setitem__(self, index, value):
+        self[index]._setData(value._getData())
+
+
+    def append(self, value):
+        """Appends a quaternion to the end of this array.
+
+        Args:
+            value (Quat, tuple): Quaternion to append.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if isinstance(value, Quat):
+            value = value._getData()
+
+        self._data.extend(native_math.toFloat32List(value))
+
+        return True
+
+
+    def resize(self, size):
+        """Resizes this array, new quaternions are set to the identity.
+
+        Args:
+            size (int): The new number of quaternions.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        count = size * 4
+        if count < len(self._data):
+            del self._data[count:]
+        else:
+            self._data.extend(list(native_math.IDENTITY_QUAT) * ((count - len(self._data)) // 4))
+
+        return True
+
+
+    def clone(self):
+        """Returns a clone of the QuatArray.
+
+        Returns:
+            QuatArray: The cloned QuatArray.
+
+        """
+
+        return QuatArray._fromStorage(list(self._data))
+
+
+    def toList(self):
+        """Returns the quaternions of this array as independent Quat objects.
+
+        Returns:
+            list: The Quat objects.
+
+        """
+
+        return [Quat(x) for x in self]
+
+
+    def getRTVal(self):
+        """Constructs a 'Quat[]' RTVal from the values of this array.
+
+        Returns:
+            object: Quat[] RTVal.
+
+        """
+
+        rtval = ks.rtVal('Quat[]')
+        rtval.resize(len(self))
+        for i, quat in enumerate(self):
+            rtval[i] = quat.getRTVal()
+
+        return rtval
+
+
+    def multiply(self, other):
+        """Multiplies all quaternions by a quaternion, or by the quaternions of
+        another array.
+
+        Args:
+            other (QuatArray, Quat): Quaternions on the right side of the product.
+
+        Returns:
+            QuatArray: New array of the products.
+
+        """
+
+        return QuatArray._fromItems([native_math.quatMultiply(a, b) for a, b in
+                                     zip(self._getItems(), self._getOperands(other))])
+
+
+    def inverse(self):
+        """Gets the inverse of all quaternions.
+
+        Returns:
+            QuatArray: New array of the inverse quaternions.
+
+        """
+
+        return QuatArray._fromItems([native_math.quatInverse(x) for x in self._getItems()])
+
+
+    def unit(self):
+        """Gets the unit quaternions of all quaternions, no error reported for
+        quaternions that cannot be made unit.
+
+        Returns:
+            QuatArray: New array of unit quaternions.
+
+        """
+
+        return QuatArray._fromItems([native_math.vecUnitSafe(x) for x in self._getItems()])
+
+
+    def rotateVectors(self, vectors):
+        """Rotates vectors by the quaternions of this array.
+
+        Args:
+            vectors (Vec3Array, Vec3): One vector per quaternion, or a single
+                vector rotated by every quaternion.
+
+        Returns:
+            Vec3Array: New array of rotated vectors.
+
+        """
+
+        if isinstance(vectors, Vec3Array):
+            if len(vectors) != len(self):
+                raise ValueError("Array sizes do not match: " + str(len(self)) + " != " + str(len(vectors)))
+
+            vectors = vectors._getItems()
+        else:
+            vectors = [vectors._getData()] * len(self)
+
+        return Vec3Array._fromItems([native_math.quatRotateVector(q, v) for q, v in
+                                     zip(self._getItems(), vectors)])
+
+
+    def sphericalLinearInterpolate(self, other, t):
+        """Interpolates all quaternions spherically (slerp) to a quaternion, or
+        to the quaternions of another array, given a scalar blend value.
+
+        Args:
+            other (QuatArray, Quat): Quaternions to blend to.
+            t (float): Blend value.
+
+        Returns:
+            QuatArray: New array of blended quaternions.
+
+        """
+
+        return QuatArray._fromItems([native_math.quatSphericalLinearInterpolate(a, b, t) for a, b in
+                                     zip(self._getItems(), self._getOperands(other))])
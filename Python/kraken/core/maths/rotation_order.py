@@ -7,7 +7,7 @@ RotationOrder -- Rotation Order.
 import math
 
 from kraken.core.kraken_system import ks
-from kraken.core.maths.math_object import MathObject
+from kraken.core.maths.math_object import MathObject, isNativeBackend
 
 
 class RotationOrder(MathObject):
@@ -18,8 +18,17 @@ class RotationOrder(MathObject):
 
         super(RotationOrder, self).__init__()
 
-        if ks.getRTValTypeName(order) == 'RotationOrder':
-            self._rtval = order
+        if ks.isRTValOfType(order, 'RotationOrder'):
+            if isNativeBackend():
+                self._order = order.order.getSimpleType()
+            else:
+                self._rtval = order
+        elif isNativeBackend():
+            self._order = 0
+            if isinstance(order, RotationOrder):
+                self.set(order=order.order)
+            else:
+                self.set(order=order)
         else:
             self._rtval = ks.rtVal('RotationOrder')
             if isinstance(order, RotationOrder):
@@ -39,6 +48,20 @@ class RotationOrder(MathObject):
         return "RotationOrder(order='" + str(self.order) + "')"
 
 
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native value of this rotation order.
+
+        Returns:
+            object: RotationOrder RTVal.
+
+        """
+
+        rtval = ks.rtVal('RotationOrder')
+        rtval.order = ks.rtVal('Integer', self._order)
+
+        return rtval
+
+
     @property
     def order(self):
         """Gets order value of this Rotation Order.
@@ -48,6 +71,9 @@ class RotationOrder(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._order
+
         return self._rtval.order.getSimpleType()
 
 
@@ -63,7 +89,10 @@ class RotationOrder(MathObject):
 
         """
 
-        self._rtval.order = ks.rtVal('Integer', value)
+        if self._rtval is None:
+            self._order = int(value)
+        else:
+            self._rtval.order = ks.rtVal('Integer', value)
 
         return True
 
@@ -125,7 +154,12 @@ class RotationOrder(MathObject):
             else:
                 newOrder = order
 
-        if newOrder == 0:
+        if self._rtval is None:
+            if newOrder < 0 or newOrder > 5:
+                raise ValueError("Invalid rotation order: '" + str(order) + "'")
+
+            self._order = newOrder
+        elif newOrder == 0:
             self._rtval.setXYZ('')
         elif newOrder == 1:
             self._rtval.setYZX('')
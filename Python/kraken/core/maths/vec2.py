@@ -6,7 +6,8 @@ Vec2 -- Vector 2 object.
 
 import math
 from kraken.core.kraken_system import ks
-from math_object import MathObject
+from math_object import MathObject, isNativeBackend
+import native_math
 
 
 class Vec2(MathObject):
@@ -16,8 +17,16 @@ class Vec2(MathObject):
         """Initializes x, y values for Vec2 object."""
 
         super(Vec2, self).__init__()
-        if ks.getRTValTypeName(x) == 'Vec2':
-            self._rtval = x
+        if ks.isRTValOfType(x, 'Vec2'):
+            if isNativeBackend():
+                self._data = [x.x.getSimpleType(), x.y.getSimpleType()]
+            else:
+                self._rtval = x
+        elif isNativeBackend():
+            if isinstance(x, Vec2):
+                self._data = list(x._getData())
+            else:
+                self._data = native_math.toFloat32List((x, y))
         else:
             self._rtval = ks.rtVal('Vec2')
             if isinstance(x, Vec2):
@@ -35,6 +44,34 @@ class Vec2(MathObject):
         return "Vec2(" + str(self.x) + "," + str(self.y) + ")"
 
 
+    def _getData(self):
+        """Returns the components of this vector.
+
+        Returns:
+            tuple: The x and y components.
+
+        """
+
+        if self._rtval is None:
+            return tuple(self._data)
+
+        return (self.x, self.y)
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this vector.
+
+        Returns:
+            object: Vec2 RTVal.
+
+        """
+
+        rtval = ks.rtVal('Vec2')
+        rtval.set('', ks.rtVal('Scalar', self._data[0]), ks.rtVal('Scalar', self._data[1]))
+
+        return rtval
+
+
     @property
     def x(self):
         """Gets x value of this vector.
@@ -44,6 +81,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[0]
+
         return self._rtval.x.getSimpleType()
 
 
@@ -59,7 +99,10 @@ class Vec2(MathObject):
 
         """
 
-        self._rtval.x = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[0] = native_math.toFloat32(value)
+        else:
+            self._rtval.x = ks.rtVal('Scalar', value)
 
         return True
 
@@ -73,6 +116,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[1]
+
         return self._rtval.y.getSimpleType()
 
 
@@ -88,7 +134,10 @@ class Vec2(MathObject):
 
         """
 
-        self._rtval.y = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[1] = native_math.toFloat32(value)
+        else:
+            self._rtval.y = ks.rtVal('Scalar', value)
 
         return True
 
@@ -120,6 +169,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec2(self)
+
         vec2 = Vec2()
         vec2.x = self.x
         vec2.y = self.y
@@ -139,12 +191,16 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data = native_math.toFloat32List((x, y))
+            return True
+
         self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y))
 
         return True
 
 
-    def setNull():
+    def setNull(self):
         """Setting all components of the vec2 to 0.0.
 
         Returns:
@@ -152,6 +208,10 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data = [0.0, 0.0]
+            return True
+
         self._rtval.setNull('')
 
         return True
@@ -168,7 +228,10 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.equal('Boolean', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecEqual(self._data, other._getData())
+
+        return self._rtval.equal('Boolean', other.getRTVal()).getSimpleType()
 
 
     def almostEqual(self, other, precision):
@@ -183,7 +246,10 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval, ks.rtVal('Scalar', precision)).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._data, other._getData(), precision)
+
+        return self._rtval.almostEqual('Boolean', other.getRTVal(), ks.rtVal('Scalar', precision)).getSimpleType()
 
 
     def almostEqual(self, other):
@@ -198,7 +264,10 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._data, other._getData())
+
+        return self._rtval.almostEqual('Boolean', other.getRTVal()).getSimpleType()
 
 
     def component(self, i):
@@ -212,6 +281,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[i]
+
         return self._rtval.component('Scalar', ks.rtVal('Size', i)).getSimpleType()
 
 
@@ -228,11 +300,14 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data[i] = native_math.toFloat32(v)
+            return
+
         self._rtval.setComponent('', ks.rtVal('Size', i),
                                         ks.rtVal('Scalar', v))
 
 
-
     def add(self, other):
         """Overload method for the add operator.
 
@@ -244,7 +319,10 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.add('Vec2', other._rtval))
+        if self._rtval is None:
+            return Vec2(*native_math.vecAdd(self._data, other._getData()))
+
+        return Vec2(self._rtval.add('Vec2', other.getRTVal()))
 
 
     def subtract(self, other):
@@ -258,7 +336,10 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.subtract('Vec2', other._rtval))
+        if self._rtval is None:
+            return Vec2(*native_math.vecSubtract(self._data, other._getData()))
+
+        return Vec2(self._rtval.subtract('Vec2', other.getRTVal()))
 
 
     def multiply(self, other):
@@ -272,7 +353,10 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.multiply('Vec2', other._rtval))
+        if self._rtval is None:
+            return Vec2(*native_math.vecMultiply(self._data, other._getData()))
+
+        return Vec2(self._rtval.multiply('Vec2', other.getRTVal()))
 
 
     def divide(self, other):
@@ -286,7 +370,10 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.divide('Vec2', other._rtval))
+        if self._rtval is None:
+            return Vec2(*native_math.vecDivide(self._data, other._getData()))
+
+        return Vec2(self._rtval.divide('Vec2', other.getRTVal()))
 
 
     def multiplyScalar(self, other):
@@ -300,6 +387,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec2(*native_math.vecMultiplyScalar(self._data, other))
+
         return Vec2(self._rtval.multiplyScalar('Vec2', ks.rtVal('Scalar', other)))
 
 
@@ -314,6 +404,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec2(*native_math.vecDivideScalar(self._data, other))
+
         return Vec2(self._rtval.divideScalar('Vec2', ks.rtVal('Scalar', other)))
 
 
@@ -325,6 +418,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec2(*native_math.vecNegate(self._data))
+
         return Vec2(self._rtval.negate('Vec2'))
 
 
@@ -336,6 +432,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec2(*native_math.vecInverse(self._data))
+
         return Vec2(self._rtval.inverse('Vec2'))
 
 
@@ -350,7 +449,10 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.dot('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDot(self._data, other._getData()))
+
+        return self._rtval.dot('Scalar', other.getRTVal()).getSimpleType()
 
 
     def cross(self, other):
@@ -360,11 +462,14 @@ class Vec2(MathObject):
             other (Vec2): Other vector.
 
         Returns:
-            Vec2: Dot product.
+            float: Cross product.
 
         """
 
-        return Vec2(self._rtval.cross('Vec2', other._rtval))
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vec2Cross(self._data, other._getData()))
+
+        return self._rtval.cross('Scalar', other.getRTVal()).getSimpleType()
 
 
     def lengthSquared(self):
@@ -375,6 +480,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecLengthSquared(self._data))
+
         return self._rtval.lengthSquared('Scalar').getSimpleType()
 
 
@@ -386,6 +494,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecLength(self._data))
+
         return self._rtval.length('Scalar').getSimpleType()
 
 
@@ -397,6 +508,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec2(*native_math.vecUnit(self._data))
+
         return Vec2(self._rtval.unit('Vec2'))
 
 
@@ -409,6 +523,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec2(*native_math.vecUnitSafe(self._data))
+
         return Vec2(self._rtval.unit_safe('Vec2'))
 
 
@@ -421,6 +538,11 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            length = native_math.toFloat32(native_math.vecLength(self._data))
+            self._data = native_math.toFloat32List(native_math.vecUnit(self._data))
+            return length
+
         return self._rtval.setUnit('Scalar').getSimpleType()
 
 
@@ -432,6 +554,9 @@ class Vec2(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self.setUnit()
+
         return self._rtval.normalize('Scalar').getSimpleType()
 
 
@@ -447,7 +572,10 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.clamp('Vec2', min._rtval, max._rtval))
+        if self._rtval is None:
+            return Vec2(*native_math.vecClamp(self._data, min._getData(), max._getData()))
+
+        return Vec2(self._rtval.clamp('Vec2', min.getRTVal(), max.getRTVal()))
 
 
     def unitsAngleTo(self, other):
@@ -462,7 +590,10 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.unitsAngleTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecUnitsAngleTo(self._data, other._getData()))
+
+        return self._rtval.unitsAngleTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     def angleTo(self, other):
@@ -476,7 +607,10 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.angleTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecAngleTo(self._data, other._getData()))
+
+        return self._rtval.angleTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     # Returns the distance of this vector to another one
@@ -491,7 +625,10 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.distanceTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceTo(self._data, other._getData()))
+
+        return self._rtval.distanceTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     def linearInterpolate(self, other, t):
@@ -507,7 +644,10 @@ class Vec2(MathObject):
 
         """
 
-        return Vec2(self._rtval.linearInterpolate('Vec2', ks.rtVal('Scalar', t)))
+        if self._rtval is None:
+            return Vec2(*native_math.vecLinearInterpolate(self._data, other._getData(), t))
+
+        return Vec2(self._rtval.linearInterpolate('Vec2', other.getRTVal(), ks.rtVal('Scalar', t)))
 
 
     def distanceToLine(self, lineP0, lineP1):
@@ -523,7 +663,10 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.distanceToLine('Scalar', lineP0._rtval, lineP1._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceToLine(self._data, lineP0._getData(), lineP1._getData()))
+
+        return self._rtval.distanceToLine('Scalar', lineP0.getRTVal(), lineP1.getRTVal()).getSimpleType()
 
 
     def distanceToSegment(self, segmentP0, segmentP1):
@@ -539,4 +682,7 @@ class Vec2(MathObject):
 
         """
 
-        return self._rtval.distanceToSegment('Scalar', segmentP0._rtval, segmentP1._rtval).getSimpleType()
\ No newline at end of file
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceToSegment(self._data, segmentP0._getData(), segmentP1._getData()))
+
+        return self._rtval.distanceToSegment('Scalar', segmentP0.getRTVal(), segmentP1.getRTVal()).getSimpleType()
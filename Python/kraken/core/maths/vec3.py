@@ -6,7 +6,8 @@ Vec3 -- Vector 3 object.
 
 import math
 from kraken.core.kraken_system import ks
-from math_object import MathObject
+from math_object import MathObject, isNativeBackend
+import native_math
 
 
 class Vec3(MathObject):
@@ -16,8 +17,16 @@ class Vec3(MathObject):
         """Initializes x, y, z values for Vec3 object."""
 
         super(Vec3, self).__init__()
-        if ks.getRTValTypeName(x) == 'Vec3':
-            self._rtval = x
+        if ks.isRTValOfType(x, 'Vec3'):
+            if isNativeBackend():
+                self._data = [x.x.getSimpleType(), x.y.getSimpleType(), x.z.getSimpleType()]
+            else:
+                self._rtval = x
+        elif isNativeBackend():
+            if isinstance(x, Vec3):
+                self._data = list(x._getData())
+            else:
+                self._data = native_math.toFloat32List((x, y, z))
         else:
             self._rtval = ks.rtVal('Vec3')
             if isinstance(x, Vec3):
@@ -37,6 +46,54 @@ class Vec3(MathObject):
         return "Vec3(" + str(self.x) + "," + str(self.y) + "," + str(self.z) + ")"
 
 
+    def _getData(self):
+        """Returns the components of this vector.
+
+        Returns:
+            tuple: The x, y and z components.
+
+        """
+
+        if self._rtval is None:
+            return tuple(self._data)
+
+        return (self.x, self.y, self.z)
+
+
+    @classmethod
+    def _fromStorage(cls, data):
+        """Constructs a native vector using the given list as its storage.
+
+        Args:
+            data (list): List or SequenceView of 3 floats.
+
+        Returns:
+            Vec3: Vector sharing its values with the storage.
+
+        """
+
+        vec = cls.__new__(cls)
+        MathObject.__init__(vec)
+        vec._data = data
+
+        return vec
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this vector.
+
+        Returns:
+            object: Vec3 RTVal.
+
+        """
+
+        rtval = ks.rtVal('Vec3')
+        rtval.set('', ks.rtVal('Scalar', self._data[0]), ks.rtVal('Scalar', self._data[1]),
+                  ks.rtVal('Scalar', self._data[2]))
+
+        return rtval
+
+
     @property
     def x(self):
         """Gets x value of this vector.
@@ -46,6 +103,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[0]
+
         return self._rtval.x.getSimpleType()
 
 
@@ -61,7 +121,10 @@ class Vec3(MathObject):
 
         """
 
-        self._rtval.x = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[0] = native_math.toFloat32(value)
+        else:
+            self._rtval.x = ks.rtVal('Scalar', value)
 
         return True
 
@@ -75,6 +138,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[1]
+
         return self._rtval.y.getSimpleType()
 
 
@@ -90,7 +156,10 @@ class Vec3(MathObject):
 
         """
 
-        self._rtval.y = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[1] = native_math.toFloat32(value)
+        else:
+            self._rtval.y = ks.rtVal('Scalar', value)
 
 
     @property
@@ -102,6 +171,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[2]
+
         return self._rtval.z.getSimpleType()
 
 
@@ -117,7 +189,10 @@ class Vec3(MathObject):
 
         """
 
-        self._rtval.z = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[2] = native_math.toFloat32(value)
+        else:
+            self._rtval.z = ks.rtVal('Scalar', value)
 
         return True
 
@@ -149,6 +224,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(self)
+
         vec3 = Vec3()
         vec3.x = self.x
         vec3.y = self.y
@@ -170,12 +248,16 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data[:] = native_math.toFloat32List((x, y, z))
+            return True
+
         self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y), ks.rtVal('Scalar', z))
 
         return True
 
 
-    def setNull():
+    def setNull(self):
         """Setting all components of the vec3 to 0.0.
 
         Returns:
@@ -183,6 +265,10 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data[:] = [0.0, 0.0, 0.0]
+            return True
+
         self._rtval.setNull('')
 
         return True
@@ -199,7 +285,10 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.equal('Boolean', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecEqual(self._data, other._getData())
+
+        return self._rtval.equal('Boolean', other.getRTVal()).getSimpleType()
 
 
     def almostEqual(self, other, precision):
@@ -214,7 +303,10 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval, ks.rtVal('Scalar', precision)).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._data, other._getData(), precision)
+
+        return self._rtval.almostEqual('Boolean', other.getRTVal(), ks.rtVal('Scalar', precision)).getSimpleType()
 
 
     def almostEqual(self, other):
@@ -229,7 +321,10 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._data, other._getData())
+
+        return self._rtval.almostEqual('Boolean', other.getRTVal()).getSimpleType()
 
 
     def component(self, i):
@@ -243,6 +338,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[i]
+
         return self._rtval.component('Scalar', ks.rtVal('Size', i)).getSimpleType()
 
 
@@ -259,6 +357,10 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data[i] = native_math.toFloat32(v)
+            return
+
         self._rtval.setComponent('', ks.rtVal('Size', i),
                                         ks.rtVal('Scalar', v))
 
@@ -274,7 +376,10 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.add('Vec3', other._rtval))
+        if self._rtval is None:
+            return Vec3(*native_math.vecAdd(self._data, other._getData()))
+
+        return Vec3(self._rtval.add('Vec3', other.getRTVal()))
 
 
     def subtract(self, other):
@@ -288,7 +393,10 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.subtract('Vec3', other._rtval))
+        if self._rtval is None:
+            return Vec3(*native_math.vecSubtract(self._data, other._getData()))
+
+        return Vec3(self._rtval.subtract('Vec3', other.getRTVal()))
 
 
     def multiply(self, other):
@@ -302,7 +410,10 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.multiply('Vec3', other._rtval))
+        if self._rtval is None:
+            return Vec3(*native_math.vecMultiply(self._data, other._getData()))
+
+        return Vec3(self._rtval.multiply('Vec3', other.getRTVal()))
 
 
     def divide(self, other):
@@ -316,7 +427,10 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.divide('Vec3', other._rtval))
+        if self._rtval is None:
+            return Vec3(*native_math.vecDivide(self._data, other._getData()))
+
+        return Vec3(self._rtval.divide('Vec3', other.getRTVal()))
 
 
     def multiplyScalar(self, other):
@@ -330,6 +444,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.vecMultiplyScalar(self._data, other))
+
         return Vec3(self._rtval.multiplyScalar('Vec3', ks.rtVal('Scalar', other)))
 
 
@@ -344,6 +461,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.vecDivideScalar(self._data, other))
+
         return Vec3(self._rtval.divideScalar('Vec3', ks.rtVal('Scalar', other)))
 
 
@@ -355,6 +475,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.vecNegate(self._data))
+
         return Vec3(self._rtval.negate('Vec3'))
 
 
@@ -366,6 +489,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.vecInverse(self._data))
+
         return Vec3(self._rtval.inverse('Vec3'))
 
 
@@ -380,7 +506,10 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.dot('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDot(self._data, other._getData()))
+
+        return self._rtval.dot('Scalar', other.getRTVal()).getSimpleType()
 
 
     def cross(self, other):
@@ -394,7 +523,10 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.cross('Vec3', other._rtval))
+        if self._rtval is None:
+            return Vec3(*native_math.vec3Cross(self._data, other._getData()))
+
+        return Vec3(self._rtval.cross('Vec3', other.getRTVal()))
 
 
     def lengthSquared(self):
@@ -405,6 +537,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecLengthSquared(self._data))
+
         return self._rtval.lengthSquared('Scalar').getSimpleType()
 
 
@@ -416,6 +551,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecLength(self._data))
+
         return self._rtval.length('Scalar').getSimpleType()
 
 
@@ -427,6 +565,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.vecUnit(self._data))
+
         return Vec3(self._rtval.unit('Vec3'))
 
 
@@ -439,6 +580,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.vecUnitSafe(self._data))
+
         return Vec3(self._rtval.unit_safe('Vec3'))
 
 
@@ -451,6 +595,11 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            length = native_math.toFloat32(native_math.vecLength(self._data))
+            self._data[:] = native_math.toFloat32List(native_math.vecUnit(self._data))
+            return length
+
         return self._rtval.setUnit('Scalar').getSimpleType()
 
 
@@ -462,6 +611,9 @@ class Vec3(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self.setUnit()
+
         return self._rtval.normalize('Scalar').getSimpleType()
 
 
@@ -477,7 +629,10 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.clamp('Vec3', min._rtval, max._rtval))
+        if self._rtval is None:
+            return Vec3(*native_math.vecClamp(self._data, min._getData(), max._getData()))
+
+        return Vec3(self._rtval.clamp('Vec3', min.getRTVal(), max.getRTVal()))
 
 
     def unitsAngleTo(self, other):
@@ -492,7 +647,10 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.unitsAngleTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecUnitsAngleTo(self._data, other._getData()))
+
+        return self._rtval.unitsAngleTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     def angleTo(self, other):
@@ -506,7 +664,10 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.angleTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecAngleTo(self._data, other._getData()))
+
+        return self._rtval.angleTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     # Returns the distance of this vector to another one
@@ -521,7 +682,10 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.distanceTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceTo(self._data, other._getData()))
+
+        return self._rtval.distanceTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     def linearInterpolate(self, other, t):
@@ -537,7 +701,10 @@ class Vec3(MathObject):
 
         """
 
-        return Vec3(self._rtval.linearInterpolate('Vec3', ks.rtVal('Scalar', t)))
+        if self._rtval is None:
+            return Vec3(*native_math.vecLinearInterpolate(self._data, other._getData(), t))
+
+        return Vec3(self._rtval.linearInterpolate('Vec3', other.getRTVal(), ks.rtVal('Scalar', t)))
 
 
     def distanceToLine(self, lineP0, lineP1):
@@ -553,7 +720,10 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.distanceToLine('Scalar', lineP0._rtval, lineP1._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceToLine(self._data, lineP0._getData(), lineP1._getData()))
+
+        return self._rtval.distanceToLine('Scalar', lineP0.getRTVal(), lineP1.getRTVal()).getSimpleType()
 
 
     def distanceToSegment(self, segmentP0, segmentP1):
@@ -569,4 +739,7 @@ class Vec3(MathObject):
 
         """
 
-        return self._rtval.distanceToSegment('Scalar', segmentP0._rtval, segmentP1._rtval).getSimpleType()
\ No newline at end of file
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceToSegment(self._data, segmentP0._getData(), segmentP1._getData()))
+
+        return self._rtval.distanceToSegment('Scalar', segmentP0.getRTVal(), segmentP1.getRTVal()).getSimpleType()
@@ -0,0 +1,310 @@
+"""Kraken - maths.vec3_array module.
+
+Classes:
+Vec3Array -- Array of Vector 3 objects.
+"""
+
+from kraken.core.kraken_system import ks
+from vec3 import Vec3
+import native_math
+
+
+class Vec3Array(object):
+    """Array of Vector 3 objects.
+
+    The components of all vectors are stored in a single flat list of floats
+    (x0, y0, z0, x1, y1, z1, ...) so that operations on the whole array are
+    computed in a single call instead of once per Vec3. Indexing the array
+    returns a native Vec3 that shares its values with the array.
+
+    """
+
+    def __init__(self, values=None):
+        """Initializes the array from a list of Vec3 objects.
+
+        Args:
+            values (list): Vec3 objects or (x, y, z) tuples to fill the array with.
+
+        """
+
+        super(Vec3Array, self).__init__()
+        self._data = []
+
+        if values is not None:
+            for value in values:
+                self.append(value)
+
+
+    def __str__(self):
+        """String representation of the Vec3Array object.
+
+        Returns:
+            str: String representation of the Vec3Array object.
+
+        """
+
+        return "Vec3Array(" + ",".join([str(x) for x in self]) + ")"
+
+
+    @classmethod
+    def _fromStorage(cls, data):
+        """Constructs an array using the given list as its storage.
+
+        Args:
+            data (list): Flat list of the vector components.
+
+        Returns:
+            Vec3Array: Array sharing its values with the storage.
+
+        """
+
+        array = cls.__new__(cls)
+        array._data = data
+
+        return array
+
+
+    def _getItems(self):
+        """Returns the vectors of this array as tuples.
+
+        Returns:
+            list: The (x, y, z) tuples of the vectors.
+
+        """
+
+        data = self._data
+        return [tuple(data[i:i + 3]) for i in xrange(0, len(data), 3)]
+
+
+    def _getOperands(self, other):
+        """Returns the values to combine with each vector of this array.
+
+        Args:
+            other (Vec3Array, Vec3): Array of the same size, or a single vector
+                used for every element.
+
+        Returns:
+            list: The (x, y, z) tuples.
+
+        """
+
+        if isinstance(other, Vec3Array):
+            if len(other) != len(self):
+                raise ValueError("Vec3Array sizes do not match: " + str(len(self)) + " != " + str(len(other)))
+
+            return other._getItems()
+
+        return [other._getData()] * len(self)
+
+
+    @classmethod
+    def _fromItems(cls, items):
+        """Constructs an array from a list of tuples.
+
+        Args:
+            items (list): The (x, y, z) tuples of the vectors.
+
+        Returns:
+            Vec3Array: New array.
+
+        """
+
+        data = []
+        for item in items:
+            data.extend(item)
+
+        return cls._fromStorage(native_math.toFloat32List(data))
+
+
+    def __len__(self):
+        return len(self._data) // 3
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("Vec3Array index out of range")
+
+        return Vec3._fromStorage(native_math.SequenceView(self._data, index * 3, 3))
+
+    def __setitem__(self, index, value):
+        self[index].set(*value._getData())
+
+
+    def append(self, value):
+        """Appends a vector to the end of this array.
+
+        Args:
+            value (Vec3, tuple): Vector to append.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if isinstance(value, Vec3):
+            value = value._getData()
+
+        self._data.extend(native_math.toFloat32List(value))
+
+        return True
+
+
+    def resize(self, size):
+        """Resizes this array, new vectors are set to 0.0.
+
+        Args:
+            size (int): The new number of vectors.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        count = size * 3
+        if count < len(self._data):
+            del self._data[count:]
+        else:
+            self._data.extend([0.0] * (count - len(self._data)))
+
+        return True
+
+
+    def clone(self):
+        """Returns a clone of the Vec3Array.
+
+        Returns:
+            Vec3Array: The cloned Vec3Array.
+
+        """
+
+        return Vec3Array._fromStorage(list(self._data))
+
+
+    def toList(self):
+        """Returns the vectors of this array as independent Vec3 objects.
+
+        Returns:
+            list: The Vec3 objects.
+
+        """
+
+        return [Vec3(x) for x in self]
+
+
+    def getRTVal(self):
+        """Constructs a 'Vec3[]' RTVal from the values of this array.
+
+        Returns:
+            object: Vec3[] RTVal.
+
+        """
+
+        rtval = ks.rtVal('Vec3[]')
+        rtval.resize(len(self))
+        for i, vec in enumerate(self):
+            rtval[i] = vec.getRTVal()
+
+        return rtval
+
+
+    def add(self, other):
+        """Adds a vector, or the vectors of another array, to all vectors.
+
+        Args:
+            other (Vec3Array, Vec3): Vectors to add.
+
+        Returns:
+            Vec3Array: New array of the sums.
+
+        """
+
+        return Vec3Array._fromItems([native_math.vecAdd(a, b) for a, b in
+                                     zip(self._getItems(), self._getOperands(other))])
+
+
+    def subtract(self, other):
+        """Subtracts a vector, or the vectors of another array, from all vectors.
+
+        Args:
+            other (Vec3Array, Vec3): Vectors to subtract.
+
+        Returns:
+            Vec3Array: New array of the differences.
+
+        """
+
+        return Vec3Array._fromItems([native_math.vecSubtract(a, b) for a, b in
+                                     zip(self._getItems(), self._getOperands(other))])
+
+
+    def multiplyScalar(self, other):
+        """Multiplies all vectors by a scalar.
+
+        Args:
+            other (float): Scalar value to multiply the vectors by.
+
+        Returns:
+            Vec3Array: New array of the products.
+
+        """
+
+        return Vec3Array._fromStorage(native_math.toFloat32List([x * other for x in self._data]))
+
+
+    def cross(self, other):
+        """Gets the cross products of all vectors with a vector, or with the
+        vectors of another array.
+
+        Args:
+            other (Vec3Array, Vec3): Vectors on the right side of the cross product.
+
+        Returns:
+            Vec3Array: New array of the cross products.
+
+        """
+
+        return Vec3Array._fromItems([native_math.vec3Cross(a, b) for a, b in
+                                     zip(self._getItems(), self._getOperands(other))])
+
+
+    def unit(self):
+        """Gets the unit vectors of all vectors, no error reported for vectors
+        that cannot be made unit.
+
+        Returns:
+            Vec3Array: New array of unit vectors.
+
+        """
+
+        return Vec3Array._fromItems([native_math.vecUnitSafe(x) for x in self._getItems()])
+
+
+    def lengths(self):
+        """Gets the lengths of all vectors.
+
+        Returns:
+            list: The lengths of the vectors.
+
+        """
+
+        return native_math.toFloat32List([native_math.vecLength(x) for x in self._getItems()])
+
+
+    def deltas(self):
+        """Gets the vectors between consecutive vectors of this array, for
+        example the bone vectors of a chain of positions.
+
+        Returns:
+            Vec3Array: New array with one vector less than this one.
+
+        """
+
+        items = self._getItems()
+
+        return Vec3Array._fromItems([native_math.vecSubtract(b, a) for a, b in zip(items[:-1], items[1:])])
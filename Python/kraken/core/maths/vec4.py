@@ -6,7 +6,8 @@ Vec4 -- Vector 4 object.
 
 import math
 from kraken.core.kraken_system import ks
-from math_object import MathObject
+from math_object import MathObject, isNativeBackend
+import native_math
 
 
 class Vec4(MathObject):
@@ -16,12 +17,21 @@ class Vec4(MathObject):
         """Initializes x, y z and t values for Vec4 object."""
 
         super(Vec4, self).__init__()
-        if ks.getRTValTypeName(x) == 'Vec4':
-            self._rtval = x
+        if ks.isRTValOfType(x, 'Vec4'):
+            if isNativeBackend():
+                self._data = [x.x.getSimpleType(), x.y.getSimpleType(),
+                              x.z.getSimpleType(), x.t.getSimpleType()]
+            else:
+                self._rtval = x
+        elif isNativeBackend():
+            if isinstance(x, Vec4):
+                self._data = list(x._getData())
+            else:
+                self._data = native_math.toFloat32List((x, y, z, t))
         else:
             self._rtval = ks.rtVal('Vec4')
             if isinstance(x, Vec4):
-                self.set(x=x.x, y=x.y, z=x.z, t=x.z)
+                self.set(x=x.x, y=x.y, z=x.z, t=x.t)
             else:
                 self.set(x=x, y=y, z=z, t=t)
 
@@ -41,6 +51,35 @@ class Vec4(MathObject):
         return stringRep
 
 
+    def _getData(self):
+        """Returns the components of this vector.
+
+        Returns:
+            tuple: The x, y, z and t components.
+
+        """
+
+        if self._rtval is None:
+            return tuple(self._data)
+
+        return (self.x, self.y, self.z, self.t)
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this vector.
+
+        Returns:
+            object: Vec4 RTVal.
+
+        """
+
+        rtval = ks.rtVal('Vec4')
+        rtval.set('', ks.rtVal('Scalar', self._data[0]), ks.rtVal('Scalar', self._data[1]),
+                  ks.rtVal('Scalar', self._data[2]), ks.rtVal('Scalar', self._data[3]))
+
+        return rtval
+
+
     @property
     def x(self):
         """Gets x value of this vector.
@@ -50,6 +89,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[0]
+
         return self._rtval.x.getSimpleType()
 
 
@@ -65,7 +107,10 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.x = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[0] = native_math.toFloat32(value)
+        else:
+            self._rtval.x = ks.rtVal('Scalar', value)
 
         return True
 
@@ -79,6 +124,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[1]
+
         return self._rtval.y.getSimpleType()
 
 
@@ -94,7 +142,10 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.y = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[1] = native_math.toFloat32(value)
+        else:
+            self._rtval.y = ks.rtVal('Scalar', value)
 
         return True
 
@@ -108,6 +159,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[2]
+
         return self._rtval.z.getSimpleType()
 
 
@@ -123,7 +177,10 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.z = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[2] = native_math.toFloat32(value)
+        else:
+            self._rtval.z = ks.rtVal('Scalar', value)
 
         return True
 
@@ -137,6 +194,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[3]
+
         return self._rtval.t.getSimpleType()
 
 
@@ -152,7 +212,10 @@ class Vec4(MathObject):
 
         """
 
-        self._rtval.t = ks.rtVal('Scalar', value)
+        if self._rtval is None:
+            self._data[3] = native_math.toFloat32(value)
+        else:
+            self._rtval.t = ks.rtVal('Scalar', value)
 
 
     def __eq__(self, other):
@@ -181,6 +244,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec4(self)
+
         vec4 = Vec4()
         vec4.x = self.x
         vec4.y = self.y
@@ -203,13 +269,17 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data = native_math.toFloat32List((x, y, z, t))
+            return True
+
         self._rtval.set('', ks.rtVal('Scalar', x), ks.rtVal('Scalar', y),
                         ks.rtVal('Scalar', z), ks.rtVal('Scalar', t))
 
         return True
 
 
-    def setNull():
+    def setNull(self):
         """Setting all components of the vec4 to 0.0.
 
         Returns:
@@ -217,6 +287,10 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data = [0.0, 0.0, 0.0, 0.0]
+            return True
+
         self._rtval.setNull('')
 
         return True
@@ -233,7 +307,10 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.equal('Boolean', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecEqual(self._data, other._getData())
+
+        return self._rtval.equal('Boolean', other.getRTVal()).getSimpleType()
 
 
     def almostEqual(self, other, precision):
@@ -248,7 +325,10 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval,
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._data, other._getData(), precision)
+
+        return self._rtval.almostEqual('Boolean', other.getRTVal(),
                                        ks.rtVal('Scalar', precision)).getSimpleType()
 
 
@@ -264,7 +344,10 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.almostEqual('Boolean', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.vecAlmostEqual(self._data, other._getData())
+
+        return self._rtval.almostEqual('Boolean', other.getRTVal()).getSimpleType()
 
 
     def component(self, i ):
@@ -278,6 +361,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._data[i]
+
         return self._rtval.component('Scalar', ks.rtVal('Size', i)).getSimpleType()
 
 
@@ -293,6 +379,10 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._data[i] = native_math.toFloat32(v)
+            return
+
         self._rtval.setComponent('', ks.rtVal('Size', i),
                                         ks.rtVal('Scalar', v))
 
@@ -308,7 +398,10 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.add('Vec4', other._rtval))
+        if self._rtval is None:
+            return Vec4(*native_math.vecAdd(self._data, other._getData()))
+
+        return Vec4(self._rtval.add('Vec4', other.getRTVal()))
 
 
     def subtract(self, other):
@@ -322,7 +415,10 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.subtract('Vec4', other._rtval))
+        if self._rtval is None:
+            return Vec4(*native_math.vecSubtract(self._data, other._getData()))
+
+        return Vec4(self._rtval.subtract('Vec4', other.getRTVal()))
 
 
     def multiply(self, other):
@@ -336,7 +432,10 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.multiply('Vec4', other._rtval))
+        if self._rtval is None:
+            return Vec4(*native_math.vecMultiply(self._data, other._getData()))
+
+        return Vec4(self._rtval.multiply('Vec4', other.getRTVal()))
 
 
     def divide(self, other):
@@ -350,7 +449,10 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.divide('Vec4', other._rtval))
+        if self._rtval is None:
+            return Vec4(*native_math.vecDivide(self._data, other._getData()))
+
+        return Vec4(self._rtval.divide('Vec4', other.getRTVal()))
 
 
     def multiplyScalar(self, other):
@@ -364,6 +466,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec4(*native_math.vecMultiplyScalar(self._data, other))
+
         return Vec4(self._rtval.multiplyScalar('Vec4', ks.rtVal('Scalar', other)))
 
 
@@ -378,6 +483,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec4(*native_math.vecDivideScalar(self._data, other))
+
         return Vec4(self._rtval.divideScalar('Vec4', ks.rtVal('Scalar', other)))
 
 
@@ -389,6 +497,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec4(*native_math.vecNegate(self._data))
+
         return Vec4(self._rtval.negate('Vec4'))
 
 
@@ -400,6 +511,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec4(*native_math.vecInverse(self._data))
+
         return Vec4(self._rtval.inverse('Vec4'))
 
 
@@ -414,7 +528,10 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.dot('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDot(self._data, other._getData()))
+
+        return self._rtval.dot('Scalar', other.getRTVal()).getSimpleType()
 
 
     def cross(self, other):
@@ -428,7 +545,10 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.cross('Vec4', other._rtval))
+        if self._rtval is None:
+            return Vec4(self._buildRTVal().cross('Vec4', other.getRTVal()))
+
+        return Vec4(self._rtval.cross('Vec4', other.getRTVal()))
 
 
     def lengthSquared(self):
@@ -439,6 +559,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecLengthSquared(self._data))
+
         return self._rtval.lengthSquared('Scalar').getSimpleType()
 
 
@@ -450,6 +573,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecLength(self._data))
+
         return self._rtval.length('Scalar').getSimpleType()
 
 
@@ -461,6 +587,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec4(*native_math.vecUnit(self._data))
+
         return Vec4(self._rtval.unit('Vec4'))
 
 
@@ -473,6 +602,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec4(*native_math.vecUnitSafe(self._data))
+
         return Vec4(self._rtval.unit_safe('Vec4'))
 
 
@@ -485,6 +617,11 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            length = native_math.toFloat32(native_math.vecLength(self._data))
+            self._data = native_math.toFloat32List(native_math.vecUnit(self._data))
+            return length
+
         return self._rtval.setUnit('Scalar').getSimpleType()
 
 
@@ -496,6 +633,9 @@ class Vec4(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self.setUnit()
+
         return self._rtval.normalize('Scalar').getSimpleType()
 
 
@@ -511,7 +651,10 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.clamp('Vec4', min._rtval, max._rtval))
+        if self._rtval is None:
+            return Vec4(*native_math.vecClamp(self._data, min._getData(), max._getData()))
+
+        return Vec4(self._rtval.clamp('Vec4', min.getRTVal(), max.getRTVal()))
 
 
     def unitsAngleTo(self, other):
@@ -526,7 +669,10 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.unitsAngleTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecUnitsAngleTo(self._data, other._getData()))
+
+        return self._rtval.unitsAngleTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     def angleTo(self, other):
@@ -540,7 +686,10 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.angleTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecAngleTo(self._data, other._getData()))
+
+        return self._rtval.angleTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     # Returns the distance of this vector to another one
@@ -555,7 +704,10 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.distanceTo('Scalar', other._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceTo(self._data, other._getData()))
+
+        return self._rtval.distanceTo('Scalar', other.getRTVal()).getSimpleType()
 
 
     def linearInterpolate(self, other, t):
@@ -571,7 +723,10 @@ class Vec4(MathObject):
 
         """
 
-        return Vec4(self._rtval.linearInterpolate('Vec4', ks.rtVal('Scalar', t)))
+        if self._rtval is None:
+            return Vec4(*native_math.vecLinearInterpolate(self._data, other._getData(), t))
+
+        return Vec4(self._rtval.linearInterpolate('Vec4', other.getRTVal(), ks.rtVal('Scalar', t)))
 
 
     def distanceToLine(self, lineP0, lineP1):
@@ -587,7 +742,10 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.distanceToLine('Scalar', lineP0._rtval, lineP1._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceToLine(self._data, lineP0._getData(), lineP1._getData()))
+
+        return self._rtval.distanceToLine('Scalar', lineP0.getRTVal(), lineP1.getRTVal()).getSimpleType()
 
 
     def distanceToSegment(self, segmentP0, segmentP1):
@@ -603,4 +761,7 @@ class Vec4(MathObject):
 
         """
 
-        return self._rtval.distanceToSegment('Scalar', segmentP0._rtval, segmentP1._rtval).getSimpleType()
+        if self._rtval is None:
+            return native_math.toFloat32(native_math.vecDistanceToSegment(self._data, segmentP0._getData(), segmentP1._getData()))
+
+        return self._rtval.distanceToSegment('Scalar', segmentP0.getRTVal(), segmentP1.getRTVal()).getSimpleType()
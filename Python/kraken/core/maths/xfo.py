@@ -4,7 +4,8 @@ Classes:
 Xfo -- Transform.
 """
 
-from math_object import MathObject
+from math_object import MathObject, isNativeBackend
+import native_math
 from kraken.core.kraken_system import ks
 from vec3 import Vec3
 from quat import Quat
@@ -19,10 +20,21 @@ class Xfo(MathObject):
         """Initializes tr, ori and sc values for Xfo object."""
 
         super(Xfo, self).__init__()
-        if ks.getRTValTypeName(tr) == 'Xfo':
-            self._rtval = tr
+        if ks.isRTValOfType(tr, 'Xfo'):
+            if isNativeBackend():
+                self._tr = Vec3(tr.tr)
+                self._ori = Quat(tr.ori)
+                self._sc = Vec3(tr.sc)
+            else:
+                self._rtval = tr
         else:
-            self._rtval = ks.rtVal('Xfo')
+            if isNativeBackend():
+                self._tr = Vec3()
+                self._ori = Quat()
+                self._sc = Vec3(1.0, 1.0, 1.0)
+            else:
+                self._rtval = ks.rtVal('Xfo')
+
             if isinstance(tr, Xfo):
                 self.set(tr=tr.tr, ori=tr.ori, sc=tr.sc)
             else:
@@ -49,6 +61,73 @@ class Xfo(MathObject):
         return stringRep
 
 
+    def _getData(self):
+        """Returns the components of this transform.
+
+        Returns:
+            tuple: The translation, orientation and scaling tuples.
+
+        """
+
+        return (self.tr._getData(), self.ori._getData(), self.sc._getData())
+
+
+    def _setData(self, values):
+        """Sets the components of a native transform.
+
+        Args:
+            values (tuple): The translation, orientation and scaling tuples.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._tr.set(*values[0])
+        self._ori._setData(values[1])
+        self._sc.set(*values[2])
+
+        return True
+
+
+    @classmethod
+    def _fromStorage(cls, tr, ori, sc):
+        """Constructs a native transform from native member objects without
+        copying them.
+
+        Args:
+            tr (Vec3): Native translation.
+            ori (Quat): Native orientation.
+            sc (Vec3): Native scaling.
+
+        Returns:
+            Xfo: Transform sharing its values with the members.
+
+        """
+
+        xfo = cls.__new__(cls)
+        MathObject.__init__(xfo)
+        xfo._tr = tr
+        xfo._ori = ori
+        xfo._sc = sc
+
+        return xfo
+
+
+    def _buildRTVal(self):
+        """Constructs a new RTVal from the native values of this transform.
+
+        Returns:
+            object: Xfo RTVal.
+
+        """
+
+        rtval = ks.rtVal('Xfo')
+        rtval.set('', self._tr.getRTVal(), self._ori.getRTVal(), self._sc.getRTVal())
+
+        return rtval
+
+
     @property
     def tr(self):
         """Gets translation property of this transform.
@@ -58,6 +137,9 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._tr
+
         return Vec3(self._rtval.tr)
 
 
@@ -73,7 +155,10 @@ class Xfo(MathObject):
 
         """
 
-        self._rtval.tr = ks.rtVal('Vec3', value)
+        if self._rtval is None:
+            self._tr.set(*value._getData())
+        else:
+            self._rtval.tr = ks.rtVal('Vec3', value)
 
         return True
 
@@ -87,6 +172,9 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._ori
+
         return Quat(self._rtval.ori)
 
 
@@ -102,7 +190,10 @@ class Xfo(MathObject):
 
         """
 
-        self._rtval.ori = ks.rtVal('Quat', value)
+        if self._rtval is None:
+            self._ori._setData(value._getData())
+        else:
+            self._rtval.ori = ks.rtVal('Quat', value)
 
         return True
 
@@ -116,6 +207,9 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            return self._sc
+
         return Vec3(self._rtval.sc)
 
 
@@ -131,7 +225,10 @@ class Xfo(MathObject):
 
         """
 
-        self._rtval.sc = ks.rtVal('Vec3', value)
+        if self._rtval is None:
+            self._sc.set(*value._getData())
+        else:
+            self._rtval.sc = ks.rtVal('Vec3', value)
 
         return True
 
@@ -154,6 +251,9 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Xfo(self)
+
         xfo = Xfo()
         xfo.tr = self.tr.clone()
         xfo.ori = self.ori.clone()
@@ -175,6 +275,12 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            self.tr = tr
+            self.ori = ori
+            self.sc = sc
+            return True
+
         self._rtval.set('', ks.rtVal('Vec3', tr), ks.rtVal('Quat', ori),
                         ks.rtVal('Vec3', sc))
 
@@ -189,6 +295,10 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(((0.0, 0.0, 0.0), native_math.IDENTITY_QUAT, (1.0, 1.0, 1.0)))
+            return True
+
         self._rtval.setIdentity('')
 
         return True
@@ -205,6 +315,10 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            self._setData(native_math.xfoFromMat44(m._getData()))
+            return Xfo(self)
+
         return Xfo(self._rtval.setFromMat44('Xfo', ks.rtVal('Mat44', m)))
 
 
@@ -216,6 +330,11 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            mat = Mat44()
+            mat._setData(native_math.xfoToMat44(self._getData()))
+            return mat
+
         return Mat44(self._rtval.toMat44('Mat44'))
 
 
@@ -230,6 +349,11 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            result = Xfo()
+            result._setData(native_math.xfoMultiply(self._getData(), xfo._getData()))
+            return result
+
         return Xfo(self._rtval.multiply('Xfo', ks.rtVal('Xfo', xfo)))
 
 
@@ -244,6 +368,9 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.xfoTransformVector(self._getData(), v._getData()))
+
         return Vec3(self._rtval.transformVector('Vec3', ks.rtVal('Vec3', v)))
 
 
@@ -270,6 +397,11 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            xfo = Xfo()
+            xfo._setData(native_math.xfoInverse(self._getData()))
+            return xfo
+
         return Xfo(self._rtval.inverse('Xfo'))
 
 
@@ -287,6 +419,9 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            return Vec3(*native_math.xfoInverseTransformVector(self._getData(), vec._getData()))
+
         return Vec3(self._rtval.inverseTransformVector('Vec3', ks.rtVal('Vec3', vec)))
 
 
@@ -303,6 +438,11 @@ class Xfo(MathObject):
 
         """
 
+        if self._rtval is None:
+            xfo = Xfo()
+            xfo._setData(native_math.xfoLinearInterpolate(self._getData(), other._getData(), t))
+            return xfo
+
         return Xfo(self._rtval.linearInterpolate('Xfo', ks.rtVal('Xfo', other),
                                                  ks.rtVal('Scalar', t)))
 
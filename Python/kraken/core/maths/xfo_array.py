@@ -0,0 +1,415 @@
+"""Kraken - maths.xfo_array module.
+
+Classes:
+XfoArray -- Array of Transform objects.
+"""
+
+from kraken.core.kraken_system import ks
+from vec3 import Vec3
+from quat import Quat
+from xfo import Xfo
+from vec3_array import Vec3Array
+from quat_array import QuatArray
+import native_math
+
+
+class XfoArray(object):
+    """Array of Transform objects.
+
+    The transforms are stored as a structure of arrays: one flat list for the
+    translations, one for the orientations and one for the scalings. Batched
+    operations process the whole array in a single call. Indexing the array
+    returns a native Xfo that shares its values with the array.
+
+    """
+
+    def __init__(self, values=None):
+        """Initializes the array from a list of Xfo objects.
+
+        Args:
+            values (list): Xfo objects to fill the array with.
+
+        """
+
+        super(XfoArray, self).__init__()
+        self._tr = []
+        self._ori = []
+        self._sc = []
+
+        if values is not None:
+            for value in values:
+                self.append(value)
+
+
+    def __str__(self):
+        """String representation of the XfoArray object.
+
+        Returns:
+            str: String representation of the XfoArray object.
+
+        """
+
+        return "XfoArray(" + ",".join([str(x) for x in self]) + ")"
+
+
+    @property
+    def tr(self):
+        """Gets the translations of this array.
+
+        Returns:
+            Vec3Array: Translations sharing their values with this array.
+
+        """
+
+        return Vec3Array._fromStorage(self._tr)
+
+
+    @property
+    def ori(self):
+        """Gets the orientations of this array.
+
+        Returns:
+            QuatArray: Orientations sharing their values with this array.
+
+        """
+
+        return QuatArray._fromStorage(self._ori)
+
+
+    @property
+    def sc(self):
+        """Gets the scalings of this array.
+
+        Returns:
+            Vec3Array: Scalings sharing their values with this array.
+
+        """
+
+        return Vec3Array._fromStorage(self._sc)
+
+
+    def _getItems(self):
+        """Returns the transforms of this array as tuples.
+
+        Returns:
+            list: The (tr, ori, sc) tuples of the transforms.
+
+        """
+
+        return zip(self.tr._getItems(), self.ori._getItems(), self.sc._getItems())
+
+
+    def _getOperands(self, other):
+        """Returns the values to combine with each transform of this array.
+
+        Args:
+            other (XfoArray, Xfo): Array of the same size, or a single transform
+                used for every element.
+
+        Returns:
+            list: The (tr, ori, sc) tuples.
+
+        """
+
+        if isinstance(other, XfoArray):
+            if len(other) != len(self):
+                raise ValueError("XfoArray sizes do not match: " + str(len(self)) + " != " + str(len(other)))
+
+            return other._getItems()
+
+        return [other._getData()] * len(self)
+
+
+    def _setItems(self, items):
+        """Replaces the transforms of this array.
+
+        Args:
+            items (list): The (tr, ori, sc) tuples of the transforms.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        tr = []
+        ori = []
+        sc = []
+        for item in items:
+            tr.extend(item[0])
+            ori.extend(item[1])
+            sc.extend(item[2])
+
+        self._tr[:] = native_math.toFloat32List(tr)
+        self._ori[:] = native_math.toFloat32List(ori)
+        self._sc[:] = native_math.toFloat32List(sc)
+
+        return True
+
+
+    @classmethod
+    def _fromItems(cls, items):
+        """Constructs an array from a list of tuples.
+
+        Args:
+            items (list): The (tr, ori, sc) tuples of the transforms.
+
+        Returns:
+            XfoArray: New array.
+
+        """
+
+        array = cls()
+        array._setItems(items)
+
+        return array
+
+
+    def __len__(self):
+        return len(self._tr) // 3
+
+    def __iter__(self):
+        for i in xrange(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+
+        if index < 0 or index >= len(self):
+            raise IndexError("XfoArray index out of range")
+
+        return Xfo._fromStorage(
+            Vec3._fromStorage(native_math.SequenceView(self._tr, index * 3, 3)),
+            Quat._fromStorage(native_math.SequenceView(self._ori, index * 4, 4)),
+            Vec3._fromStorage(native_math.SequenceView(self._sc, index * 3, 3)))
+
+    def __setitem__(self, index, value):
+        self[index]._setData(value._getData())
+
+
+    def append(self, value):
+        """Appends a transform to the end of this array.
+
+        Args:
+            value (Xfo): Transform to append.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        tr, ori, sc = value._getData()
+        self._tr.extend(native_math.toFloat32List(tr))
+        self._ori.extend(native_math.toFloat32List(ori))
+        self._sc.extend(native_math.toFloat32List(sc))
+
+        return True
+
+
+    def resize(self, size):
+        """Resizes this array, new transforms are set to the identity.
+
+        Args:
+            size (int): The new number of transforms.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        count = len(self)
+        if size < count:
+            del self._tr[size * 3:]
+            del self._ori[size * 4:]
+            del self._sc[size * 3:]
+        else:
+            self._tr.extend([0.0, 0.0, 0.0] * (size - count))
+            self._ori.extend(list(native_math.IDENTITY_QUAT) * (size - count))
+            self._sc.extend([1.0, 1.0, 1.0] * (size - count))
+
+        return True
+
+
+    def clone(self):
+        """Returns a clone of the XfoArray.
+
+        Returns:
+            XfoArray: The cloned XfoArray.
+
+        """
+
+        array = XfoArray()
+        array._tr = list(self._tr)
+        array._ori = list(self._ori)
+        array._sc = list(self._sc)
+
+        return array
+
+
+    def toList(self):
+        """Returns the transforms of this array as independent Xfo objects.
+
+        Returns:
+            list: The Xfo objects.
+
+        """
+
+        return [Xfo(x) for x in self]
+
+
+    def getRTVal(self):
+        """Constructs a 'Xfo[]' RTVal from the values of this array.
+
+        Returns:
+            object: Xfo[] RTVal.
+
+        """
+
+        rtval = ks.rtVal('Xfo[]')
+        rtval.resize(len(self))
+        for i, xfo in enumerate(self):
+            rtval[i] = xfo.getRTVal()
+
+        return rtval
+
+
+    def multiply(self, other):
+        """Multiplies all transforms by a transform, or by the transforms of
+        another array.
+
+        Args:
+            other (XfoArray, Xfo): Transforms on the right side of the product.
+
+        Returns:
+            XfoArray: New array of the products.
+
+        """
+
+        return XfoArray._fromItems([native_math.xfoMultiply(a, b) for a, b in
+                                    zip(self._getItems(), self._getOperands(other))])
+
+
+    def preMultiply(self, other):
+        """Multiplies a transform, or the transforms of another array, by all
+        transforms of this array. Use to move local transforms in to the space
+        of a parent transform.
+
+        Args:
+            other (XfoArray, Xfo): Transforms on the left side of the product.
+
+        Returns:
+            XfoArray: New array of the products.
+
+        """
+
+        return XfoArray._fromItems([native_math.xfoMultiply(b, a) for a, b in
+                                    zip(self._getItems(), self._getOperands(other))])
+
+
+    def inverse(self):
+        """Gets the inverse of all transforms.
+
+        Returns:
+            XfoArray: New array of the inverse transforms.
+
+        """
+
+        return XfoArray._fromItems([native_math.xfoInverse(x) for x in self._getItems()])
+
+
+    def transformVectors(self, vectors):
+        """Transforms vectors by the transforms of this array.
+
+        Args:
+            vectors (Vec3Array, Vec3): One vector per transform, or a single
+                vector transformed by every transform.
+
+        Returns:
+            Vec3Array: New array of transformed vectors.
+
+        """
+
+        if isinstance(vectors, Vec3Array):
+            if len(vectors) != len(self):
+                raise ValueError("Array sizes do not match: " + str(len(self)) + " != " + str(len(vectors)))
+
+            vectors = vectors._getItems()
+        else:
+            vectors = [vectors._getData()] * len(self)
+
+        return Vec3Array._fromItems([native_math.xfoTransformVector(x, v) for x, v in
+                                     zip(self._getItems(), vectors)])
+
+
+    def linearInterpolate(self, other, t):
+        """Linearly interpolates all transforms with a transform, or with the
+        transforms of another array, based on a scalar blend value. The
+        orientations are interpolated spherically.
+
+        Args:
+            other (XfoArray, Xfo): Transforms to blend to.
+            t (float): Blend value.
+
+        Returns:
+            XfoArray: New array of blended transforms.
+
+        """
+
+        return XfoArray._fromItems([native_math.xfoLinearInterpolate(a, b, t) for a, b in
+                                    zip(self._getItems(), self._getOperands(other))])
+
+
+    def setFromVectors(self, xAxes, yAxes, zAxes, translations):
+        """Sets all transforms from axis vectors and translations, the batched
+        version of Xfo.setFromVectors(). The array is resized to the number of
+        vectors and the scalings are kept.
+
+        Args:
+            xAxes (Vec3Array): X axis of each transform.
+            yAxes (Vec3Array): Y axis of each transform.
+            zAxes (Vec3Array): Z axis of each transform.
+            translations (Vec3Array): Translation of each transform.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if not len(xAxes) == len(yAxes) == len(zAxes) == len(translations):
+            raise ValueError("XfoArray.setFromVectors(): Array sizes do not match.")
+
+        self.resize(len(xAxes))
+        self._setItems([native_math.xfoFromVectors(x, y, z, tr, sc) for x, y, z, tr, sc in
+                        zip(xAxes._getItems(), yAxes._getItems(), zAxes._getItems(),
+                            translations._getItems(), self.sc._getItems())])
+
+        return True
+
+
+    def setFromChainPositions(self, positions, normal):
+        """Sets the transforms of the bones of a chain, aiming the X axis of
+        each bone at the next position with the Y axis perpendicular to the
+        given normal.
+
+        The array is resized to one transform less than the number of
+        positions. Each transform is positioned at the start of its bone.
+
+        Args:
+            positions (Vec3Array): Positions of the joints of the chain.
+            normal (Vec3): Normal of the plane the chain bends in.
+
+        Returns:
+            list: The lengths of the bones.
+
+        """
+
+        boneVecs = positions.deltas()
+        normals = boneVecs._getOperands(normal)
+        yAxes = Vec3Array._fromItems([native_math.vecUnitSafe(native_math.vec3Cross(n, b))
+                                      for n, b in zip(normals, boneVecs._getItems())])
+        zAxes = boneVecs.cross(yAxes).unit()
+
+        translations = Vec3Array._fromStorage(positions._data[:len(boneVecs) * 3])
+        self.setFromVectors(boneVecs.unit(), yAxes, zAxes, translations)
+
+        return boneVecs.lengths()
@@ -8,6 +8,7 @@ Component -- Component representation.
 from kraken.core.configs.config import Config
 from kraken.helpers.utility_methods import mirrorData
 from kraken.core.maths import *
+from kraken.core.objects.scene_item import invalidatePathCache
 from kraken.core.objects.object_3d import Object3D
 from kraken.core.objects.layer import Layer
 from kraken.core.objects.locator import Locator
@@ -122,6 +123,9 @@ class Component(Object3D):
 
         # TODO: check that the given location is a valid value found in the config
 
+        if location != self._location:
+            invalidatePathCache()
+
         self._location = location
 
         # The new location might cause a name colision.
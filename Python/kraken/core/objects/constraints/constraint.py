@@ -13,12 +13,17 @@ from kraken.core.maths.xfo import Xfo
 class Constraint(SceneItem):
     """Constraint object."""
 
+    # Names of the constraint classes KrakenConstraintBatch can solve.
+    _batchTypes = ('PoseConstraint', 'OrientationConstraint', 'PositionConstraint', 'ScaleConstraint')
+
     def __init__(self, name, parent=None):
         super(Constraint, self).__init__(name, parent)
 
         self._constrainee = None
         self._constrainers = []
         self._maintainOffset = False
+        self._solverRTVal = None
+        self._solverConstrainers = None
 
 
     # ===================
@@ -145,6 +150,58 @@ class Constraint(SceneItem):
         return self._constrainers
 
 
+    def solveXfo(self, constrainerXfos, xfo):
+        """Computes the constraint in Python without constructing its KL
+        solver. Implemented by each constraint type.
+
+        Args:
+            constrainerXfos (list): Global transforms of the constrainers.
+            xfo (Xfo): Global transform of the constrainee before the
+                constraint is applied.
+
+        Returns:
+            Xfo: The result of the constraint in global space, before the
+                offset is applied.
+
+        """
+
+        raise NotImplementedError(self.__class__.__name__ + " does not implement solveXfo().")
+
+
+    def _getSolverRTVal(self, getGlobalXfoFunc):
+        """Returns the KL solver of this constraint with its constrainers set
+        to their current global transforms.
+
+        The solver and the array of constrainer transforms are constructed
+        once and reused, only the constrainer transforms are updated.
+
+        Args:
+            getGlobalXfoFunc (func): Function returning the global transform
+                of an object.
+
+        Returns:
+            object: The Kraken<Cls> solver RTVal.
+
+        """
+
+        if self._solverRTVal is None:
+            ks.loadExtension('KrakenForCanvas')
+            self._solverRTVal = ks.rtVal('Kraken%s' % self.__class__.__name__)
+            self._solverRTVal.offset = ks.rtVal('Xfo', Xfo())
+            self._solverConstrainers = ks.rtVal('Xfo[]')
+
+        constrainers = self._solverConstrainers
+        if len(constrainers) != len(self._constrainers):
+            constrainers.resize(len(self._constrainers))
+
+        for i, constrainer in enumerate(self._constrainers):
+            constrainers[i] = ks.rtVal('Xfo', getGlobalXfoFunc(constrainer))
+
+        self._solverRTVal.constrainers = constrainers
+
+        return self._solverRTVal
+
+
     def compute(self, getGlobalXfoFunc):
         """invokes the constraint and returns the resulting transform
 
@@ -158,12 +215,7 @@ class Constraint(SceneItem):
         if len(self._constrainers) == 0:
             return None
 
-        cls = self.__class__.__name__
-        ks.loadExtension('KrakenForCanvas')
-        rtVal = ks.rtVal('Kraken%s' % cls)
-
-        for c in self._constrainers:
-            rtVal.addConstrainer('', ks.rtVal('Xfo', getGlobalXfoFunc(c)))
+        rtVal = self._getSolverRTVal(getGlobalXfoFunc)
 
         return Xfo(rtVal.compute("Xfo", ks.rtVal('Xfo', getGlobalXfoFunc(self._constrainee))))
 
@@ -180,16 +232,89 @@ class Constraint(SceneItem):
         if len(self._constrainers) == 0:
             return Xfo()
 
-        cls = self.__class__.__name__
-        ks.loadExtension('KrakenForCanvas')
-        rtVal = ks.rtVal('Kraken%s' % cls)
-
-        rtVal.offset = ks.rtVal('Xfo', Xfo())
-        for c in self._constrainers:
-            rtVal.addConstrainer('', ks.rtVal('Xfo', getGlobalXfoFunc(c)))
+        rtVal = self._getSolverRTVal(getGlobalXfoFunc)
 
         return Xfo(rtVal.computeOffset("Xfo", ks.rtVal('Xfo', getGlobalXfoFunc(self._constrainee))))
 
+
+    @classmethod
+    def computeAll(cls, constraints, getGlobalXfoFunc):
+        """Invokes many constraints in a single KL call and returns the
+        resulting transforms.
+
+        The global transform of each object is requested once, even when it
+        drives several constraints. Only the constraint classes solved by
+        KrakenConstraintBatch are supported.
+
+        Args:
+            constraints (list): Constraints to compute.
+            getGlobalXfoFunc (func): Function returning the global transform
+                of an object.
+
+        Returns:
+            list: The result of each constraint in global space, None for
+                constraints without a constrainee or constrainers.
+
+        """
+
+        for constraint in constraints:
+            if constraint.__class__.__name__ not in cls._batchTypes:
+                raise TypeError("Constraint.computeAll(): Unsupported constraint type: " +
+                                constraint.__class__.__name__ + " (" + constraint.getName() + ")")
+
+        results = [None] * len(constraints)
+        indices = [i for i, x in enumerate(constraints)
+                   if x.getConstrainee() is not None and len(x.getConstrainers()) > 0]
+        if len(indices) == 0:
+            return results
+
+        globalXfos = {}
+
+        def getGlobalXfoRTVal(obj):
+            rtVal = globalXfos.get(id(obj))
+            if rtVal is None:
+                rtVal = ks.rtVal('Xfo', getGlobalXfoFunc(obj))
+                globalXfos[id(obj)] = rtVal
+
+            return rtVal
+
+        numConstrainers = sum([len(constraints[i].getConstrainers()) for i in indices])
+
+        ks.loadExtension('KrakenForCanvas')
+        types = ks.rtVal('String[]')
+        types.resize(len(indices))
+        constrainerOffsets = ks.rtVal('UInt32[]')
+        constrainerOffsets.resize(len(indices) + 1)
+        constrainers = ks.rtVal('Xfo[]')
+        constrainers.resize(numConstrainers)
+        constrainees = ks.rtVal('Xfo[]')
+        constrainees.resize(len(indices))
+
+        offset = 0
+        constrainerOffsets[0] = ks.rtVal('UInt32', 0)
+        for i, index in enumerate(indices):
+            constraint = constraints[index]
+            types[i] = ks.rtVal('String', constraint.__class__.__name__)
+            constrainees[i] = getGlobalXfoRTVal(constraint.getConstrainee())
+            for constrainer in constraint.getConstrainers():
+                constrainers[offset] = getGlobalXfoRTVal(constrainer)
+                offset += 1
+
+            constrainerOffsets[i + 1] = ks.rtVal('UInt32', offset)
+
+        batch = ks.rtVal('KrakenConstraintBatch')
+        batch.types = types
+        batch.constrainerOffsets = constrainerOffsets
+        batch.constrainers = constrainers
+        batch.constrainees = constrainees
+
+        xfos = batch.compute('Xfo[]')
+        for i, index in enumerate(indices):
+            results[index] = Xfo(xfos[i])
+
+        return results
+
+
     def evaluate(self):
         """invokes the constraint causing the output value to be computed.
 
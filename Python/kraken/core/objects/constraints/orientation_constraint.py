@@ -6,6 +6,7 @@ OrientationConstraint - Orientation Constraint.
 """
 
 from constraint import Constraint
+from kraken.core.maths.xfo import Xfo
 from kraken.core.maths.vec3 import Vec3
 from kraken.core.maths.quat import Quat
 
@@ -15,3 +16,32 @@ class OrientationConstraint(Constraint):
 
     def __init__(self, name):
         super(OrientationConstraint, self).__init__(name)
+
+
+    # ===================
+    # Constraint Methods
+    # ===================
+    def solveXfo(self, constrainerXfos, xfo):
+        """Computes the constraint in Python, the same way the
+        KrakenOrientationConstraint KL solver does.
+
+        Args:
+            constrainerXfos (list): Global transforms of the constrainers.
+            xfo (Xfo): Global transform of the constrainee before the
+                constraint is applied.
+
+        Returns:
+            Xfo: The result of the constraint in global space, before the
+                offset is applied.
+
+        """
+
+        result = Xfo(xfo)
+        ori = Quat(Vec3(0.0, 0.0, 0.0), 0.0)
+        for constrainerXfo in constrainerXfos:
+            ori = ori.add(constrainerXfo.ori)
+
+        ori.setUnit()
+        result.ori = ori
+
+        return result
@@ -17,3 +17,34 @@ class PoseConstraint(Constraint):
     def __init__(self, name):
         super(PoseConstraint, self).__init__(name)
 
+
+    # ===================
+    # Constraint Methods
+    # ===================
+    def solveXfo(self, constrainerXfos, xfo):
+        """Computes the constraint in Python, the same way the
+        KrakenPoseConstraint KL solver does.
+
+        Args:
+            constrainerXfos (list): Global transforms of the constrainers.
+            xfo (Xfo): Global transform of the constrainee before the
+                constraint is applied.
+
+        Returns:
+            Xfo: The result of the constraint in global space, before the
+                offset is applied.
+
+        """
+
+        result = Xfo(xfo)
+        tr = Vec3()
+        ori = Quat(Vec3(0.0, 0.0, 0.0), 0.0)
+        for constrainerXfo in constrainerXfos:
+            tr = tr.add(constrainerXfo.tr)
+            ori = ori.add(constrainerXfo.ori)
+
+        ori.setUnit()
+        result.tr = tr.multiplyScalar(1.0 / len(constrainerXfos))
+        result.ori = ori
+
+        return result
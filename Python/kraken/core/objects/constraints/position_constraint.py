@@ -6,6 +6,7 @@ PositionConstraint - Position Constraint.
 """
 
 from constraint import Constraint
+from kraken.core.maths.xfo import Xfo
 from kraken.core.maths.vec3 import Vec3
 
 
@@ -14,3 +15,31 @@ class PositionConstraint(Constraint):
 
     def __init__(self, name):
         super(PositionConstraint, self).__init__(name)
+
+
+    # ===================
+    # Constraint Methods
+    # ===================
+    def solveXfo(self, constrainerXfos, xfo):
+        """Computes the constraint in Python, the same way the
+        KrakenPositionConstraint KL solver does.
+
+        Args:
+            constrainerXfos (list): Global transforms of the constrainers.
+            xfo (Xfo): Global transform of the constrainee before the
+                constraint is applied.
+
+        Returns:
+            Xfo: The result of the constraint in global space, before the
+                offset is applied.
+
+        """
+
+        result = Xfo(xfo)
+        tr = Vec3()
+        for constrainerXfo in constrainerXfos:
+            tr = tr.add(constrainerXfo.tr)
+
+        result.tr = tr.multiplyScalar(1.0 / len(constrainerXfos))
+
+        return result
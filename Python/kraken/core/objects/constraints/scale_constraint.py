@@ -6,6 +6,8 @@ ScaleConstraint - Scale Constraint.
 """
 
 from constraint import Constraint
+from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.vec3 import Vec3
 
 
 class ScaleConstraint(Constraint):
@@ -13,3 +15,31 @@ class ScaleConstraint(Constraint):
 
     def __init__(self, name):
         super(ScaleConstraint, self).__init__(name)
+
+
+    # ===================
+    # Constraint Methods
+    # ===================
+    def solveXfo(self, constrainerXfos, xfo):
+        """Computes the constraint in Python, the same way the
+        KrakenScaleConstraint KL solver does.
+
+        Args:
+            constrainerXfos (list): Global transforms of the constrainers.
+            xfo (Xfo): Global transform of the constrainee before the
+                constraint is applied.
+
+        Returns:
+            Xfo: The result of the constraint in global space, before the
+                offset is applied.
+
+        """
+
+        result = Xfo(xfo)
+        sc = Vec3(0.0, 0.0, 0.0)
+        for constrainerXfo in constrainerXfos:
+            sc = sc.add(constrainerXfo.sc)
+
+        result.sc = sc.multiplyScalar(1.0 / len(constrainerXfos))
+
+        return result
@@ -0,0 +1,837 @@
+"""Kraken - objects.frozen_rig module.
+
+Classes:
+FrozenRig -- Compact array based representation of a built rig.
+
+"""
+
+import copy
+from array import array
+
+from kraken.core.maths.color import Color
+from kraken.core.maths.vec3 import Vec3
+from kraken.core.maths.quat import Quat
+from kraken.core.maths.xfo import Xfo
+from kraken.core.maths.xfo_array import XfoArray
+from kraken.core.objects.scene_item import _getTypeHierarchy
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.container import Container
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.hierarchy_group import HierarchyGroup
+from kraken.core.objects.component_group import ComponentGroup
+from kraken.core.objects.components.component import Component
+from kraken.core.objects.ctrlSpace import CtrlSpace
+from kraken.core.objects.control import Control
+from kraken.core.objects.curve import Curve
+from kraken.core.objects.joint import Joint
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.transform import Transform
+
+
+# Classes used to materialize the objects of a frozen rig, by the name of the
+# most derived class of the original object they match. Components and
+# component groups are constructed separately as they take extra arguments.
+_materializeClasses = {
+    'Layer': Layer,
+    'HierarchyGroup': HierarchyGroup,
+    'CtrlSpace': CtrlSpace,
+    'Control': Control,
+    'Curve': Curve,
+    'Joint': Joint,
+    'Locator': Locator,
+    'Transform': Transform
+}
+
+
+def _getColorKey(color):
+    """Returns a hashable key for the color of an object.
+
+    Args:
+        color (object): Name of a color of the config, tuple of channels or
+            Color.
+
+    Returns:
+        object: The name, the tuple, or the class name followed by the
+            channels of the Color.
+
+    """
+
+    if isinstance(color, (basestring, tuple)):
+        return color
+
+    return ('Color', color.r, color.g, color.b, color.a)
+
+
+# Attributes of a frozen rig holding arrays, encoded as lists.
+_arrayKeys = [
+    'parentIndices',
+    'nameIndices',
+    'decorationIndices',
+    'buildNameIndices',
+    'locationIndices',
+    'typeCodes',
+    'componentIndices',
+    'flagSetIndices',
+    'colorIndices',
+    'rotationOrders',
+    'visibilities',
+    'shapeVisibilities',
+    'constraintNameIndices',
+    'constraintTypeCodes',
+    'constraintConstrainees',
+    'constraintMaintainOffsets',
+    'constrainerOffsets',
+    'constrainerIndices'
+]
+
+
+class FrozenRig(object):
+    """Compact representation of a built rig.
+
+    The objects of the rig are stored in depth first hierarchy order, the
+    root at index 0, in flat arrays: parent indices, name table ids, type
+    codes, component indices and a single XfoArray of global transforms.
+    Constraints are stored as edge lists referencing the same indices.
+
+    Kraken objects are only materialized when getItem() is called. They are
+    constructed from the stored data and cached, so each object is
+    materialized once.
+
+    The arrays and tables are saved and loaded directly by jsonEncode() and
+    jsonDecode(), without materializing any object.
+
+    """
+
+    def __init__(self):
+        super(FrozenRig, self).__init__()
+
+        self._names = []
+        self._nameIds = {}
+        self._typeNames = []
+        self._typeHierarchies = []
+        self._typeCodeIds = {}
+        self._flagSets = []
+        self._flagSetIds = {}
+        self._colors = []
+        self._colorIds = {}
+
+        self._parentIndices = array('l')
+        self._nameIndices = array('l')
+        self._decorationIndices = array('l')
+        self._buildNameIndices = array('l')
+        self._locationIndices = array('l')
+        self._typeCodes = array('l')
+        self._componentIndices = array('l')
+        self._flagSetIndices = array('l')
+        self._colorIndices = array('l')
+        self._rotationOrders = array('b')
+        self._visibilities = array('b')
+        self._shapeVisibilities = array('b')
+        self._xfos = XfoArray()
+        self._curveData = {}
+
+        self._constraintNameIndices = array('l')
+        self._constraintTypeCodes = array('l')
+        self._constraintConstrainees = array('l')
+        self._constraintMaintainOffsets = array('b')
+        self._constrainerOffsets = array('l', [0])
+        self._constrainerIndices = array('l')
+
+        self._childOffsets = None
+        self._childIndices = None
+        self._itemConstraints = None
+        self._pathIndex = None
+        self._items = None
+
+
+    def __len__(self):
+        return len(self._parentIndices)
+
+
+    # ==============
+    # Table Methods
+    # ==============
+    def _getNameId(self, name):
+        """Returns the id of a string in the name table, adding it if needed.
+
+        Args:
+            name (str): String to look up.
+
+        Returns:
+            int: Index of the string in the name table.
+
+        """
+
+        nameId = self._nameIds.get(name)
+        if nameId is None:
+            nameId = len(self._names)
+            self._names.append(name)
+            self._nameIds[name] = nameId
+
+        return nameId
+
+
+    def _getTypeCode(self, cls):
+        """Returns the type code of a class, adding it if needed.
+
+        Args:
+            cls (type): Class to look up.
+
+        Returns:
+            int: Index of the class in the type table.
+
+        """
+
+        typeCode = self._typeCodeIds.get(cls)
+        if typeCode is None:
+            typeCode = len(self._typeNames)
+            self._typeNames.append(cls.__name__)
+            self._typeHierarchies.append(_getTypeHierarchy(cls))
+            self._typeCodeIds[cls] = typeCode
+
+        return typeCode
+
+
+    def _getFlagSetId(self, flags):
+        """Returns the id of a set of flags, adding it if needed.
+
+        Args:
+            flags (dict): Flags of an object.
+
+        Returns:
+            int: Index of the flag set in the flag set table.
+
+        """
+
+        flagSet = tuple(sorted(flags.keys()))
+        flagSetId = self._flagSetIds.get(flagSet)
+        if flagSetId is None:
+            flagSetId = len(self._flagSets)
+            self._flagSets.append(flagSet)
+            self._flagSetIds[flagSet] = flagSetId
+
+        return flagSetId
+
+
+    def _getColorId(self, color):
+        """Returns the id of a color, adding it if needed.
+
+        Args:
+            color (object): Color of an object, None for no color.
+
+        Returns:
+            int: Index of the color in the color table, -1 for no color.
+
+        """
+
+        if color is None:
+            return -1
+
+        colorKey = _getColorKey(color)
+        colorId = self._colorIds.get(colorKey)
+        if colorId is None:
+            colorId = len(self._colors)
+            self._colors.append(color)
+            self._colorIds[colorKey] = colorId
+
+        return colorId
+
+
+    # ===============
+    # Freeze Methods
+    # ===============
+    @classmethod
+    def fromRig(cls, rig):
+        """Constructs a frozen rig from the objects of a rig.
+
+        Args:
+            rig (Rig): The rig to freeze, its objects are not modified.
+
+        Returns:
+            FrozenRig: The frozen rig.
+
+        """
+
+        frozenRig = cls()
+
+        items = []
+        parentIndices = frozenRig._parentIndices
+        stack = [(rig, -1)]
+        while len(stack) > 0:
+            item, parentIndex = stack.pop()
+            index = len(items)
+            items.append(item)
+            parentIndices.append(parentIndex)
+            for child in reversed(item.getChildren()):
+                stack.append((child, index))
+
+        indices = dict([(id(x), i) for i, x in enumerate(items)])
+
+        for index, item in enumerate(items):
+            frozenRig._nameIndices.append(frozenRig._getNameId(item.getName()))
+            frozenRig._decorationIndices.append(frozenRig._getNameId(item.getNameDecoration()))
+            frozenRig._buildNameIndices.append(frozenRig._getNameId(item.getBuildName()))
+            frozenRig._typeCodes.append(frozenRig._getTypeCode(type(item)))
+            frozenRig._componentIndices.append(indices.get(id(item.getComponent()), -1))
+            frozenRig._flagSetIndices.append(frozenRig._getFlagSetId(item._flags))
+            frozenRig._colorIndices.append(frozenRig._getColorId(item.getColor()))
+            frozenRig._rotationOrders.append(item.ro.order)
+            frozenRig._visibilities.append(bool(item.getVisibility()))
+            frozenRig._shapeVisibilities.append(bool(item.getShapeVisibility()))
+            frozenRig._xfos.append(item.xfo)
+
+            if item.isTypeOf('Component'):
+                frozenRig._locationIndices.append(frozenRig._getNameId(item.getLocation()))
+            else:
+                frozenRig._locationIndices.append(-1)
+
+            if item.isTypeOf('Curve') and item.getCurveData() is not None:
+                frozenRig._curveData[index] = copy.deepcopy(item.getCurveData())
+
+            for i in xrange(item.getNumConstraints()):
+                constraint = item.getConstraintByIndex(i)
+                for constrainer in constraint.getConstrainers():
+                    if id(constrainer) not in indices:
+                        raise ValueError("Constrainer '" + constrainer.getPath() +
+                                         "' of '" + constraint.getPath() + "' is not in the rig.")
+
+                    frozenRig._constrainerIndices.append(indices[id(constrainer)])
+
+                frozenRig._constrainerOffsets.append(len(frozenRig._constrainerIndices))
+                frozenRig._constraintNameIndices.append(frozenRig._getNameId(constraint.getName()))
+                frozenRig._constraintTypeCodes.append(frozenRig._getTypeCode(type(constraint)))
+                frozenRig._constraintConstrainees.append(index)
+                frozenRig._constraintMaintainOffsets.append(bool(constraint.getMaintainOffset()))
+
+        return frozenRig
+
+
+    # ======================
+    # Item Query Methods
+    # ======================
+    def getNumItems(self):
+        """Returns the number of objects in the frozen rig.
+
+        Returns:
+            int: Number of objects, including the rig itself.
+
+        """
+
+        return len(self._parentIndices)
+
+
+    def getParentIndex(self, index):
+        """Returns the index of the parent of an object.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            int: Index of the parent, -1 for the root.
+
+        """
+
+        return self._parentIndices[index]
+
+
+    def _buildChildTable(self):
+        """Builds the table of the children of each object."""
+
+        counts = array('l', [0]) * (len(self) + 1)
+        for parentIndex in self._parentIndices:
+            if parentIndex >= 0:
+                counts[parentIndex + 1] += 1
+
+        for i in xrange(len(self)):
+            counts[i + 1] += counts[i]
+
+        childIndices = array('l', [0]) * counts[-1]
+        positions = array('l', counts[:-1])
+        for index, parentIndex in enumerate(self._parentIndices):
+            if parentIndex >= 0:
+                childIndices[positions[parentIndex]] = index
+                positions[parentIndex] += 1
+
+        self._childOffsets = counts
+        self._childIndices = childIndices
+
+
+    def getChildIndices(self, index):
+        """Returns the indices of the children of an object.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            list: Indices of the children in child order.
+
+        """
+
+        if self._childOffsets is None:
+            self._buildChildTable()
+
+        return self._childIndices[self._childOffsets[index]:self._childOffsets[index + 1]].tolist()
+
+
+    def getName(self, index):
+        """Returns the name of an object.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            str: Name of the object.
+
+        """
+
+        return self._names[self._nameIndices[index]]
+
+
+    def getDecoratedName(self, index):
+        """Returns the decorated name of an object.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            str: Decorated name of the object.
+
+        """
+
+        return self._names[self._nameIndices[index]] + self._names[self._decorationIndices[index]]
+
+
+    def getBuildName(self, index):
+        """Returns the build name the object had when it was frozen.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            str: Name to be used in the DCC.
+
+        """
+
+        return self._names[self._buildNameIndices[index]]
+
+
+    def getPath(self, index, decorated=False):
+        """Returns the full hierarchical path to an object.
+
+        Args:
+            index (int): Index of the object.
+            decorated (bool): Use the decorated names of the objects.
+
+        Returns:
+            str: Full name of the object.
+
+        """
+
+        names = []
+        while index >= 0:
+            if decorated:
+                names.append(self.getDecoratedName(index))
+            else:
+                names.append(self.getName(index))
+
+            index = self._parentIndices[index]
+
+        return '.'.join(reversed(names))
+
+
+    def getIndexByPath(self, path):
+        """Returns the index of an object from its decorated path.
+
+        Args:
+            path (str): Decorated path of the object.
+
+        Returns:
+            int: Index of the object, -1 if no object has the path.
+
+        """
+
+        if self._pathIndex is None:
+            self._pathIndex = dict([(self.getPath(i, decorated=True), i) for i in xrange(len(self))])
+
+        return self._pathIndex.get(path, -1)
+
+
+    def getTypeName(self, index):
+        """Returns the class name of an object.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            str: Class name of the object.
+
+        """
+
+        return self._typeNames[self._typeCodes[index]]
+
+
+    def isTypeOf(self, index, typeName):
+        """Returns whether an object is of a type or a sub-class of it.
+
+        Args:
+            index (int): Index of the object.
+            typeName (str): Name of the type.
+
+        Returns:
+            bool: True if the object is of the given type.
+
+        """
+
+        return typeName in self._typeHierarchies[self._typeCodes[index]][1]
+
+
+    def getIndicesByType(self, typeName, inheritedClass=True):
+        """Returns the indices of the objects of a type.
+
+        Args:
+            typeName (str): Name of the type.
+            inheritedClass (bool): Match objects that are a sub-class of type.
+
+        Returns:
+            list: Indices of the matching objects in hierarchy order.
+
+        """
+
+        if inheritedClass:
+            typeCodes = set([i for i, x in enumerate(self._typeHierarchies) if typeName in x[1]])
+        else:
+            typeCodes = set([i for i, x in enumerate(self._typeNames) if x == typeName])
+
+        return [i for i, x in enumerate(self._typeCodes) if x in typeCodes]
+
+
+    def getComponentIndex(self, index):
+        """Returns the index of the component of an object.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            int: Index of the component, -1 if the object has no component.
+
+        """
+
+        return self._componentIndices[index]
+
+
+    def getLocation(self, index):
+        """Returns the location of a component.
+
+        Args:
+            index (int): Index of the component.
+
+        Returns:
+            str: Location of the component, None for other objects.
+
+        """
+
+        locationIndex = self._locationIndices[index]
+        if locationIndex < 0:
+            return None
+
+        return self._names[locationIndex]
+
+
+    def testFlag(self, index, name):
+        """Tests if a flag was set on an object.
+
+        Args:
+            index (int): Index of the object.
+            name (str): Name of the flag to test.
+
+        Returns:
+            bool: True if flag is set.
+
+        """
+
+        return name in self._flagSets[self._flagSetIndices[index]]
+
+
+    def getXfos(self):
+        """Returns the global transforms of the objects.
+
+        Returns:
+            XfoArray: Global transform of each object by index.
+
+        """
+
+        return self._xfos
+
+
+    def getLocalXfos(self):
+        """Computes the transforms of the objects relative to their parent.
+
+        Returns:
+            XfoArray: Local transform of each object by index.
+
+        """
+
+        parentXfos = XfoArray()
+        for parentIndex in self._parentIndices:
+            if parentIndex < 0:
+                parentXfos.append(Xfo())
+            else:
+                parentXfos.append(self._xfos[parentIndex])
+
+        return parentXfos.inverse().multiply(self._xfos)
+
+
+    # ==========================
+    # Constraint Query Methods
+    # ==========================
+    def getNumConstraints(self):
+        """Returns the number of constraints in the frozen rig.
+
+        Returns:
+            int: Number of constraints.
+
+        """
+
+        return len(self._constraintConstrainees)
+
+
+    def getConstraint(self, index):
+        """Returns the data of a constraint.
+
+        Args:
+            index (int): Index of the constraint.
+
+        Returns:
+            tuple: The name, the class name, the index of the constrainee, the
+                indices of the constrainers and the maintain offset setting.
+
+        """
+
+        return (self._names[self._constraintNameIndices[index]],
+                self._typeNames[self._constraintTypeCodes[index]],
+                self._constraintConstrainees[index],
+                self._constrainerIndices[self._constrainerOffsets[index]:self._constrainerOffsets[index + 1]].tolist(),
+                bool(self._constraintMaintainOffsets[index]))
+
+
+    def getConstraintIndices(self, index):
+        """Returns the indices of the constraints of an object.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            list: Indices of the constraints in the order they were added.
+
+        """
+
+        if self._itemConstraints is None:
+            self._itemConstraints = {}
+            for i, constrainee in enumerate(self._constraintConstrainees):
+                self._itemConstraints.setdefault(constrainee, []).append(i)
+
+        return list(self._itemConstraints.get(index, []))
+
+
+    # ====================
+    # Materialize Methods
+    # ====================
+    def getItem(self, index):
+        """Returns the Kraken object at an index, materializing it if needed.
+
+        The parents, component and constrainers of the object are
+        materialized with it. Objects are constructed with the class Kraken
+        provides for their type, so sub-classes of Rig and Component are
+        materialized as those base classes.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            Object3D: The materialized object.
+
+        """
+
+        if self._items is None:
+            self._items = [None] * len(self)
+
+        item = self._items[index]
+        if item is None:
+            item = self._materializeItem(index)
+
+        return item
+
+
+    def _materializeItem(self, index):
+        """Constructs the Kraken object at an index.
+
+        Args:
+            index (int): Index of the object.
+
+        Returns:
+            Object3D: The constructed object.
+
+        """
+
+        name = self.getName(index)
+        typeNames = self._typeHierarchies[self._typeCodes[index]][0]
+
+        parentIndex = self._parentIndices[index]
+        parent = None
+        if parentIndex >= 0:
+            parent = self.getItem(parentIndex)
+
+        componentIndex = self._componentIndices[index]
+        component = None
+        if componentIndex >= 0 and componentIndex != index:
+            component = self.getItem(componentIndex)
+
+        if 'Rig' in typeNames:
+            item = Rig(name)
+        elif 'Container' in typeNames:
+            item = Container(name)
+        elif 'Component' in typeNames:
+            item = Component(name, parent, location=self.getLocation(index))
+        elif 'ComponentGroup' in typeNames:
+            item = ComponentGroup(name, component, parent=parent)
+        else:
+            itemClass = None
+            for typeName in typeNames:
+                itemClass = _materializeClasses.get(typeName)
+                if itemClass is not None:
+                    break
+
+            if itemClass is None:
+                raise NotImplementedError("FrozenRig can not materialize objects of type '" +
+                                          typeNames[0] + "'.")
+
+            item = itemClass(name, parent=parent)
+
+        if parent is not None and item.getParent() is not parent:
+            parent.addChild(item)
+
+        if item.getComponent() is not component:
+            item.setComponent(component)
+
+        self._items[index] = item
+
+        item.xfo = Xfo(self._xfos[index])
+        item.ro.order = self._rotationOrders[index]
+        item.setVisibility(bool(self._visibilities[index]))
+        item.setShapeVisibility(bool(self._shapeVisibilities[index]))
+
+        colorIndex = self._colorIndices[index]
+        if colorIndex >= 0:
+            item.setColor(self._colors[colorIndex])
+
+        for flag in self._flagSets[self._flagSetIndices[index]]:
+            item.setFlag(flag)
+
+        if index in self._curveData:
+            item.setCurveData(self._curveData[index])
+
+        for constraintIndex in self.getConstraintIndices(index):
+            name, typeName, constrainee, constrainers, maintainOffset = self.getConstraint(constraintIndex)
+            item.constrainTo([self.getItem(x) for x in constrainers],
+                             constraintType=typeName[:-len('Constraint')],
+                             maintainOffset=maintainOffset,
+                             name=name)
+
+        return item
+
+
+    # ====================
+    # Persistence Methods
+    # ====================
+    def jsonEncode(self, saver):
+        """Encodes the frozen rig to a JSON structure.
+
+        The arrays and tables are encoded as they are, no object is
+        materialized.
+
+        Args:
+            saver (Object): saver object.
+
+        Returns:
+            Dict: A JSON structure containing the data of the frozen rig.
+
+        """
+
+        xfos = []
+        for xfo in self._xfos:
+            xfos.extend([xfo.tr.x, xfo.tr.y, xfo.tr.z,
+                         xfo.ori.v.x, xfo.ori.v.y, xfo.ori.v.z, xfo.ori.w,
+                         xfo.sc.x, xfo.sc.y, xfo.sc.z])
+
+        colors = []
+        for color in self._colors:
+            if isinstance(color, basestring):
+                colors.append(color)
+            elif isinstance(color, tuple):
+                colors.append(list(color))
+            else:
+                colors.append({'r': color.r, 'g': color.g, 'b': color.b, 'a': color.a})
+
+        jsonData = {
+            '__typeHierarchy__': ['FrozenRig'],
+            'names': list(self._names),
+            'typeHierarchies': [list(x[0]) for x in self._typeHierarchies],
+            'flagSets': [list(x) for x in self._flagSets],
+            'colors': colors,
+            'xfos': xfos,
+            'curveData': [[x, copy.deepcopy(y)] for x, y in sorted(self._curveData.items())]
+        }
+
+        for key in _arrayKeys:
+            jsonData[key] = getattr(self, '_' + key).tolist()
+
+        return jsonData
+
+
+    def jsonDecode(self, loader, jsonData):
+        """Restores a newly constructed frozen rig from a JSON structure
+        created by jsonEncode().
+
+        Args:
+            loader (Object): Loader object.
+            jsonData (Dict): JSON object structure.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        for name in jsonData['names']:
+            self._getNameId(name)
+
+        for names in jsonData['typeHierarchies']:
+            self._typeNames.append(names[0])
+            self._typeHierarchies.append((tuple(names), frozenset(names + ['object'])))
+
+        for flagSet in jsonData['flagSets']:
+            self._flagSets.append(tuple(flagSet))
+            self._flagSetIds[tuple(flagSet)] = len(self._flagSets) - 1
+
+        for color in jsonData['colors']:
+            if isinstance(color, list):
+                self._getColorId(tuple(color))
+            elif isinstance(color, dict):
+                self._getColorId(Color(color['r'], color['g'], color['b'], color['a']))
+            else:
+                self._getColorId(color)
+
+        for key in _arrayKeys:
+            values = getattr(self, '_' + key)
+            del values[:]
+            values.extend(jsonData[key])
+
+        xfos = jsonData['xfos']
+        for i in xrange(0, len(xfos), 10):
+            self._xfos.append(Xfo(Vec3(xfos[i], xfos[i + 1], xfos[i + 2]),
+                                  Quat(Vec3(xfos[i + 3], xfos[i + 4], xfos[i + 5]), xfos[i + 6]),
+                                  Vec3(xfos[i + 7], xfos[i + 8], xfos[i + 9])))
+
+        for index, curveData in jsonData['curveData']:
+            self._curveData[index] = curveData
+
+        return True
@@ -0,0 +1,280 @@
+"""Kraken - objects.hierarchy_index module.
+
+Classes:
+HierarchyIndex -- Index of the objects in a rig by type and component.
+
+"""
+
+from bisect import bisect_right
+
+from kraken.core.objects.scene_item import _getTypeHierarchy
+
+
+class HierarchyIndex(object):
+    """Index of the objects below a root object, by type name and component.
+
+    The index is kept up to date by the hierarchy methods of Object3D as
+    children are added and removed, so type queries do not need to walk the
+    hierarchy. Results are returned in hierarchy order, the order a depth
+    first walk of the hierarchy visits the objects in. That order is numbered
+    again on the first query after the hierarchy changed.
+
+    """
+
+    def __init__(self, root):
+        super(HierarchyIndex, self).__init__()
+        self._root = root
+        self._typeItems = {}
+        self._componentItems = {}
+        self._itemComponents = {}
+
+        self._generation = 0
+        self._orderGeneration = None
+        self._order = {}
+        self._typeOrder = {}
+
+
+    # ===============
+    # Update Methods
+    # ===============
+    def addItems(self, item):
+        """Adds an object and all its descendents to the index.
+
+        Args:
+            item (Object3D): Object to add.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        stack = [item]
+        while len(stack) > 0:
+            eachItem = stack.pop()
+            key = id(eachItem)
+            if key not in self._itemComponents:
+                for typeName in _getTypeHierarchy(type(eachItem))[1]:
+                    self._typeItems.setdefault(typeName, {})[key] = eachItem
+
+                component = eachItem.getComponent()
+                self._itemComponents[key] = component
+                if component is not None:
+                    self._componentItems.setdefault(id(component), {})[key] = eachItem
+
+            stack.extend(eachItem.getChildren())
+
+        self._generation += 1
+
+        return True
+
+
+    def removeItems(self, item):
+        """Removes an object and all its descendents from the index.
+
+        Args:
+            item (Object3D): Object to remove.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        stack = [item]
+        while len(stack) > 0:
+            eachItem = stack.pop()
+            key = id(eachItem)
+            if key in self._itemComponents:
+                for typeName in _getTypeHierarchy(type(eachItem))[1]:
+                    del self._typeItems[typeName][key]
+
+                component = self._itemComponents.pop(key)
+                if component is not None:
+                    del self._componentItems[id(component)][key]
+
+            stack.extend(eachItem.getChildren())
+
+        self._generation += 1
+
+        return True
+
+
+    def setItemComponent(self, item, component):
+        """Moves an object of the index to the items of another component.
+
+        Objects that are not in the index are ignored, they are indexed with
+        their component when they are added.
+
+        Args:
+            item (Object3D): Object whose component changed.
+            component (Component): The new component of the object.
+
+        Returns:
+            bool: True if the object is in the index.
+
+        """
+
+        key = id(item)
+        if key not in self._itemComponents:
+            return False
+
+        previous = self._itemComponents[key]
+        if previous is component:
+            return True
+
+        if previous is not None:
+            del self._componentItems[id(previous)][key]
+
+        self._itemComponents[key] = component
+        if component is not None:
+            self._componentItems.setdefault(id(component), {})[key] = item
+
+        return True
+
+
+    # ==============
+    # Order Methods
+    # ==============
+    def _updateOrder(self):
+        """Numbers the objects in hierarchy order if the hierarchy changed.
+
+        Each object is given the number it is visited at and the highest
+        number of its descendents, so the descendents of an object are the
+        objects numbered in between.
+
+        """
+
+        if self._orderGeneration == self._generation:
+            return
+
+        order = {}
+        number = 0
+        stack = [(self._root, False)]
+        while len(stack) > 0:
+            item, visited = stack.pop()
+            if visited:
+                order[id(item)] = (order[id(item)], number)
+                continue
+
+            number += 1
+            order[id(item)] = number
+            stack.append((item, True))
+            for child in reversed(item.getChildren()):
+                stack.append((child, False))
+
+        self._order = order
+        self._typeOrder = {}
+        self._orderGeneration = self._generation
+
+
+    def _sortItems(self, items):
+        """Sorts objects of the index in hierarchy order.
+
+        Args:
+            items (dict): Objects keyed by their id.
+
+        Returns:
+            list: The sorted objects.
+
+        """
+
+        self._updateOrder()
+        order = self._order
+
+        return [items[x] for x in sorted(items.keys(), key=lambda x: order[x][0])]
+
+
+    def _getTypeOrder(self, typeName):
+        """Returns the objects of a type in hierarchy order.
+
+        Args:
+            typeName (str): Name of the type.
+
+        Returns:
+            tuple: The list of the order numbers and the list of the objects.
+
+        """
+
+        self._updateOrder()
+
+        typeOrder = self._typeOrder.get(typeName)
+        if typeOrder is None:
+            items = self._sortItems(self._typeItems.get(typeName, {}))
+            typeOrder = ([self._order[id(x)][0] for x in items], items)
+            self._typeOrder[typeName] = typeOrder
+
+        return typeOrder
+
+
+    # ==============
+    # Query Methods
+    # ==============
+    def hasItem(self, item):
+        """Returns whether an object is in the index.
+
+        Args:
+            item (Object3D): Object to test.
+
+        Returns:
+            bool: True if the object is in the index.
+
+        """
+
+        return id(item) in self._itemComponents
+
+
+    def getItemsByType(self, typeName, parent=None, exactType=False):
+        """Returns the objects of a type below an object of the index.
+
+        Args:
+            typeName (str): Name of the type to match.
+            parent (Object3D): Object to get the descendents of, the root of
+                the index if None.
+            exactType (bool): Only match objects of exactly this type, not
+                sub-classes of it.
+
+        Returns:
+            list: Matching objects in hierarchy order.
+
+        """
+
+        numbers, items = self._getTypeOrder(typeName)
+
+        if parent is None or parent is self._root:
+            found = list(items)
+        else:
+            first, last = self._order[id(parent)]
+            found = items[bisect_right(numbers, first):bisect_right(numbers, last)]
+
+        if exactType:
+            found = [x for x in found if x.getTypeName() == typeName]
+
+        return found
+
+
+    def getChildrenByType(self, parent, typeName):
+        """Returns the children of an object that are of a type.
+
+        Args:
+            parent (Object3D): Object to get the children of.
+            typeName (str): Name of the type to match.
+
+        Returns:
+            list: Matching children in child order.
+
+        """
+
+        return [x for x in self.getItemsByType(typeName, parent) if x.getParent() is parent]
+
+
+    def getComponentItems(self, component):
+        """Returns the objects of the index that belong to a component.
+
+        Args:
+            component (Component): Component to get the objects of.
+
+        Returns:
+            list: Objects in hierarchy order.
+
+        """
+
+        return self._sortItems(self._componentItems.get(id(component), {}))
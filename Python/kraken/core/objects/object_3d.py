@@ -9,6 +9,7 @@ import re
 
 from kraken.core.configs.config import Config
 from kraken.core.objects.scene_item import SceneItem
+from kraken.core.objects.scene_item import getPathGeneration
 from kraken.core.maths.xfo import Xfo
 from kraken.core.maths.rotation_order import RotationOrder
 from kraken.core.objects.attributes.attribute_group import AttributeGroup
@@ -20,13 +21,47 @@ from kraken.core.objects.constraints.position_constraint import PositionConstrai
 from kraken.core.objects.constraints.scale_constraint import ScaleConstraint
 
 
+_dynamicNameClasses = {}
+
+
+def _hasDynamicName(sceneItem):
+    """Returns whether the name of a scene item is derived from another object,
+    i.e. a ComponentGroup takes the name of its component. These names can
+    change without setName() being called on the item, so they are not kept
+    in the child name indexes.
+
+    Args:
+        sceneItem (object): The scene item to check.
+
+    Returns:
+        bool: True if the name of the scene item is derived.
+
+    """
+
+    cls = type(sceneItem)
+    dynamic = _dynamicNameClasses.get(cls)
+    if dynamic is None:
+        dynamic = cls.getName.__func__ is not SceneItem.getName.__func__
+        _dynamicNameClasses[cls] = dynamic
+
+    return dynamic
+
+
 class Object3D(SceneItem):
     """Kraken base object type for any 3D object."""
 
     def __init__(self, name, parent=None):
         super(Object3D, self).__init__(name, parent)
         self._children = []
+        self._childNameIndex = {}
+        self._childDecoratedNameIndex = {}
+        self._childIndexKeys = {}
+        self._childSuffixHints = {}
+        self._dynamicNameChildren = []
+        self._hierarchyIndex = None
         self._flags = {}
+        self._buildName = None
+        self._buildNameKey = None
         self._attributeGroups = []
         self._constraints = []
         self._xfo = Xfo()
@@ -138,83 +173,20 @@ class Object3D(SceneItem):
 
         """
 
-        typeNameHierarchy = self.getTypeHierarchyNames()
-
         config = Config.getInstance()
 
-        # If flag is set on object to use explicit name, return it.
-        if config.getExplicitNaming() is True or self.testFlag('EXPLICIT_NAME'):
-            return self.getName()
-
-        nameTemplate = config.getNameTemplate()
-
-        # Get the token list for this type of object
-        format = None
-        for typeName in nameTemplate['formats'].keys():
-            if typeName in typeNameHierarchy:
-                format = nameTemplate['formats'][typeName]
-                break
-
-        if format is None:
-            format = nameTemplate['formats']['default']
-
-        objectType = None
-        for eachType in typeNameHierarchy:
-            if eachType in nameTemplate['types'].keys():
-                objectType = eachType
-                break
-
-        if objectType is None:
-            objectType = 'default'
-
-        # Generate a name by concatenating the resolved tokens together.
-        builtName = ""
-        skipSep = False
-        for token in format:
+        # Build names depend on the config and on the names, components and
+        # locations also tracked by the path cache generation.
+        buildNameKey = (config.getNameFormatGeneration(), getPathGeneration())
+        if self._buildNameKey == buildNameKey:
+            return self._buildName
 
-            if token is 'sep':
-                if not skipSep:
-                    builtName += nameTemplate['separator']
+        buildName = config.getNameFormatter(type(self))(self)
 
-            elif token is 'location':
-                if self.isTypeOf('Component'):
-                    location = self.getLocation()
-                else:
-                    location = self.getComponent().getLocation()
-
-                if location not in nameTemplate['locations']:
-                    raise ValueError("Invalid location on: " + self.getPath())
-
-                builtName += location
-
-            elif token is 'type':
-
-                if objectType == 'Locator' and self.testFlag('inputObject'):
-                    objectType = 'ComponentInput'
-                elif objectType == 'Locator' and self.testFlag('outputObject'):
-                    objectType = 'ComponentOutput'
-
-                builtName += nameTemplate['types'][objectType]
-
-            elif token is 'name':
-                builtName += self.getName()
-
-            elif token is 'component':
-                if self.getComponent() is None:
-                    skipSep = True
-                    continue
-                builtName += self.getComponent().getName()
-
-            elif token is 'container':
-                if self.getContainer() is None:
-                    skipSep = True
-                    continue
-                builtName += self.getContainer().getName()
+        self._buildName = buildName
+        self._buildNameKey = buildNameKey
 
-            else:
-                raise ValueError("Unresolvabled token '" + token + "' used on: " + self.getPath())
-
-        return builtName
+        return buildName
 
     def setName(self, name):
         """Sets the name of the object with a string.
@@ -228,27 +200,25 @@ class Object3D(SceneItem):
         """
 
         # check for name collision and adjust the name if they exist
-        if self.getParent() is not None:
+        parent = self.getParent()
+        if parent is not None:
             # Increment name if it already exists
-            initName = name
-            suffix = 1
-            collision = True
-            while collision:
-                child = self.getParent().getChildByDecoratedName(name + self.getNameDecoration())
-                collision = child != None and child is not self
-                if not collision:
-                    break
-
+            child = parent.getChildByDecoratedName(name + self.getNameDecoration())
+            if child is not None and child is not self:
+                initName = name
+                suffix = 1
                 result = re.split(r"(\d+)$", initName, 1)
                 if len(result) > 1:
                     initName = result[0]
                     suffix = int(result[1])
 
-                name = initName + str(suffix).zfill(2)
-                suffix += 1
+                name = parent._allocateChildName(initName, self.getNameDecoration(), suffix, self)
 
         super(Object3D, self).setName(name)
 
+        if parent is not None:
+            parent._reindexChild(self)
+
         return True
 
 
@@ -284,10 +254,48 @@ class Object3D(SceneItem):
         return parent
 
 
+    # ==================
+    # Component Methods
+    # ==================
+    def setComponent(self, component):
+        """Sets the component attribute of this object.
+
+        Args:
+            component (Object): Object that is the component of this one.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        super(Object3D, self).setComponent(component)
+
+        index = self._getHierarchyIndex()
+        if index is not None:
+            index.setItemComponent(self, component)
+
+        return True
+
 
     # ==============
     # Child Methods
     # ==============
+    def _getHierarchyIndex(self):
+        """Returns the hierarchy index of the rig this object is in.
+
+        Returns:
+            HierarchyIndex: The index of the root object, None if the root
+                object is not indexed.
+
+        """
+
+        root = self
+        while root.getParent() is not None:
+            root = root.getParent()
+
+        return root._hierarchyIndex
+
+
     def hasChild(self, child):
         """Checks the supplied item is a child
 
@@ -296,13 +304,142 @@ class Object3D(SceneItem):
 
         """
 
-        for i, eachChild in enumerate(self.getChildren()):
-            if eachChild == child:
+        if id(child) in self._childIndexKeys:
+            return True
+
+        for eachChild in self._dynamicNameChildren:
+            if eachChild is child:
                 return True
 
         return False
 
 
+    def _indexChild(self, child):
+        """Adds a child to the name and decorated name indexes.
+
+        Args:
+            child (Object): Child to add to the indexes.
+
+        """
+
+        if _hasDynamicName(child):
+            self._dynamicNameChildren.append(child)
+            return
+
+        name = child.getName()
+        decoratedName = name + child.getNameDecoration()
+        self._childNameIndex.setdefault(name, []).append(child)
+        self._childDecoratedNameIndex.setdefault(decoratedName, []).append(child)
+        self._childIndexKeys[id(child)] = (name, decoratedName)
+
+
+    def _unindexChild(self, child):
+        """Removes a child from the name and decorated name indexes.
+
+        Args:
+            child (Object): Child to remove from the indexes.
+
+        Returns:
+            bool: True if the child was indexed.
+
+        """
+
+        keys = self._childIndexKeys.pop(id(child), None)
+        if keys is None:
+            numDynamic = len(self._dynamicNameChildren)
+            self._dynamicNameChildren = [x for x in self._dynamicNameChildren if x is not child]
+            return len(self._dynamicNameChildren) != numDynamic
+
+        name, decoratedName = keys
+        for index, key in ((self._childNameIndex, name), (self._childDecoratedNameIndex, decoratedName)):
+            children = [x for x in index[key] if x is not child]
+            if len(children) > 0:
+                index[key] = children
+            else:
+                del index[key]
+
+        self._releaseChildName(name, decoratedName[len(name):])
+
+        return True
+
+
+    def _releaseChildName(self, name, decoration):
+        """Marks the suffix of a name free again for the next collision.
+
+        The name may have been allocated from any split of its trailing
+        digits, 'bone0301' from 'bone03' and 1 or from 'bone0' and 301, so
+        the suffix hints of all of them are lowered.
+
+        Args:
+            name (str): Name that is no longer used by a child.
+            decoration (str): Name decoration of the child.
+
+        """
+
+        start = len(name.rstrip('0123456789'))
+        for i in xrange(start, len(name) - 1):
+            suffix = int(name[i:])
+            if str(suffix).zfill(2) != name[i:]:
+                continue
+
+            hintKey = (name[:i], decoration)
+            if self._childSuffixHints.get(hintKey, suffix) > suffix:
+                self._childSuffixHints[hintKey] = suffix
+
+
+    def _reindexChild(self, child):
+        """Updates the indexes of a child after its name changed.
+
+        Args:
+            child (Object): Child to update in the indexes.
+
+        """
+
+        if self._unindexChild(child):
+            self._indexChild(child)
+
+
+    def _allocateChildName(self, initName, decoration, suffix=1, child=None):
+        """Returns the first name, made of the given name followed by a two
+        digit suffix, that does not collide with the children of this object.
+
+        The suffixes known to be taken are skipped so that adding many
+        children with the same name does not test every suffix each time.
+
+        Args:
+            initName (str): Name to add the suffix to.
+            decoration (str): Name decoration of the child to name.
+            suffix (int): First suffix to try.
+            child (Object): Child being renamed, it does not collide with itself.
+
+        Returns:
+            str: The name with a free suffix.
+
+        """
+
+        # Suffixes below the hint are all taken. The hint is only used for new
+        # children: a child being renamed may hold one of those suffixes, or
+        # may be renamed on its previous parent while it is being reparented.
+        hintKey = (initName, decoration)
+        hint = self._childSuffixHints.get(hintKey, 1)
+        useHint = suffix <= hint and child is None
+        if useHint:
+            suffix = hint
+
+        while True:
+            name = initName + str(suffix).zfill(2)
+            collision = self.getChildByDecoratedName(name + decoration)
+            if collision is None or collision is child:
+                break
+
+            suffix += 1
+
+        if useHint:
+            self._childSuffixHints[hintKey] = suffix + 1
+
+        return name
+
+
     def _checkChildIndex(self, index):
         """Checks the supplied index is valid.
 
@@ -333,28 +470,38 @@ class Object3D(SceneItem):
 
         if child.getParent() is not None:
             parent = child.getParent()
-            if child in parent.getChildren():
+            parentIndex = parent._getHierarchyIndex()
+            if parentIndex is not None:
+                parentIndex.removeItems(child)
+
+            if parent.hasChild(child):
+                parent._unindexChild(child)
                 parent.getChildren().remove(child)
 
         # check for name collision and adjust the name if they exist
         # Increment name if it already exists
         initName = child.getName()
-        name = initName
-        suffix = 1
-
-        while self.getChildByDecoratedName(name + child.getNameDecoration()) != None:
-            name = initName + str(suffix).zfill(2)
-            suffix += 1
-        if initName != name:
+        if self.getChildByDecoratedName(initName + child.getNameDecoration()) is not None:
+            name = self._allocateChildName(initName, child.getNameDecoration())
             child.setName(name)
 
+            # The name may collide on the previous parent, which still names
+            # the child, and be changed again there.
+            if child.getName() != name:
+                self._releaseChildName(name, child.getNameDecoration())
+
         self.getChildren().append(child)
+        self._indexChild(child)
         child.setParent(self)
 
         # Assign the child the same component.
         if self._component is not None:
             child.setComponent(self._component)
 
+        index = self._getHierarchyIndex()
+        if index is not None:
+            index.addItems(child)
+
         return True
 
 
@@ -372,6 +519,12 @@ class Object3D(SceneItem):
         if self._checkChildIndex(index) is not True:
             return False
 
+        child = self.getChildren()[index]
+        hierarchyIndex = self._getHierarchyIndex()
+        if hierarchyIndex is not None:
+            hierarchyIndex.removeItems(child)
+
+        self._unindexChild(child)
         del self.getChildren()[index]
 
         return True
@@ -418,6 +571,11 @@ class Object3D(SceneItem):
                 names.append(c.getName())
             raise Exception("Object '" + self.getPath() + "' does not have child:" + child.getPath() + ". it does have:" + str(names))
 
+        index = self._getHierarchyIndex()
+        if index is not None:
+            index.removeItems(child)
+
+        self._unindexChild(child)
         child.setParent(None)
 
         # Un-assign the child the component.
@@ -441,6 +599,13 @@ class Object3D(SceneItem):
         if nodeList is None:
             nodeList = []
 
+        if classType is not None:
+            index = self._getHierarchyIndex()
+            if index is not None and (index is self._hierarchyIndex or index.hasItem(self)):
+                nodeList.extend(index.getItemsByType(classType, parent=self,
+                                                     exactType=inheritedClass is None))
+                return nodeList
+
         for child in self._children:
                 if classType is not None:
                     if inheritedClass is not None and child.isTypeOf(classType):
@@ -506,11 +671,17 @@ class Object3D(SceneItem):
 
         """
 
-        for eachChild in self.getChildren():
+        children = self._childNameIndex.get(name)
+        found = None
+        if children is not None:
+            found = children[0]
+
+        for eachChild in self._dynamicNameChildren:
             if eachChild.getName() == name:
-                return eachChild
+                found = self._getFirstChild(found, eachChild)
+                break
 
-        return None
+        return found
 
 
     def getChildByDecoratedName(self, decoratedName):
@@ -524,11 +695,38 @@ class Object3D(SceneItem):
 
         """
 
-        for eachChild in self.getChildren():
+        children = self._childDecoratedNameIndex.get(decoratedName)
+        found = None
+        if children is not None:
+            found = children[0]
+
+        for eachChild in self._dynamicNameChildren:
             if eachChild.getDecoratedName() == decoratedName:
-                return eachChild
+                found = self._getFirstChild(found, eachChild)
+                break
 
-        return None
+        return found
+
+
+    def _getFirstChild(self, child, otherChild):
+        """Returns whichever of two children comes first in the children list.
+
+        Args:
+            child (Object): First child to compare, may be None.
+            otherChild (Object): Second child to compare.
+
+        Returns:
+            Object: The child with the lowest index.
+
+        """
+
+        if child is None:
+            return otherChild
+
+        if self._children.index(otherChild) < self._children.index(child):
+            return otherChild
+
+        return child
 
 
     def getChildrenByType(self, childType):
@@ -562,6 +760,7 @@ class Object3D(SceneItem):
         """
 
         self._flags[name] = True
+        self._buildNameKey = None
 
         return True
 
@@ -593,6 +792,7 @@ class Object3D(SceneItem):
 
         if name in self._flags:
             del self._flags[name]
+            self._buildNameKey = None
             return True
 
         return False
@@ -1169,6 +1369,7 @@ class Object3D(SceneItem):
         """
 
         self._flags =  jsonData['flags']
+        self._buildNameKey = None
         self.xfo =  loader.decodeValue(jsonData['xfo'])
         if 'color' in jsonData and jsonData['color'] is not None:
             self.setColor(loader.decodeValue(jsonData['color']))
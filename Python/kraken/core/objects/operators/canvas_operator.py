@@ -5,6 +5,7 @@ CanvasOperator - Splice operator object.
 
 """
 
+import os
 import json
 import pprint
 
@@ -18,14 +19,122 @@ from kraken.core.kraken_system import ks
 class CanvasOperator(Operator):
     """Splice Operator representation."""
 
-    def __init__(self, name, canvasPresetPath):
+    # Port signatures of the presets and the bindings shared by the operators
+    # that do not need their own, keyed by preset path and preset mtime.
+    _presetSignatures = {}
+    _sharedBindings = {}
+
+    def __init__(self, name, canvasPresetPath, shareBinding=False):
         super(CanvasOperator, self).__init__(name)
 
         self.canvasPresetPath = canvasPresetPath
+        self._shareBinding = shareBinding
+        self._binding = None
+
+        self._presetKey = (self.canvasPresetPath, self._getPresetMTime(self.canvasPresetPath))
+        signature = CanvasOperator._presetSignatures.get(self._presetKey)
+        if signature is None:
+            binding = ks.getCoreClient().DFG.host.createBindingToPreset(self.canvasPresetPath)
+            signature = self._readPortSignature(binding)
+            CanvasOperator._presetSignatures[self._presetKey] = signature
+
+            # The binding used to read the signature is kept by the first
+            # operator.
+            if shareBinding:
+                CanvasOperator._sharedBindings[self._presetKey] = binding
+            else:
+                self._binding = binding
+
+        self._portSignature = signature
+
+        # Initialize the inputs and outputs based on the port signature.
+        for portName, portConnectionType, portDataType, isArray in self._portSignature:
+            if portConnectionType == 'In':
+                if isArray:
+                    self.inputs[portName] = []
+                else:
+                    self.inputs[portName] = None
+            else:
+                if isArray:
+                    self.outputs[portName] = []
+                else:
+                    self.outputs[portName] = None
+
 
-        host = ks.getCoreClient().DFG.host
-        self.binding = host.createBindingToPreset(self.canvasPresetPath)
-        self.node = self.binding.getExec()
+    @staticmethod
+    def _getPresetMTime(presetPath):
+        """Returns the modification time of the file of a preset.
+
+        The file is searched for in the directories of the FABRIC_DFG_PATH
+        environment variable and their DFG sub-directories. Presets generated
+        from a KL extension have no file, the latest modification time of the
+        sources of the extension named by the first part of the path is used
+        instead.
+
+        Args:
+            presetPath (str): Preset path within the Canvas library.
+
+        Returns:
+            float: Modification time of the preset file, None if not found.
+
+        """
+
+        relativePath = os.path.join(*presetPath.split('.')) + '.canvas'
+        for presetsDir in os.environ.get('FABRIC_DFG_PATH', '').split(os.pathsep):
+            for filePath in (os.path.join(presetsDir, relativePath),
+                             os.path.join(presetsDir, 'DFG', relativePath)):
+                if os.path.isfile(filePath):
+                    return os.path.getmtime(filePath)
+
+        return CanvasOperator._getExtensionMTime(presetPath.split('.')[0])
+
+
+    @staticmethod
+    def _getExtensionMTime(extensionName):
+        """Returns the latest modification time of the sources of a KL
+        extension.
+
+        The extension is searched for in the directories of the
+        FABRIC_EXTS_PATH environment variable.
+
+        Args:
+            extensionName (str): Name of the extension.
+
+        Returns:
+            float: Latest modification time of the .kl and .json files of the
+                extension, None if not found.
+
+        """
+
+        for extsDir in os.environ.get('FABRIC_EXTS_PATH', '').split(os.pathsep):
+            extDir = os.path.join(extsDir, extensionName)
+            if not os.path.isfile(os.path.join(extDir, extensionName + '.fpm.json')):
+                continue
+
+            mTimes = []
+            for folder, subFolders, fileNames in os.walk(extDir):
+                for fileName in fileNames:
+                    if fileName.endswith('.kl') or fileName.endswith('.json'):
+                        mTimes.append(os.path.getmtime(os.path.join(folder, fileName)))
+
+            return max(mTimes)
+
+        return None
+
+
+    @staticmethod
+    def _readPortSignature(binding):
+        """Reads the name, connection type and data type of the exec ports of
+        a binding.
+
+        Args:
+            binding (object): Binding to a Canvas preset.
+
+        Returns:
+            tuple: One (name, connectionType, dataType, isArray) tuple per
+                exec port, in port order.
+
+        """
 
         portTypeMap = {
             0: 'In',
@@ -33,29 +142,88 @@ class CanvasOperator(Operator):
             2: 'Out'
         }
 
-        ownerOutPortData = {
-            'name': None,
-            'typeSpec': None,
-            'execPortType': None
-        }
+        node = binding.getExec()
 
-        # Initialize the inputs and outputs based on the given args.
-        for i in xrange(self.node.getExecPortCount()):
-            portName = self.node.getExecPortName(i)
-            portConnectionType = portTypeMap[self.node.getExecPortType(i)]
-            rtVal = self.binding.getArgValue(portName)
+        signature = []
+        for i in xrange(node.getExecPortCount()):
+            portName = node.getExecPortName(i)
+            portConnectionType = portTypeMap[node.getExecPortType(i)]
+            rtVal = binding.getArgValue(portName)
             portDataType = rtVal.getTypeName().getSimpleType()
 
-            if portConnectionType == 'In':
-                if portDataType.endswith('[]'):
-                    self.inputs[portName] = []
-                else:
-                    self.inputs[portName] = None
-            else:
-                if portDataType.endswith('[]'):
-                    self.outputs[portName] = []
-                else:
-                    self.outputs[portName] = None
+            signature.append((portName, portConnectionType, portDataType, portDataType.endswith('[]')))
+
+        return tuple(signature)
+
+
+    @classmethod
+    def clearPresetCache(cls):
+        """Clears the port signatures and the shared bindings cached for each
+        preset. Edited preset files, and presets of edited KL extensions, are
+        read again without clearing the cache when their modification time
+        changed.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        cls._presetSignatures.clear()
+        cls._sharedBindings.clear()
+
+        return True
+
+
+    @property
+    def binding(self):
+        """Gets the binding to the preset used by this operator.
+
+        Operators that share their binding use a single binding per preset,
+        other operators create their own binding the first time it is used.
+        Only share the binding of presets without state, a shared binding
+        keeps the port values set by the last operator that evaluated it.
+
+        Returns:
+            object: The binding to the Canvas preset.
+
+        """
+
+        if self._shareBinding:
+            binding = CanvasOperator._sharedBindings.get(self._presetKey)
+            if binding is None:
+                binding = ks.getCoreClient().DFG.host.createBindingToPreset(self.canvasPresetPath)
+                CanvasOperator._sharedBindings[self._presetKey] = binding
+
+            return binding
+
+        if self._binding is None:
+            self._binding = ks.getCoreClient().DFG.host.createBindingToPreset(self.canvasPresetPath)
+
+        return self._binding
+
+
+    @property
+    def node(self):
+        """Gets the executable of the binding used by this operator.
+
+        Returns:
+            object: The executable of the binding.
+
+        """
+
+        return self.binding.getExec()
+
+
+    def getShareBinding(self):
+        """Returns whether this operator shares its binding with the other
+        operators using the same preset.
+
+        Returns:
+            bool: True if the binding is shared.
+
+        """
+
+        return self._shareBinding
 
 
     def getPresetPath(self):
@@ -125,66 +293,42 @@ class CanvasOperator(Operator):
                         raise TypeError(self.getName() + ".evaluate(): Invalid Argument Value: " + str(rtVal) + " (" + type(rtVal).__name__ + "), for Argument: " + portName + " (" + portDataType + ")")
 
 
-        portTypeMap = {
-            0: 'In',
-            1: 'IO',
-            2: 'Out'
-        }
+        binding = self.binding
 
         debug = []
-        for i in xrange(self.node.getExecPortCount()):
-            portName = self.node.getExecPortName(i)
-            portConnectionType = portTypeMap[self.node.getExecPortType(i)]
-            rtVal = self.binding.getArgValue(portName)
-            portDataType = rtVal.getTypeName().getSimpleType()
-
+        for portName, portConnectionType, portDataType, isArray in self._portSignature:
             portVal = None
             if portDataType == '$TYPE$':
                 return
 
             if portDataType in ('EvalContext', 'time', 'frame'):
                 portVal = ks.constructRTVal(portDataType)
-                self.binding.setArgValue(portName, portVal, False)
+                binding.setArgValue(portName, portVal, False)
                 continue
 
             if portConnectionType == 'In':
-                if str(portDataType).endswith('[]'):
-                    rtValArray = ks.rtVal(portDataType)
-                    rtValArray.resize(len(self.inputs[portName]))
-                    for j in xrange(len(self.inputs[portName])):
-                        rtVal = getRTVal(self.inputs[portName][j])
-
-                        validateArg(rtVal, portName, portDataType[:-2])
+                port = self.inputs[portName]
+            else:
+                port = self.outputs[portName]
 
-                        rtValArray[j] = rtVal
+            if isArray:
+                rtValArray = ks.rtVal(portDataType)
+                rtValArray.resize(len(port))
+                for j in xrange(len(port)):
+                    rtVal = getRTVal(port[j])
 
-                    portVal = rtValArray
-                    self.binding.setArgValue(portName, portVal, False)
-                else:
-                    rtVal = getRTVal(self.inputs[portName])
+                    validateArg(rtVal, portName, portDataType[:-2])
 
-                    validateArg(rtVal, portName, portDataType)
+                    rtValArray[j] = rtVal
 
-                    self.binding.setArgValue(portName, rtVal, False)
+                portVal = rtValArray
+                binding.setArgValue(portName, portVal, False)
             else:
-                if str(portDataType).endswith('[]'):
-                    rtValArray = ks.rtVal(portDataType)
-                    rtValArray.resize(len(self.outputs[portName]))
-                    for j in xrange(len(self.outputs[portName])):
-                        rtVal = getRTVal(self.outputs[portName][j])
+                rtVal = getRTVal(port)
 
-                        validateArg(rtVal, portName, portDataType[:-2])
+                validateArg(rtVal, portName, portDataType)
 
-                        rtValArray[j] = rtVal
-
-                    portVal = rtValArray
-                    self.binding.setArgValue(portName, portVal, False)
-                else:
-                    rtVal = getRTVal(self.outputs[portName])
-
-                    validateArg(rtVal, portName, portDataType)
-
-                    self.binding.setArgValue(portName, rtVal, False)
+                binding.setArgValue(portName, rtVal, False)
 
             portDebug = {
                 portName: [
@@ -199,7 +343,7 @@ class CanvasOperator(Operator):
             debug.append(portDebug)
 
         try:
-            self.binding.execute()
+            binding.execute()
         except:
             errorMsg = "Possible problem with Canvas operator '" + self.getName() + "' port values:"
             print errorMsg
@@ -208,7 +352,7 @@ class CanvasOperator(Operator):
             raise Exception(errorMsg)
 
         # Now put the computed values out to the connected output objects.
-        def setRTVal(obj, rtval):
+        def setRTVal(obj, rtval, portName):
             if isinstance(obj, Object3D):
                 obj.xfo.setFromMat44(Mat44(rtval))
             elif isinstance(obj, Xfo):
@@ -224,18 +368,13 @@ class CanvasOperator(Operator):
                 (rtval, obj, portName, self.getName())
 
 
-        for i in xrange(self.node.getExecPortCount()):
-            portName = self.node.getExecPortName(i)
-            portConnectionType = portTypeMap[self.node.getExecPortType(i)]
-            rtVal = self.binding.getArgValue(portName)
-            portDataType = rtVal.getTypeName().getSimpleType()
-
+        for portName, portConnectionType, portDataType, isArray in self._portSignature:
             if portConnectionType != 'In':
-                outVal = self.binding.getArgValue(portName)
-                if str(portDataType).endswith('[]' or hasattr(outVal.getSimpleType(), '__iter__')):
+                outVal = binding.getArgValue(portName)
+                if isArray:
                     for j in xrange(len(outVal)):
-                        setRTVal(self.outputs[portName][j], outVal[j])
+                        setRTVal(self.outputs[portName][j], outVal[j], portName)
                 else:
-                    setRTVal(self.outputs[portName], outVal)
+                    setRTVal(self.outputs[portName], outVal, portName)
 
-        return True
\ No newline at end of file
+        return True
@@ -23,39 +23,149 @@ class KLOperator(Operator):
     # an attirbute array called 'klOperators' that contains sets of what we
     # currently have setup.
 
-    def __init__(self, name, solverTypeName, extension):
+    # Arguments and argument plans of the solver types, and the solvers shared
+    # by the operators that do not need their own, keyed by solver type name.
+    _solverMetadata = {}
+    _sharedSolvers = {}
+
+    def __init__(self, name, solverTypeName, extension, shareSolver=False):
         super(KLOperator, self).__init__(name)
 
         self.solverTypeName = solverTypeName
         self.extension = extension
+        self._shareSolver = shareSolver
+        self._solverRTVal = None
 
-        # Load the Fabric Engine client and construct the RTVal for the Solver
+        # Load the Fabric Engine client and get the arguments of the Solver.
+        # The arguments are only discovered for the first operator of each
+        # solver type.
         ks.loadCoreClient()
-        ks.loadExtension('Kraken')
-        if self.extension != 'Kraken':
-            ks.loadExtension(self.extension)
-        self.solverRTVal = ks.constructRTVal(self.solverTypeName)
-        self.args = self.solverRTVal.getArguments('KrakenSolverArg[]')
-
-        # Initialize the inputs and outputs based on the given args.
-        for i in xrange(len(self.args)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+        ks.loadExtensions(['Kraken', self.extension])
+
+        metadata = KLOperator._solverMetadata.get(self.solverTypeName)
+        if metadata is None:
+            solverRTVal = ks.constructRTVal(self.solverTypeName)
+            args = solverRTVal.getArguments('KrakenSolverArg[]')
+            metadata = (args, self._compileArgPlan(args))
+            KLOperator._solverMetadata[self.solverTypeName] = metadata
+
+            # The solver used for the discovery is kept by the first operator.
+            if shareSolver:
+                KLOperator._sharedSolvers[self.solverTypeName] = solverRTVal
+            else:
+                self._solverRTVal = solverRTVal
 
+        self.args, self._argPlan = metadata
+        self._argVals = [None] * len(self._argPlan)
+        self._xfoArrayVals = [None] * len(self._argPlan)
+
+        for argName, argDataType, argConnectionType, isArray, elementType, isContext in self._argPlan:
             if argConnectionType == 'In':
-                if argDataType.endswith('[]'):
+                if isArray:
                     self.inputs[argName] = []
                 else:
                     self.inputs[argName] = None
             else:
-                if argDataType.endswith('[]'):
+                if isArray:
                     self.outputs[argName] = []
                 else:
                     self.outputs[argName] = None
 
 
+    def _compileArgPlan(self, args):
+        """Reads the name, data type and connection type of each solver
+        argument once, so evaluating the operator does not query the args
+        RTVal again.
+
+        Args:
+            args (RTValArray): Args array defined by the KL Operator.
+
+        Returns:
+            tuple: One (name, dataType, connectionType, isArray, elementType,
+                isContext) tuple per argument, in solve() order. isContext is
+                True for the arguments that are constructed by the operator
+                instead of connected: the EvalContext, time and frame.
+
+        """
+
+        argPlan = []
+        for i in xrange(len(args)):
+            arg = args[i]
+            argName = arg.name.getSimpleType()
+            argDataType = arg.dataType.getSimpleType()
+            argConnectionType = arg.connectionType.getSimpleType()
+
+            isArray = argDataType.endswith('[]')
+            if isArray:
+                elementType = argDataType[:-2]
+            else:
+                elementType = argDataType
+
+            isContext = argDataType == 'EvalContext' or argName in ('time', 'frame')
+
+            argPlan.append((argName, argDataType, argConnectionType, isArray, elementType, isContext))
+
+        return tuple(argPlan)
+
+
+    @classmethod
+    def clearSolverCache(cls):
+        """Clears the arguments and the shared solvers cached for each solver
+        type. Call after reloading the KL extensions so the changed solvers
+        are discovered again.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        cls._solverMetadata.clear()
+        cls._sharedSolvers.clear()
+
+        return True
+
+
+    @property
+    def solverRTVal(self):
+        """Gets the solver RTVal of this operator.
+
+        Operators that share their solver use a single solver per solver type,
+        other operators construct their own solver the first time it is used.
+        Only share the solver of solver types without state: a shared solver
+        keeps the members set by the last operator that evaluated it,
+        including its debug drawing handle.
+
+        Returns:
+            object: The solver RTVal.
+
+        """
+
+        if self._shareSolver:
+            solverRTVal = KLOperator._sharedSolvers.get(self.solverTypeName)
+            if solverRTVal is None:
+                solverRTVal = ks.constructRTVal(self.solverTypeName)
+                KLOperator._sharedSolvers[self.solverTypeName] = solverRTVal
+
+            return solverRTVal
+
+        if self._solverRTVal is None:
+            self._solverRTVal = ks.constructRTVal(self.solverTypeName)
+
+        return self._solverRTVal
+
+
+    def getShareSolver(self):
+        """Returns whether this operator shares its solver with the other
+        operators of the same solver type.
+
+        Returns:
+            bool: True if the solver is shared.
+
+        """
+
+        return self._shareSolver
+
+
     def getSolverTypeName(self):
         """Returns the solver type name for this operator.
 
@@ -108,9 +218,9 @@ class KLOperator(Operator):
         opSourceCode += "  if(solver == null)\n"
         opSourceCode += "    solver = " + self.solverTypeName + "();\n"
         opSourceCode += "  solver.solve(\n"
-        for i in xrange(len(self.args)):
-            argName = self.args[i].name.getSimpleType()
-            if i == len(self.args) - 1:
+        for i in xrange(len(self._argPlan)):
+            argName = self._argPlan[i][0]
+            if i == len(self._argPlan) - 1:
                 opSourceCode += "    " + argName + "\n"
             else:
                 opSourceCode += "    " + argName + ",\n"
@@ -166,74 +276,85 @@ class KLOperator(Operator):
                         raise TypeError(self.getName() + ".evaluate(): Invalid Argument Value: " + str(rtVal) + " (" + type(rtVal).__name__ + "), for Argument: " + argName + " (" + argDataType + ")")
 
 
-        argVals = []
-        debug = []
-        for i in xrange(len(self.args)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
-
-            if argDataType == 'EvalContext':
-                argVals.append(ks.constructRTVal(argDataType))
-                continue
-            if argName == 'time':
-                argVals.append(ks.constructRTVal(argDataType))
-                continue
-            if argName == 'frame':
-                argVals.append(ks.constructRTVal(argDataType))
+        # The context arguments and the arrays are constructed on the first
+        # evaluation and reused, arrays are only resized when the number of
+        # connected objects changed.
+        argVals = self._argVals
+        for i, (argName, argDataType, argConnectionType, isArray, elementType, isContext) in enumerate(self._argPlan):
+            if isContext:
+                if argVals[i] is None:
+                    argVals[i] = ks.constructRTVal(argDataType)
                 continue
 
             if argConnectionType == 'In':
-                if str(argDataType).endswith('[]'):
-                    rtValArray = ks.rtVal(argDataType)
-                    rtValArray.resize(len(self.inputs[argName]))
-                    for j in xrange(len(self.inputs[argName])):
-                        rtVal = getRTVal(self.inputs[argName][j])
-
-                        validateArg(rtVal, argName, argDataType[:-2])
-
-                        rtValArray[j] = rtVal
-
-                    argVals.append(rtValArray)
-                else:
-                    rtVal = getRTVal(self.inputs[argName])
-
-                    validateArg(rtVal, argName, argDataType)
-
-                    argVals.append(rtVal)
+                port = self.inputs[argName]
             else:
-                if str(argDataType).endswith('[]'):
+                port = self.outputs[argName]
+
+            if isArray and elementType == 'Mat44' and len(port) > 0 and \
+                    all(isinstance(x, (Object3D, Xfo)) for x in port):
+
+                # Transforms are written to an Xfo[] and converted to a
+                # Mat44[] by a single KL call instead of one toMat44() call
+                # per element.
+                xfoArray = self._xfoArrayVals[i]
+                if xfoArray is None:
+                    xfoArray = (ks.rtVal('KrakenXfoArray'), ks.rtVal('Xfo[]'))
+                    self._xfoArrayVals[i] = xfoArray
+
+                xfoArrayRTVal, xfos = xfoArray
+                if len(xfos) != len(port):
+                    xfos.resize(len(port))
+
+                for j, obj in enumerate(port):
+                    if isinstance(obj, Object3D):
+                        xfos[j] = obj.xfo.getRTVal()
+                    else:
+                        xfos[j] = obj.getRTVal()
+
+                xfoArrayRTVal.values = xfos
+                argVals[i] = xfoArrayRTVal.toMat44s('Mat44[]')
+
+            elif isArray:
+                rtVals = [getRTVal(x) for x in port]
+                if elementType in ('Scalar', 'Float32', 'UInt32', 'Integer', 'Boolean', 'String'):
+                    for rtVal in rtVals:
+                        validateArg(rtVal, argName, elementType)
+
+                rtValArray = argVals[i]
+                if rtValArray is None:
                     rtValArray = ks.rtVal(argDataType)
-                    rtValArray.resize(len(self.outputs[argName]))
-                    for j in xrange(len(self.outputs[argName])):
-                        rtVal = getRTVal(self.outputs[argName][j])
-
-                        validateArg(rtVal, argName, argDataType[:-2])
+                    argVals[i] = rtValArray
 
-                        rtValArray[j] = rtVal
-
-                    argVals.append(rtValArray)
-                else:
-                    rtVal = getRTVal(self.outputs[argName])
+                if len(rtValArray) != len(rtVals):
+                    rtValArray.resize(len(rtVals))
 
-                    validateArg(rtVal, argName, argDataType)
+                for j, rtVal in enumerate(rtVals):
+                    rtValArray[j] = rtVal
+            else:
+                rtVal = getRTVal(port)
 
-                    argVals.append(rtVal)
+                validateArg(rtVal, argName, argDataType)
 
-            debug.append({argName : [{"dataType": argDataType, "connectionType": argConnectionType}, argVals[-1]]})
+                argVals[i] = rtVal
 
         try:
             self.solverRTVal.solve('', *argVals)
         except:
             errorMsg = "Possible problem with KL operator '" + self.getName() + "' arguments:"
             print errorMsg
+
+            debug = []
+            for i, argPlan in enumerate(self._argPlan):
+                if not argPlan[5]:
+                    debug.append({argPlan[0] : [{"dataType": argPlan[1], "connectionType": argPlan[2]}, argVals[i]]})
+
             pprint.pprint(debug, width=800)
 
             raise Exception(errorMsg)
 
         # Now put the computed values out to the connected output objects.
-        def setRTVal(obj, rtval):
+        def setRTVal(obj, rtval, portName):
             if isinstance(obj, Object3D):
                 obj.xfo.setFromMat44(Mat44(rtval))
             elif isinstance(obj, Xfo):
@@ -248,17 +369,16 @@ class KLOperator(Operator):
                 print "Warning: Not setting rtval: %s\n\tfor output object: %s\n\ton port: %s\n\tof KL object: %s\n." % \
                 (rtval, obj, portName, self.getName())
 
-        for i in xrange(len(argVals)):
-            arg = self.args[i]
-            argName = arg.name.getSimpleType()
-            argDataType = arg.dataType.getSimpleType()
-            argConnectionType = arg.connectionType.getSimpleType()
+        for i, (argName, argDataType, argConnectionType, isArray, elementType, isContext) in enumerate(self._argPlan):
+            if argConnectionType == 'In' or isContext:
+                continue
 
-            if argConnectionType != 'In':
-                if str(argDataType).endswith('[]'):
-                    for j in xrange(len(argVals[i])):
-                        setRTVal(self.outputs[argName][j], argVals[i][j])
-                else:
-                    setRTVal(self.outputs[argName], argVals[i])
+            if isArray:
+                port = self.outputs[argName]
+                rtValArray = argVals[i]
+                for j in xrange(len(rtValArray)):
+                    setRTVal(port[j], rtValArray[j], argName)
+            else:
+                setRTVal(self.outputs[argName], argVals[i], argName)
 
-        return True
\ No newline at end of file
+        return True
@@ -13,6 +13,7 @@ from container import Container
 from kraken.core.kraken_system import KrakenSystem
 from kraken.core.profiler import Profiler
 from kraken.core.objects.layer import Layer
+from kraken.core.objects.hierarchy_index import HierarchyIndex
 from kraken.helpers.utility_methods import prepareToSave, prepareToLoad
 
 
@@ -22,6 +23,82 @@ class Rig(Container):
     def __init__(self, name='rig'):
         super(Rig, self).__init__(name)
         self._metaData = {}
+        self._hierarchyIndex = HierarchyIndex(self)
+
+
+    # ==============
+    # Index Methods
+    # ==============
+    def getHierarchyIndex(self):
+        """Returns the index of the objects in this rig.
+
+        Returns:
+            HierarchyIndex: The index of this rig, None if this rig is not
+                the root of its hierarchy.
+
+        """
+
+        if self.getParent() is not None:
+            return None
+
+        return self._hierarchyIndex
+
+
+    def getChildrenByType(self, childType):
+        """Returns all children that are of the specified type.
+
+        Args:
+            childType (str): Type of children to find.
+
+        Returns:
+            list: Array of child objects of the specified type.
+
+        """
+
+        index = self.getHierarchyIndex()
+        if index is None:
+            return super(Rig, self).getChildrenByType(childType)
+
+        return index.getChildrenByType(self, childType)
+
+
+    def getItemsByType(self, typeName, inheritedClass=True):
+        """Returns all objects in this rig that are of the specified type.
+
+        Args:
+            typeName (str): Type of objects to find.
+            inheritedClass (bool): Match objects that are a sub-class of type.
+
+        Returns:
+            list: Matching objects in hierarchy order.
+
+        """
+
+        index = self.getHierarchyIndex()
+        if index is None:
+            return self.getDescendents(classType=typeName,
+                                       inheritedClass=True if inheritedClass else None)
+
+        return index.getItemsByType(typeName, exactType=not inheritedClass)
+
+
+    def getComponentItems(self, component):
+        """Returns all objects in this rig that belong to a component.
+
+        Args:
+            component (Component): Component to get the objects of.
+
+        Returns:
+            list: Objects of the component in hierarchy order.
+
+        """
+
+        index = self.getHierarchyIndex()
+        if index is None:
+            return [x for x in self.getDescendents() if x.getComponent() is component]
+
+        return index.getComponentItems(component)
+
 
     # ====================
     # Load / Save Methods
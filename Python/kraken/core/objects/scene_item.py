@@ -6,6 +6,88 @@ SceneItem - Base SceneItem Object.
 """
 
 
+# Paths are cached on each scene item along with the generation they were
+# computed in. Any change to a name, parent or component starts a new
+# generation, which invalidates the paths of every item below it at once.
+_pathGeneration = 0
+_pathCacheStats = {
+    'hits': 0,
+    'misses': 0
+}
+
+
+# The type names of each class, computed once per class. Holds a tuple of the
+# names in method resolution order and a frozenset for membership tests.
+_typeHierarchyCache = {}
+
+
+def _getTypeHierarchy(cls):
+    """Returns the cached type names of a class.
+
+    Args:
+        cls (type): The class to get the type names of.
+
+    Returns:
+        tuple: The names of the classes in method resolution order, excluding
+            'object', and a frozenset of all the names.
+
+    """
+
+    typeHierarchy = _typeHierarchyCache.get(cls)
+    if typeHierarchy is None:
+        mro = type.mro(cls)
+        names = tuple([x.__name__ for x in mro[:mro.index(object)]])
+        typeHierarchy = (names, frozenset([x.__name__ for x in mro]))
+        _typeHierarchyCache[cls] = typeHierarchy
+
+    return typeHierarchy
+
+
+def invalidatePathCache():
+    """Invalidates the cached paths of all the scene items."""
+
+    global _pathGeneration
+
+    _pathGeneration += 1
+
+
+def getPathGeneration():
+    """Returns the current generation of the path cache.
+
+    Returns:
+        int: generation, changes each time the path cache is invalidated.
+
+    """
+
+    return _pathGeneration
+
+
+def getPathCacheStats():
+    """Returns the counters of the path cache.
+
+    Returns:
+        dict: The 'hits' and 'misses' of getPath() and getDecoratedPath(), and
+            the 'hitRate' as a ratio between 0.0 and 1.0.
+
+    """
+
+    stats = dict(_pathCacheStats)
+    total = stats['hits'] + stats['misses']
+    if total > 0:
+        stats['hitRate'] = stats['hits'] / float(total)
+    else:
+        stats['hitRate'] = 0.0
+
+    return stats
+
+
+def resetPathCacheStats():
+    """Resets the counters of the path cache."""
+
+    _pathCacheStats['hits'] = 0
+    _pathCacheStats['misses'] = 0
+
+
 class SceneItem(object):
     """Kraken base object type for any 3D object."""
 
@@ -14,6 +96,9 @@ class SceneItem(object):
         self._parent = parent
         self._name = name
         self._component = None
+        self._cachedPath = None
+        self._cachedDecoratedPath = None
+        self._pathCacheGeneration = _pathGeneration
 
 
     # ==============
@@ -38,13 +123,7 @@ class SceneItem(object):
 
         """
 
-        khierarchy = []
-        for cls in type.mro(type(self)):
-            if cls == object:
-                break
-            khierarchy.append(cls.__name__)
-
-        return khierarchy
+        return list(_getTypeHierarchy(type(self))[0])
 
 
     def isTypeOf(self, typeName):
@@ -55,11 +134,7 @@ class SceneItem(object):
 
         """
 
-        for cls in type.mro(type(self)):
-            if cls.__name__ == typeName:
-                return True
-
-        return False
+        return typeName in _getTypeHierarchy(type(self))[1]
 
 
     # =============
@@ -87,6 +162,9 @@ class SceneItem(object):
 
         """
 
+        if name != self._name:
+            invalidatePathCache()
+
         self._name = name
 
         return True
@@ -100,10 +178,24 @@ class SceneItem(object):
 
         """
 
+        if self._pathCacheGeneration != _pathGeneration:
+            self._cachedPath = None
+            self._cachedDecoratedPath = None
+            self._pathCacheGeneration = _pathGeneration
+
+        if self._cachedPath is not None:
+            _pathCacheStats['hits'] += 1
+            return self._cachedPath
+
+        _pathCacheStats['misses'] += 1
         if self.getParent() is not None:
-            return self.getParent().getPath() + '.' + self.getName()
+            path = self.getParent().getPath() + '.' + self.getName()
+        else:
+            path = self.getName()
+
+        self._cachedPath = path
 
-        return self.getName()
+        return path
 
 
     def getNameDecoration(self):
@@ -136,11 +228,24 @@ class SceneItem(object):
 
         """
 
+        if self._pathCacheGeneration != _pathGeneration:
+            self._cachedPath = None
+            self._cachedDecoratedPath = None
+            self._pathCacheGeneration = _pathGeneration
 
+        if self._cachedDecoratedPath is not None:
+            _pathCacheStats['hits'] += 1
+            return self._cachedDecoratedPath
+
+        _pathCacheStats['misses'] += 1
         if self.getParent() is not None:
-            return self.getParent().getDecoratedPath() + '.' + self.getDecoratedName()
+            decoratedPath = self.getParent().getDecoratedPath() + '.' + self.getDecoratedName()
+        else:
+            decoratedPath = self.getDecoratedName()
+
+        self._cachedDecoratedPath = decoratedPath
 
-        return self.getDecoratedName()
+        return decoratedPath
 
 
     # ===============
@@ -168,6 +273,9 @@ class SceneItem(object):
 
         """
 
+        if parent is not self._parent:
+            invalidatePathCache()
+
         self._parent = parent
 
         return True
@@ -196,6 +304,9 @@ class SceneItem(object):
 
         """
 
+        if component is not self._component:
+            invalidatePathCache()
+
         self._component = component
 
         return True
@@ -0,0 +1,498 @@
+"""Kraken - core.rig_evaluator module.
+
+Classes:
+RigEvaluator - Evaluates the global transforms of a rig in Python.
+
+"""
+
+from kraken.core.maths.xfo import Xfo
+from kraken.core.objects.object_3d import Object3D
+
+
+class RigEvaluator(object):
+    """Evaluates the global transforms of the objects of a rig without a DCC.
+
+    When a rig is set, its current pose is captured as the bind pose: the
+    transform of each object relative to its parent and the offsets of the
+    constraints that maintain offset. Evaluating the rig then computes the
+    global transform of each object from its parent, its constraints and the
+    KL operators that output to it, and stores it on the object's xfo.
+
+    Changing the transform of an object marks it and everything downstream of
+    it dirty. Only dirty objects and operators are computed again.
+
+    Constraints are solved in Python with solveXfo(). Constraint classes that
+    don't implement it are computed by their KL solver, which requires Fabric
+    Engine.
+
+    """
+
+    def __init__(self, rig=None, evaluateOperators=True):
+        """Initializes the evaluator.
+
+        Args:
+            rig (Rig): Rig to evaluate.
+            evaluateOperators (bool): Whether to evaluate the KL operators of
+                the components. Objects driven by operators keep their current
+                transform when False. Evaluating operators requires Fabric
+                Engine.
+
+        """
+
+        super(RigEvaluator, self).__init__()
+        self._rig = None
+        self._evaluateOperators = evaluateOperators
+
+        self._nodes = []
+        self._positions = {}
+        self._downstream = {}
+        self._dirty = set()
+
+        self._parents = {}
+        self._localXfos = {}
+        self._bindXfos = {}
+        self._offsets = {}
+        self._operatorDriven = set()
+
+        if rig is not None:
+            self.setRig(rig)
+
+
+    # ============
+    # Rig Methods
+    # ============
+    def getRig(self):
+        """Returns the rig evaluated by this evaluator.
+
+        Returns:
+            Rig: The evaluated rig.
+
+        """
+
+        return self._rig
+
+
+    def setRig(self, rig):
+        """Sets the rig to evaluate and captures its current pose as the bind
+        pose.
+
+        Args:
+            rig (Rig): Rig to evaluate.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        self._rig = rig
+        self.bind()
+
+        return True
+
+
+    def bind(self):
+        """Captures the current pose of the rig as the bind pose and builds the
+        evaluation order.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        items = [self._rig] + self._rig.getDescendents()
+        itemKeys = set([id(x) for x in items])
+
+        operators = []
+        for item in items:
+            if item.isTypeOf('Component'):
+                operators.extend(item.getOperators())
+
+        # Collect the nodes each node depends on.
+        dependencies = {}
+        operatorOutputs = {}
+        for operator in operators:
+            inputs = [x for x in self._getOperatorObjects(operator.inputs) if id(x) in itemKeys]
+            dependencies[id(operator)] = inputs
+            for output in self._getOperatorObjects(operator.outputs):
+                operatorOutputs.setdefault(id(output), []).append(operator)
+
+        self._parents = {}
+        self._operatorDriven = set()
+        for item in items:
+            itemDependencies = []
+
+            parent = item.getParent()
+            if parent is not None and id(parent) in itemKeys:
+                self._parents[id(item)] = parent
+                itemDependencies.append(parent)
+
+            for constraint in self._getConstraints(item):
+                for constrainer in constraint.getConstrainers():
+                    if id(constrainer) not in itemKeys:
+                        raise ValueError("Constrainer '" + constrainer.getPath() + "' of '" +
+                                         constraint.getPath() + "' is not in the rig.")
+
+                    itemDependencies.append(constrainer)
+
+            if id(item) in operatorOutputs:
+                self._operatorDriven.add(id(item))
+                itemDependencies.extend(operatorOutputs[id(item)])
+
+            dependencies[id(item)] = itemDependencies
+
+        self._nodes = self._sortNodes(items + operators, dependencies)
+        self._positions = dict([(id(x), i) for i, x in enumerate(self._nodes)])
+
+        self._downstream = {}
+        for node in self._nodes:
+            for dependency in dependencies[id(node)]:
+                self._downstream.setdefault(id(dependency), []).append(node)
+
+        # Capture the bind pose.
+        self._bindXfos = {}
+        self._localXfos = {}
+        self._offsets = {}
+        for item in items:
+            xfo = item.xfo
+            self._bindXfos[id(item)] = Xfo(xfo)
+
+            parent = self._parents.get(id(item))
+            if parent is None:
+                self._localXfos[id(item)] = Xfo(xfo)
+            else:
+                self._localXfos[id(item)] = parent.xfo.inverse().multiply(xfo)
+
+            for constraint in self._getConstraints(item):
+                if constraint.getMaintainOffset():
+                    globalXfo = self._solveConstraint(constraint, xfo)
+                    self._offsets[id(constraint)] = globalXfo.inverse().multiply(xfo)
+
+        self._dirty = set()
+
+        return True
+
+
+    def _solveConstraint(self, constraint, xfo):
+        """Computes a constraint from the current transforms of its
+        constrainers.
+
+        Constraints that don't implement solveXfo() fall back to compute().
+
+        Args:
+            constraint (Constraint): Constraint to compute.
+            xfo (Xfo): Global transform of the constrainee before the
+                constraint is applied.
+
+        Returns:
+            Xfo: The result of the constraint in global space, before the
+                offset is applied.
+
+        """
+
+        constrainerXfos = [x.xfo for x in constraint.getConstrainers()]
+        try:
+            return constraint.solveXfo(constrainerXfos, xfo)
+        except NotImplementedError:
+            constrainee = constraint.getConstrainee()
+
+            def getGlobalXfoFunc(obj):
+                if obj is constrainee:
+                    return xfo
+
+                return obj.xfo
+
+            return constraint.compute(getGlobalXfoFunc)
+
+
+    def _getConstraints(self, item):
+        """Returns the constraints of an object that have constrainers.
+
+        Args:
+            item (Object3D): Object to get the constraints of.
+
+        Returns:
+            list: The constraints in the order they were added.
+
+        """
+
+        constraints = []
+        for i in xrange(item.getNumConstraints()):
+            constraint = item.getConstraintByIndex(i)
+            if len(constraint.getConstrainers()) > 0:
+                constraints.append(constraint)
+
+        return constraints
+
+
+    def _getOperatorObjects(self, ports):
+        """Returns the objects connected to the ports of an operator.
+
+        Args:
+            ports (dict): Inputs or outputs of the operator.
+
+        Returns:
+            list: The connected Object3D objects.
+
+        """
+
+        objects = []
+        for port in ports.values():
+            if not isinstance(port, list):
+                port = [port]
+
+            for obj in port:
+                if isinstance(obj, Object3D):
+                    objects.append(obj)
+
+        return objects
+
+
+    def _sortNodes(self, nodes, dependencies):
+        """Sorts the nodes so each node comes after the nodes it depends on.
+
+        Args:
+            nodes (list): Objects and operators in hierarchy order.
+            dependencies (dict): Nodes each node depends on, by node id.
+
+        Returns:
+            list: The sorted nodes.
+
+        """
+
+        positions = dict([(id(x), i) for i, x in enumerate(nodes)])
+        counts = dict([(id(x), len(dependencies[id(x)])) for x in nodes])
+
+        dependents = {}
+        for node in nodes:
+            for dependency in dependencies[id(node)]:
+                dependents.setdefault(id(dependency), []).append(node)
+
+        ready = [x for x in nodes if counts[id(x)] == 0]
+        ready.reverse()
+        order = []
+        while len(ready) > 0:
+            node = ready.pop()
+            order.append(node)
+            released = []
+            for dependent in dependents.get(id(node), []):
+                counts[id(dependent)] -= 1
+                if counts[id(dependent)] == 0:
+                    released.append(dependent)
+
+            released.sort(key=lambda x: positions[id(x)], reverse=True)
+            ready.extend(released)
+
+        if len(order) != len(nodes):
+            cycle = [x.getPath() for x in nodes if counts[id(x)] > 0]
+            raise ValueError("Circular dependencies detected between: " + ", ".join(cycle))
+
+        return order
+
+
+    # ================
+    # Dirty Methods
+    # ================
+    def markDirty(self, node):
+        """Marks an object or operator and everything downstream of it dirty.
+
+        Args:
+            node (object): Object or operator to mark dirty.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if id(node) not in self._positions:
+            raise ValueError("'" + node.getPath() + "' is not evaluated by this evaluator.")
+
+        stack = [node]
+        while len(stack) > 0:
+            eachNode = stack.pop()
+            if id(eachNode) in self._dirty:
+                continue
+
+            self._dirty.add(id(eachNode))
+            stack.extend(self._downstream.get(id(eachNode), []))
+
+        return True
+
+
+    def isDirty(self, node):
+        """Returns whether an object or operator needs to be evaluated.
+
+        Args:
+            node (object): Object or operator to test.
+
+        Returns:
+            bool: True if the node is dirty.
+
+        """
+
+        return id(node) in self._dirty
+
+
+    def getNumDirty(self):
+        """Returns the number of nodes that need to be evaluated.
+
+        Returns:
+            int: Number of dirty objects and operators.
+
+        """
+
+        return len(self._dirty)
+
+
+    # ===============
+    # Xfo Methods
+    # ===============
+    def getGlobalXfo(self, item):
+        """Returns the evaluated global transform of an object.
+
+        Args:
+            item (Object3D): Object to get the transform of.
+
+        Returns:
+            Xfo: The global transform of the object.
+
+        """
+
+        if len(self._dirty) > 0:
+            self.evaluate()
+
+        return item.xfo
+
+
+    def setGlobalXfo(self, item, xfo):
+        """Moves an object to a global transform, keeping it relative to its
+        parent from now on.
+
+        Args:
+            item (Object3D): Object to move.
+            xfo (Xfo): The new global transform.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        parent = self._parents.get(id(item))
+        if parent is None:
+            localXfo = Xfo(xfo)
+        else:
+            localXfo = self.getGlobalXfo(parent).inverse().multiply(xfo)
+
+        return self.setLocalXfo(item, localXfo)
+
+
+    def getLocalXfo(self, item):
+        """Returns the transform of an object relative to its parent.
+
+        Args:
+            item (Object3D): Object to get the transform of.
+
+        Returns:
+            Xfo: The local transform of the object.
+
+        """
+
+        return Xfo(self._localXfos[id(item)])
+
+
+    def setLocalXfo(self, item, xfo):
+        """Sets the transform of an object relative to its parent.
+
+        Args:
+            item (Object3D): Object to move.
+            xfo (Xfo): The new local transform.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        if id(item) not in self._localXfos:
+            raise ValueError("'" + item.getPath() + "' is not evaluated by this evaluator.")
+
+        self._localXfos[id(item)] = Xfo(xfo)
+        self.markDirty(item)
+
+        return True
+
+
+    def resetPose(self):
+        """Moves all objects back to the bind pose.
+
+        Returns:
+            bool: True if successful.
+
+        """
+
+        for node in self._nodes:
+            bindXfo = self._bindXfos.get(id(node))
+            if bindXfo is None:
+                continue
+
+            node.xfo = bindXfo
+
+            parent = self._parents.get(id(node))
+            if parent is None:
+                self._localXfos[id(node)] = Xfo(bindXfo)
+            else:
+                self._localXfos[id(node)] = self._bindXfos[id(parent)].inverse().multiply(bindXfo)
+
+        self._dirty = set()
+
+        return True
+
+
+    # ===================
+    # Evaluation Methods
+    # ===================
+    def evaluate(self):
+        """Evaluates the dirty objects and operators in dependency order.
+
+        Returns:
+            int: The number of objects and operators evaluated.
+
+        """
+
+        positions = self._positions
+        dirtyNodes = sorted(self._dirty, key=lambda x: positions[x])
+        self._dirty = set()
+
+        for position in [positions[x] for x in dirtyNodes]:
+            node = self._nodes[position]
+            if isinstance(node, Object3D):
+                self._evaluateItem(node)
+            elif self._evaluateOperators:
+                node.evaluate()
+
+        return len(dirtyNodes)
+
+
+    def _evaluateItem(self, item):
+        """Computes the global transform of an object.
+
+        Args:
+            item (Object3D): Object to compute the transform of.
+
+        """
+
+        if id(item) in self._operatorDriven:
+            xfo = item.xfo
+        else:
+            parent = self._parents.get(id(item))
+            if parent is None:
+                xfo = self._localXfos[id(item)]
+            else:
+                xfo = parent.xfo.multiply(self._localXfos[id(item)])
+
+        for constraint in self._getConstraints(item):
+            xfo = self._solveConstraint(constraint, xfo)
+
+            offset = self._offsets.get(id(constraint))
+            if offset is not None:
+                xfo = xfo.multiply(offset)
+
+        item.xfo = xfo
@@ -5,27 +5,118 @@ __all__ = [os.path.splitext(os.path.basename(plugin))[0]
            for path in __path__
            for plugin in glob.glob(os.path.join(path, '*_plugin'))]
 
+_devReload = os.environ.get('KRAKEN_DEV_RELOAD', '') not in ('', '0')
+_pluginNames = {}
+_pluginModules = {}
 
-def getBuilder():
-    """Returns the appropriate builder module for the DCC.
 
-    Return:
-    Builder, instance of the builder for the DCC.
+def getDevReload():
+    """Returns whether the plugin modules are reloaded on every call.
+
+    Returns:
+        bool: True if the plugin modules are reloaded.
 
     """
 
-    dccBuilder = None
+    return _devReload
+
+
+def setDevReload(enabled):
+    """Sets whether the plugin modules are reloaded on every call.
+
+    Reloading picks up edits made to the plugins while the DCC is running. It
+    is meant for plugin development only and is slow, so it is off unless
+    enabled here or with the 'KRAKEN_DEV_RELOAD' environment variable.
+
+    Args:
+        enabled (bool): True to reload the plugin modules on every call.
+
+    """
+
+    global _devReload
+
+    _devReload = enabled
+
+
+def clearPluginCache():
+    """Clears the resolved plugin and plugin modules so they are looked up
+    again on the next call."""
 
+    _pluginNames.clear()
+    _pluginModules.clear()
+
+
+def getPluginName():
+    """Returns the name of the plugin for the DCC Kraken is running in.
+
+    The plugin is resolved once per value of the 'KRAKEN_DCC' environment
+    variable.
+
+    Returns:
+        str: Name of the plugin package, None if no plugin matches the DCC.
+
+    """
+
+    krakenDCC = os.environ.get('KRAKEN_DCC')
+    if not _devReload and krakenDCC in _pluginNames:
+        return _pluginNames[krakenDCC]
+
+    pluginName = None
     for eachPlugin in __all__:
         mod = __import__("kraken.plugins." + eachPlugin, fromlist=['dccTest'])
-        reload(mod)
+        if _devReload:
+            reload(mod)
 
         if mod.dccTest() is True:
-            loaded_mod = __import__("kraken.plugins." + eachPlugin + ".builder", fromlist=['builder'])
+            pluginName = eachPlugin
+
+    _pluginNames[krakenDCC] = pluginName
+
+    return pluginName
+
+
+def getPluginModule(moduleName):
+    """Returns a module of the plugin for the DCC Kraken is running in.
+
+    Args:
+        moduleName (str): Path of the module in the plugin package, i.e. 'builder'.
+
+    Returns:
+        module: The plugin module, None if no plugin matches the DCC.
+
+    """
+
+    pluginName = getPluginName()
+    if pluginName is None:
+        return None
+
+    modulePath = "kraken.plugins." + pluginName + "." + moduleName
+    loaded_mod = _pluginModules.get(modulePath)
+    if loaded_mod is None or _devReload:
+        loaded_mod = __import__(modulePath, fromlist=[moduleName.rsplit('.', 1)[-1]])
+        if _devReload:
             reload(loaded_mod)
-            loaded_class = getattr(loaded_mod, 'Builder')
 
-            dccBuilder = loaded_class()
+        _pluginModules[modulePath] = loaded_mod
+
+    return loaded_mod
+
+
+def getBuilder():
+    """Returns the appropriate builder module for the DCC.
+
+    Return:
+    Builder, instance of the builder for the DCC.
+
+    """
+
+    dccBuilder = None
+
+    loaded_mod = getPluginModule('builder')
+    if loaded_mod is not None:
+        loaded_class = getattr(loaded_mod, 'Builder')
+
+        dccBuilder = loaded_class()
 
     if dccBuilder is None:
         print "Failed to find DCC builder. Falling back to Python builder."
@@ -46,16 +137,11 @@ def getSynchronizer():
 
     dccSynchronizer = None
 
-    for eachPlugin in __all__:
-        mod = __import__("kraken.plugins." + eachPlugin, fromlist=['dccTest'])
-        reload(mod)
+    loaded_mod = getPluginModule('synchronizer')
+    if loaded_mod is not None:
+        loaded_class = getattr(loaded_mod, 'Synchronizer')
 
-        if mod.dccTest() is True:
-            loaded_mod = __import__("kraken.plugins." + eachPlugin + ".synchronizer", fromlist=['synchronizer'])
-            reload(loaded_mod)
-            loaded_class = getattr(loaded_mod, 'Synchronizer')
-
-            dccSynchronizer = loaded_class()
+        dccSynchronizer = loaded_class()
 
     if dccSynchronizer is None:
         print "Failed to find DCC Synchronizer. Falling back to Python Synchronizer."
@@ -76,16 +162,11 @@ def getLogHandler():
 
     handler = None
 
-    for eachPlugin in __all__:
-        mod = __import__("kraken.plugins." + eachPlugin, fromlist=['dccTest'])
-        reload(mod)
+    loaded_mod = getPluginModule('log.handler')
+    if loaded_mod is not None:
+        loaded_class = getattr(loaded_mod, 'DCCHandler')
 
-        if mod.dccTest() is True:
-            loaded_mod = __import__("kraken.plugins." + eachPlugin + ".log.handler", fromlist=['handler'])
-            reload(loaded_mod)
-            loaded_class = getattr(loaded_mod, 'DCCHandler')
-
-            handler = loaded_class()
+        handler = loaded_class()
 
     return handler
 
@@ -103,15 +184,9 @@ def getFabricClient():
 
     client = None
 
-    for eachPlugin in __all__:
-        mod = __import__("kraken.plugins." + eachPlugin, fromlist=['dccTest'])
-        reload(mod)
-
-        if mod.dccTest() is True:
-            loaded_mod = __import__("kraken.plugins." + eachPlugin + ".fabric_client", fromlist=['getClient'])
-            reload(loaded_mod)
-
-            client = loaded_mod.getClient()
+    loaded_mod = getPluginModule('fabric_client')
+    if loaded_mod is not None:
+        client = loaded_mod.getClient()
 
     if client is None:
         print "Failed to find DCC client. Falling back to Python client."
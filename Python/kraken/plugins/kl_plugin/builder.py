@@ -7,8 +7,10 @@ Builder -- Component representation.
 
 import os
 import json
+import time
+import hashlib
 
-from kraken.core.kraken_system import ks
+from kraken.core.kraken_system import ks, krakenExtsDir
 from kraken.core.builder import Builder
 from kraken.core.objects.object_3d import Object3D
 from kraken.core.objects.scene_item import SceneItem
@@ -52,6 +54,9 @@ class Builder(Builder):
     __klConstraints = None
     __klSolvers = None
     __klCanvasOps = None
+    __klIndexes = None
+    __soaLayout = None
+    __buildHash = None
     __klPreCode = None
     __klExtExecuted = None
     __krkItems = None
@@ -161,18 +166,20 @@ class Builder(Builder):
         driver = item['driver']
 
         if driver is None:
+            kl += [self.__klStep(member, [member], [member], hierarchy=(item['index'], -1))]
             kl += ["", "  // solving global transform %s" % member]
-            kl += ["  this.%s.globalXfo = this.%s.xfo;" % (member, member)]
+            kl += ["  %s = %s;" % (self.__klGlobalXfo(item), self.__klXfo(item))]
             self.__krkVisitedObjects.append(item);
             return kl
 
         driverObj = self.findKLObjectForSI(driver)
         if driverObj:
             kl += self.__visitKLObject(driverObj)
+            kl += [self.__klStep(member, [driverObj['member'], member], [member], hierarchy=(item['index'], driverObj['index']))]
             kl += ["", "  // solving parent child constraint %s" % member]
             if self.__debugMode:
                 kl += ["  report(\"solving parent child constraint %s\");" % member]
-            kl += ["  this.%s.globalXfo = this.%s.globalXfo * this.%s.xfo;" % (member, driverObj['member'], member)]
+            kl += ["  %s = %s * %s;" % (self.__klGlobalXfo(item), self.__klGlobalXfo(driverObj), self.__klXfo(item))]
             self.__krkVisitedObjects.append(item);
             return kl
 
@@ -180,23 +187,27 @@ class Builder(Builder):
         if driverConstraint:
             driverMember = driverConstraint['member']
             constraint = driverConstraint['sceneItem']
+            constrainerMembers = []
             for i in range(len(constraint.getConstrainers())):
                 constrainer = constraint.getConstrainers()[i]
                 constrainerObj = self.findKLObjectForSI(constrainer)
                 kl += self.__visitKLObject(constrainerObj)
+                constrainerMembers.append(constrainerObj['member'])
 
+            constraineeObj = self.findKLObjectForSI(constraint.getConstrainee())
+            kl += [self.__klStep(driverMember, constrainerMembers, [constraineeObj['member']])]
             kl += ["", "  // solving %s constraint %s" % (driverConstraint['sceneItem'].__class__.__name__, driverMember)]
             if self.__debugMode:
                 kl += ["  report(\"solving %s constraint %s\");" % (driverConstraint['sceneItem'].__class__.__name__, driverMember)]
             for i in range(len(constraint.getConstrainers())):
                 constrainer = constraint.getConstrainers()[i]
                 constrainerObj = self.findKLObjectForSI(constrainer)
-                kl += ['  this.%s.constrainers[%d] = this.%s.globalXfo;' % (driverMember, i, constrainerObj['member'])]
+                kl += ['  this.%s.constrainers[%d] = %s;' % (driverMember, i, self.__klGlobalXfo(constrainerObj))]
 
             constrainee = constraint.getConstrainee()
             constraineeObj = self.findKLObjectForSI(constrainee)
 
-            kl += ['  this.%s.globalXfo = this.%s.compute(this.%s.globalXfo);' % (constraineeObj['member'], driverMember, constraineeObj['member'])]
+            kl += ['  %s = this.%s.compute(%s);' % (self.__klGlobalXfo(constraineeObj), driverMember, self.__klGlobalXfo(constraineeObj))]
             self.__krkVisitedObjects.append(driverConstraint);
             self.__krkVisitedObjects.append(item);
             return kl
@@ -207,112 +218,46 @@ class Builder(Builder):
             kOperator = driverSolver['sceneItem']
             args = kOperator.getSolverArgs()
 
-            if not driverSolver.get('visited', False):
-                driverSolver['visited'] = True
+            # The outputs driven by the solver are retrieved when the solver
+            # is visited, an output visited again is only recorded.
+            if driverSolver.get('visited', False):
+                self.__krkVisitedObjects.append(item);
+                return kl
 
-                kl += ["", "  // solving KLSolver %s" % (driverMember)]
-                if self.__debugMode:
-                    kl += ["  report(\"solving KLSolver %s\");" % (driverMember)]
+            driverSolver['visited'] = True
 
-                # first let's find all args which are arrays and prepare storage
-                for i in xrange(len(args)):
-                    arg = args[i]
-                    argName = arg.name.getSimpleType()
-                    argDataType = arg.dataType.getSimpleType()
-                    argConnectionType = arg.connectionType.getSimpleType()
-                    connectedObjects = None
-                    argVarName = "%s_%s" % (driverMember, argName)
-                    isArray = argDataType.endswith('[]')
-
-                    if argConnectionType == 'In':
-                        connectedObjects = kOperator.getInput(argName)
-                    elif argConnectionType in ['IO', 'Out']:
-                        connectedObjects = kOperator.getOutput(argName)
-
-                    if isArray:
-                        kl += ["  %s %s[](%d);" % (argDataType[:-2], argVarName, len(connectedObjects))]
-                        if argConnectionType == 'Out':
-                            continue
-                        for j in xrange(len(connectedObjects)):
-                            connected = connectedObjects[j]
-
-                            if isinstance(connected, Attribute):
-                                connectedObj = self.findKLAttribute(connected)
-                                kl += ["  %s[%d] = this.%s.value;" % (argVarName, j, connectedObj['member'])]
-                                continue
-                            elif isinstance(connected, SceneItem):
-                                connectedObj = self.findKLObjectForSI(connected)
-                                kl += self.__visitKLObject(connectedObj)
-                                if argDataType == "Mat44[]":
-                                    kl += ["  %s[%d] = this.%s.globalXfo.toMat44();" % (argVarName, j, connectedObj['member'])]
-                                else:
-                                    kl += ["  %s[%d] = this.%s.globalXfo;" % (argVarName, j, connectedObj['member'])]
-                            elif isinstance(connected, Xfo):
-                                if argDataType == "Mat44[]":
-                                    kl += ["  %s[%d] = %s.toMat44();" % (argVarName, j, self.__getXfoAsStr(connected))]
-                                else:
-                                    kl += ["  %s[%d] = %s;" % (argVarName, j, self.__getXfoAsStr(connected))]
-                            elif isinstance(connected, str):
-                                kl += ["  %s[%d] = \"%s\";" % (argVarName, j, connected)]
-                            else:
-                                kl += ["  %s[%d] = %s;" % (argVarName, j, str(connected))]
-  
-                        continue
+            # visit the connected objects first so the solver and the
+            # retrieval of its results form a single step
+            reads = []
+            for i in xrange(len(args)):
+                arg = args[i]
+                argName = arg.name.getSimpleType()
+                argDataType = arg.dataType.getSimpleType()
+                argConnectionType = arg.connectionType.getSimpleType()
 
-                    if argConnectionType == 'Out':
-                        kl += ["  %s %s;" % (argDataType, argVarName)]
-                        continue
+                if argConnectionType == 'In':
+                    connectedObjects = kOperator.getInput(argName)
+                elif argConnectionType == 'IO':
+                    connectedObjects = kOperator.getOutput(argName)
+                else:
+                    continue
 
-                    connected = connectedObjects
-                    if isinstance(connected, Attribute):
-                        connectedObj = self.findKLAttribute(connected)
-                        kl += ["  %s %s = this.%s.value;" % (argDataType, argVarName, connectedObj['member'])]
-                        continue
+                if not argDataType.endswith('[]'):
+                    connectedObjects = [connectedObjects]
 
-                    if isinstance(connected, SceneItem):
+                for connected in connectedObjects:
+                    if isinstance(connected, Attribute):
+                        reads.append(self.findKLAttribute(connected)['member'])
+                    elif isinstance(connected, SceneItem):
                         connectedObj = self.findKLObjectForSI(connected)
-                        kl += self.__visitKLObject(connectedObj)
-
-                        if argDataType == "Mat44":
-                            kl += ["  %s %s = this.%s.globalXfo.toMat44();" % (argDataType, argVarName, connectedObj['member'])]
-                        else:
-                            kl += ["  %s %s = this.%s.globalXfo;" % (argDataType, argVarName, connectedObj['member'])]
-
-                    elif isinstance(connected, Xfo):
-                        if argDataType == "Mat44":
-                            kl += ["  %s %s = %s.toMat44();" % (argDataType, argVarName, self.__getXfoAsStr(connected))]
-                        else:
-                            kl += ["  %s %s = %s;" % (argDataType, argVarName, self.__getXfoAsStr(connected))]
-                    elif isinstance(connected, str):
-                        kl += ["  %s %s = \"%s\";" % (argDataType, argVarName, connected)]
-                    else:
-                        kl += ["  %s %s = %s;" % (argDataType, argVarName, str(connected))]
-
-                # perform the solve
-                if self.__debugMode:
-                    for i in xrange(len(args)):
-                        arg = args[i]
-                        argName = arg.name.getSimpleType()
-                        argDataType = arg.dataType.getSimpleType()
-                        argConnectionType = arg.connectionType.getSimpleType()
-                        if argConnectionType != 'In':
+                        if connectedObj['driver'] is kOperator:
                             continue
-                        kl += ["  report(\"arg %s \" + %s_%s);" % (argName, driverMember, argName)]
-
-                kl += ["  this.%s.solve(" % driverMember]
-                for i in xrange(len(args)):
-                    arg = args[i]
-                    argName = arg.name.getSimpleType()
-                    argVarName = "%s_%s" % (driverMember, argName)
-                    comma = ""
-                    if i < len(args) - 1:
-                        comma = ","
-                    kl += ["    %s%s" % (argVarName, comma)]
-
-                kl += ["  );"]
-                self.__krkVisitedObjects.append(driverSolver);
+                        kl += self.__visitKLObject(connectedObj)
+                        reads.append(connectedObj['member'])
 
-            # output to the results!
+            writes = []
+            outputObjs = []
+            notDrivenObjs = []
             for i in xrange(len(args)):
                 arg = args[i]
                 argName = arg.name.getSimpleType()
@@ -320,23 +265,135 @@ class Builder(Builder):
                 argConnectionType = arg.connectionType.getSimpleType()
                 if argConnectionType == 'In':
                   continue
-                argVarName = "%s_%s" % (driverMember, argName)
                 connectedObjects = kOperator.getOutput(argName)
                 if not argDataType.endswith('[]'):
                     connectedObjects = [connectedObjects]
 
                 for j in xrange(len(connectedObjects)):
-                    connected = connectedObjects[j]
-                    if connected.getDecoratedPath() == item['sceneItem'].getDecoratedPath():
-                        kl += ["", "  // retrieving value for %s from solver %s" % (member, driverMember)]
-                        if argDataType.endswith('[]'):
-                            kl += ["  this.%s.globalXfo = %s_%s[%d];" % (member, driverMember, argName, j)]
+                    connectedObj = self.findKLObjectForSI(connectedObjects[j])
+                    if connectedObj is None:
+                        continue
+                    if connectedObj['driver'] is kOperator and (connectedObj is item or not connectedObj['visited']):
+                        if connectedObj['member'] in writes:
+                            continue
+                        connectedObj['visited'] = True
+                        outputObjs.append((connectedObj, argName, argDataType, j))
+                        writes.append(connectedObj['member'])
+                    else:
+                        notDrivenObjs.append(connectedObj)
+
+            kl += [self.__klStep(driverMember, reads, writes)]
+            kl += ["", "  // solving KLSolver %s" % (driverMember)]
+            if self.__debugMode:
+                kl += ["  report(\"solving KLSolver %s\");" % (driverMember)]
+
+            # first let's find all args which are arrays and prepare storage
+            for i in xrange(len(args)):
+                arg = args[i]
+                argName = arg.name.getSimpleType()
+                argDataType = arg.dataType.getSimpleType()
+                argConnectionType = arg.connectionType.getSimpleType()
+                connectedObjects = None
+                argVarName = "%s_%s" % (driverMember, argName)
+                isArray = argDataType.endswith('[]')
+
+                if argConnectionType == 'In':
+                    connectedObjects = kOperator.getInput(argName)
+                elif argConnectionType in ['IO', 'Out']:
+                    connectedObjects = kOperator.getOutput(argName)
+
+                if isArray:
+                    kl += ["  %s %s[](%d);" % (argDataType[:-2], argVarName, len(connectedObjects))]
+                    if argConnectionType == 'Out':
+                        continue
+                    for j in xrange(len(connectedObjects)):
+                        connected = connectedObjects[j]
+
+                        if isinstance(connected, Attribute):
+                            connectedObj = self.findKLAttribute(connected)
+                            kl += ["  %s[%d] = %s;" % (argVarName, j, self.__klValue(connectedObj))]
+                            continue
+                        elif isinstance(connected, SceneItem):
+                            connectedObj = self.findKLObjectForSI(connected)
+                            if argDataType == "Mat44[]":
+                                kl += ["  %s[%d] = %s.toMat44();" % (argVarName, j, self.__klGlobalXfo(connectedObj))]
+                            else:
+                                kl += ["  %s[%d] = %s;" % (argVarName, j, self.__klGlobalXfo(connectedObj))]
+                        elif isinstance(connected, Xfo):
+                            if argDataType == "Mat44[]":
+                                kl += ["  %s[%d] = %s.toMat44();" % (argVarName, j, self.__getXfoAsStr(connected))]
+                            else:
+                                kl += ["  %s[%d] = %s;" % (argVarName, j, self.__getXfoAsStr(connected))]
+                        elif isinstance(connected, str):
+                            kl += ["  %s[%d] = \"%s\";" % (argVarName, j, connected)]
                         else:
-                            kl += ["  this.%s.globalXfo = %s_%s;" % (member, driverMember, argName)]
-                        self.__krkVisitedObjects.append(item);
+                            kl += ["  %s[%d] = %s;" % (argVarName, j, str(connected))]
+
+                    continue
+
+                if argConnectionType == 'Out':
+                    kl += ["  %s %s;" % (argDataType, argVarName)]
+                    continue
+
+                connected = connectedObjects
+                if isinstance(connected, Attribute):
+                    connectedObj = self.findKLAttribute(connected)
+                    kl += ["  %s %s = %s;" % (argDataType, argVarName, self.__klValue(connectedObj))]
+                    continue
+
+                if isinstance(connected, SceneItem):
+                    connectedObj = self.findKLObjectForSI(connected)
+
+                    if argDataType == "Mat44":
+                        kl += ["  %s %s = %s.toMat44();" % (argDataType, argVarName, self.__klGlobalXfo(connectedObj))]
                     else:
-                        connectedObj = self.findKLObjectForSI(connected)
-                        kl += self.__visitKLObject(connectedObj)
+                        kl += ["  %s %s = %s;" % (argDataType, argVarName, self.__klGlobalXfo(connectedObj))]
+
+                elif isinstance(connected, Xfo):
+                    if argDataType == "Mat44":
+                        kl += ["  %s %s = %s.toMat44();" % (argDataType, argVarName, self.__getXfoAsStr(connected))]
+                    else:
+                        kl += ["  %s %s = %s;" % (argDataType, argVarName, self.__getXfoAsStr(connected))]
+                elif isinstance(connected, str):
+                    kl += ["  %s %s = \"%s\";" % (argDataType, argVarName, connected)]
+                else:
+                    kl += ["  %s %s = %s;" % (argDataType, argVarName, str(connected))]
+
+            # perform the solve
+            if self.__debugMode:
+                for i in xrange(len(args)):
+                    arg = args[i]
+                    argName = arg.name.getSimpleType()
+                    argDataType = arg.dataType.getSimpleType()
+                    argConnectionType = arg.connectionType.getSimpleType()
+                    if argConnectionType != 'In':
+                        continue
+                    kl += ["  report(\"arg %s \" + %s_%s);" % (argName, driverMember, argName)]
+
+            kl += ["  this.%s.solve(" % driverMember]
+            for i in xrange(len(args)):
+                arg = args[i]
+                argName = arg.name.getSimpleType()
+                argVarName = "%s_%s" % (driverMember, argName)
+                comma = ""
+                if i < len(args) - 1:
+                    comma = ","
+                kl += ["    %s%s" % (argVarName, comma)]
+
+            kl += ["  );"]
+            self.__krkVisitedObjects.append(driverSolver);
+
+            # output to the results!
+            for connectedObj, argName, argDataType, j in outputObjs:
+                kl += ["", "  // retrieving value for %s from solver %s" % (connectedObj['member'], driverMember)]
+                if argDataType.endswith('[]'):
+                    kl += ["  %s = %s_%s[%d];" % (self.__klGlobalXfo(connectedObj), driverMember, argName, j)]
+                else:
+                    kl += ["  %s = %s_%s;" % (self.__klGlobalXfo(connectedObj), driverMember, argName)]
+                self.__krkVisitedObjects.append(connectedObj);
+
+            for connectedObj in notDrivenObjs:
+                kl += self.__visitKLObject(connectedObj)
 
             return kl
 
@@ -356,6 +413,193 @@ class Builder(Builder):
         self.__krkVisitedObjects.append(item);
         return kl
 
+    def __klStep(self, name, reads, writes, hierarchy=None):
+        """Returns the marker starting a step of the solve code. A step is
+        the code solving one object, attribute, constraint or solver, reads
+        and writes are the members whose values it uses and sets. Steps
+        solving an object from its parent, or from its own transform, give
+        the index of the object and of its parent (-1 for none)."""
+
+        return {'klStep': name, 'reads': reads, 'writes': writes, 'hierarchy': hierarchy}
+
+    def __splitKLSteps(self, solveCode):
+        """Splits the solve code in to (marker, lines) steps. Lines before
+        the first marker form a step without reads that is always solved."""
+
+        steps = []
+        for line in solveCode:
+            if isinstance(line, dict):
+                steps.append((line, []))
+            elif len(steps) == 0:
+                steps.append(({'klStep': 'setup', 'reads': None, 'writes': [], 'hierarchy': None}, [line]))
+            else:
+                steps[-1][1].append(line)
+
+        return steps
+
+    def __klXfo(self, obj):
+        """Returns the KL expression of the local transform of an object."""
+
+        if self.__soaLayout:
+            return "this.xfos[%d]" % obj['index']
+        return "this.%s.xfo" % obj['member']
+
+    def __klGlobalXfo(self, obj):
+        """Returns the KL expression of the global transform of an object."""
+
+        if self.__soaLayout:
+            return "this.globalXfos[%d]" % obj['index']
+        return "this.%s.globalXfo" % obj['member']
+
+    def __klValue(self, attr):
+        """Returns the KL expression of the value of an attribute."""
+
+        if self.__soaLayout and attr['cls'] == 'ScalarAttribute':
+            return "this.scalarValues[%d]" % attr['valueIndex']
+        return "this.%s.value" % attr['member']
+
+    def __assignKLIndices(self, scalarAttributes):
+        """Numbers the objects and the scalar attributes in the order of
+        the arrays of the structure of arrays layout: the joints first so
+        they form the start of the transform arrays, and the scalar
+        attributes that are not driven first so they form the start of
+        the value array.
+
+        Args:
+            scalarAttributes (list): The scalar attributes that are not driven.
+
+        Return:
+            tuple: The numbered objects and the numbered scalar attributes.
+
+        """
+
+        objects = list(self.__krkDeformers)
+        deformerKeys = set([id(x) for x in objects])
+        objects += [x for x in self.__klObjects if id(x) not in deformerKeys]
+        for i in xrange(len(objects)):
+            objects[i]['index'] = i
+
+        attributes = list(scalarAttributes)
+        scalarKeys = set([id(x) for x in attributes])
+        attributes += [x for x in self.__klAttributes if x['cls'] == 'ScalarAttribute' and id(x) not in scalarKeys]
+        for i in xrange(len(attributes)):
+            attributes[i]['valueIndex'] = i
+
+        return objects, attributes
+
+    def __collapseKLHierarchySteps(self, steps):
+        """Replaces runs of steps solving objects from their parent by loops
+        over the hierarchy index tables of the structure of arrays layout.
+
+        Return:
+            tuple: The solve code and the (index, parentIndex) table.
+
+        """
+
+        kl = []
+        table = []
+        run = []
+        for step, code in steps + [(None, [])]:
+            if step is not None and step['hierarchy'] is not None:
+                run.append(step['hierarchy'])
+                continue
+
+            if len(run) > 0:
+                kl += ["", "  // solving global transforms of %d objects" % len(run)]
+                kl += ["  for(Size i=%d;i<%d;i++) {" % (len(table), len(table) + len(run))]
+                kl += ["    UInt32 index = this.hierarchyIndices[i];"]
+                kl += ["    Integer parent = this.hierarchyParents[i];"]
+                kl += ["    if(parent < 0)"]
+                kl += ["      this.globalXfos[index] = this.xfos[index];"]
+                kl += ["    else"]
+                kl += ["      this.globalXfos[index] = this.globalXfos[parent] * this.xfos[index];"]
+                kl += ["  }"]
+                table += run
+                run = []
+
+            kl += code
+
+        return kl, table
+
+    def __generateKLPartialSolve(self, solveCode, controls, scalarAttributes):
+        """Generates the functions re-solving only the steps of the solve
+        code downstream of changed controls and attributes.
+
+        The steps are solved in the order of the full solve. A step is dirty
+        when it was marked dirty or when a step it depends on is dirty.
+
+        """
+
+        steps = self.__splitKLSteps(solveCode)
+
+        writers = {}
+        upstream = []
+        for i in xrange(len(steps)):
+            step = steps[i][0]
+            if step['reads'] is None:
+                upstream.append(None)
+            else:
+                upstream.append(sorted(set([writers[x] for x in step['reads'] if writers.get(x, i) != i])))
+
+            for member in step['writes']:
+                writers[member] = i
+
+        kl = []
+        kl += ["function %s.solveDirty!(io Boolean dirty[]) {" % self.getKLExtensionName()]
+        kl += ["  if(dirty.size() != %d)" % len(steps)]
+        kl += ["    throw(\"Expected number of steps does not match (\"+dirty.size()+\" given, %d expected).\");" % len(steps)]
+        kl += ["  UInt64 timerStart = getCurrentTicks();"]
+        kl += self.__klPreCode
+        for i in xrange(len(steps)):
+            step, code = steps[i]
+            kl += ["", "  // step %d: %s" % (i, step['klStep'])]
+            if upstream[i] is None:
+                kl += code
+                continue
+
+            if len(upstream[i]) > 0:
+                kl += ["  dirty[%d] = dirty[%d] || %s;" % (i, i, " || ".join(["dirty[%d]" % x for x in upstream[i]]))]
+            kl += ["  if(dirty[%d]) {" % i]
+            kl += ["  " + x if x else x for x in code]
+            kl += ["  }"]
+        kl += ["  UInt64 timerEnd = getCurrentTicks();"]
+        kl += ["  this.solveTimeMs = 1000.0 * getSecondsBetweenTicks(timerStart, timerEnd);"]
+        kl += ["}", ""]
+
+        # map the names of the controls and attributes to the steps using them
+        sources = []
+        for obj in controls:
+            sources.append((obj['sceneItem'].getBuildName(), obj['member']))
+        for attr in scalarAttributes:
+            ownerName = attr['sceneItem'].getParent().getParent().getBuildName()
+            sources.append(("%s.%s" % (ownerName, attr['name']), attr['member']))
+
+        kl += ["function %s.markDirty(String name, io Boolean dirty[]) {" % self.getKLExtensionName()]
+        kl += ["  switch(name) {"]
+        for name, member in sources:
+            stepIndices = [i for i in xrange(len(steps)) if steps[i][0]['reads'] is not None and
+                           (member in steps[i][0]['reads'] or member in steps[i][0]['writes'])]
+            kl += ["    case \"%s\": {" % name]
+            for i in stepIndices:
+                kl += ["      dirty[%d] = true;" % i]
+            kl += ["      break;"]
+            kl += ["    }"]
+        kl += ["    default: {"]
+        kl += ["      for(Size i=0;i<dirty.size();i++)"]
+        kl += ["        dirty[i] = true;"]
+        kl += ["    }"]
+        kl += ["  }"]
+        kl += ["}", ""]
+
+        kl += ["function %s.evaluate!(String changedNames[]) {" % self.getKLExtensionName()]
+        kl += ["  Boolean dirty[](%d);" % len(steps)]
+        kl += ["  for(Size i=0;i<changedNames.size();i++)"]
+        kl += ["    this.markDirty(changedNames[i], dirty);"]
+        kl += ["  this.solveDirty(dirty);"]
+        kl += ["}", ""]
+
+        return kl
+
     def __visitKLAttribute(self, attr):
         klCode = []
         if attr.get('visited', False):
@@ -364,7 +608,8 @@ class Builder(Builder):
             return klCode
         driverAttr = self.findKLAttribute(attr['driver'])
         klCode += self.__visitKLAttribute(driverAttr)
-        klCode += ["  this.%s.value = this.%s.value;" % (attr['member'], driverAttr['member'])]
+        klCode += [self.__klStep(attr['member'], [driverAttr['member']], [attr['member']])]
+        klCode += ["  %s = %s;" % (self.__klValue(attr), self.__klValue(driverAttr))]
         return klCode
 
     def generateKLCode(self):
@@ -379,6 +624,35 @@ class Builder(Builder):
             if attr['sceneItem'].isTypeOf('ScalarAttribute') and attr.get('driver', None) is None:
                 scalarAttributes.append(attr)
 
+        allObjects, valueAttributes = self.__assignKLIndices(scalarAttributes)
+        if not self.__soaLayout:
+            allObjects = self.__klObjects
+
+        for obj in self.__klObjects:
+            obj['visited'] = False
+        for solver in self.__klSolvers:
+            solver['visited'] = False
+        for attr in self.__klAttributes:
+            attr['visited'] = False
+        for canvasOp in self.__klCanvasOps:
+            canvasOp['visited'] = False
+
+        solveCode = []
+        for attr in self.__klAttributes:
+            solveCode += self.__visitKLAttribute(attr)
+
+        self.__krkVisitedObjects = []
+        for obj in self.__klObjects:
+            solveCode += self.__visitKLObject(obj)
+
+        # in the structure of arrays layout the objects solved from their
+        # parent are solved in loops over index tables
+        hierarchyTable = []
+        if self.__soaLayout and not self.__debugMode:
+            solveLines, hierarchyTable = self.__collapseKLHierarchySteps(self.__splitKLSteps(solveCode))
+        else:
+            solveLines = [x for x in solveCode if not isinstance(x, dict)]
+
         kl = []
         kl += ["require Math;"]
         kl += ["require Geometry;"]
@@ -389,6 +663,12 @@ class Builder(Builder):
         kl += ["object %s : KrakenKLRig {" % self.getKLExtensionName()]
         kl += ["  Float64 solveTimeMs;"]
         kl += ["  KrakenClip clip; // the default clip of the rig"]
+        if self.__soaLayout:
+            kl += ["  Xfo xfos[];"]
+            kl += ["  Xfo globalXfos[];"]
+            kl += ["  Float32 scalarValues[];"]
+            kl += ["  UInt32 hierarchyIndices[];"]
+            kl += ["  Integer hierarchyParents[];"]
         for member in self.__klMembers:
             kl += ["  %s %s;" % (member['type'], member['name'])]
         kl += ["};"]
@@ -400,11 +680,21 @@ class Builder(Builder):
         kl += ["function %s.init!() {" % self.getKLExtensionName()]
         kl += ["  Float32 floatAnimation[String];"]
         kl += [""]
-        if self.__debugMode:
+        if self.__soaLayout:
+            kl += ["  // build transform and value arrays"]
+            kl += ["  this.xfos.resize(%d);" % len(allObjects)]
+            kl += ["  this.globalXfos.resize(%d);" % len(allObjects)]
+            kl += ["  this.scalarValues.resize(%d);" % len(valueAttributes)]
+            kl += ["  this.hierarchyIndices.resize(%d);" % len(hierarchyTable)]
+            kl += ["  this.hierarchyParents.resize(%d);" % len(hierarchyTable)]
+            for i in xrange(len(hierarchyTable)):
+                kl += ["  this.hierarchyIndices[%d] = %d;" % (i, hierarchyTable[i][0])]
+                kl += ["  this.hierarchyParents[%d] = %d;" % (i, hierarchyTable[i][1])]
+        if self.__debugMode and not self.__soaLayout:
             kl += ["  // build 3D objects"]
         for obj in self.__klObjects:
             memberName = obj['member']
-            if self.__debugMode:
+            if self.__debugMode and not self.__soaLayout:
                 kl += ["  this.%s.name = \"%s\";" % (memberName, obj['name'])]
                 kl += ["  this.%s.buildName = \"%s\";" % (memberName, obj['buildName'])]
                 kl += ["  this.%s.path = \"%s\";" % (memberName, obj['path'])]
@@ -499,41 +789,33 @@ class Builder(Builder):
                     attr['value']
                 )]
 
+        if self.__soaLayout:
+            kl += ["", "  // fill value array"]
+            for attr in valueAttributes:
+                kl += ["  %s = this.%s.value;" % (self.__klValue(attr), attr['member'])]
+
         kl += ["}", ""]
 
         kl += ["function %s.resetPose!() {" % self.getKLExtensionName()]
         kl += ["  // reset objects"]
         for obj in self.__klObjects:
-            kl += ["  this.%s.xfo = %s;" % (obj['member'], obj.get('xfo', 'Xfo()'))]
+            kl += ["  %s = %s;" % (self.__klXfo(obj), obj.get('xfo', 'Xfo()'))]
         kl += ["  // reset attributes"]
         for attr in scalarAttributes:
-            kl += ["  this.%s.value = %f;" % (attr['member'], attr['value'])]
+            kl += ["  %s = %f;" % (self.__klValue(attr), attr['value'])]
         kl += ["}", ""]
 
         kl += ["function %s.solve!() {" % self.getKLExtensionName()]
         kl += ["  UInt64 timerStart = getCurrentTicks();"]
         kl += self.__klPreCode
 
-        for obj in self.__klObjects:
-            obj['visited'] = False
-        for solver in self.__klSolvers:
-            solver['visited'] = False
-        for attr in self.__klAttributes:
-            attr['visited'] = False
-        for canvasOp in self.__klCanvasOps:
-            canvasOp['visited'] = False
-
-        for attr in self.__klAttributes:
-            kl += self.__visitKLAttribute(attr)
-
-        self.__krkVisitedObjects = []
-        for obj in self.__klObjects:
-            kl += self.__visitKLObject(obj)
-
+        kl += solveLines
         kl += ["  UInt64 timerEnd = getCurrentTicks();"]
         kl += ["  this.solveTimeMs = 1000.0 * getSecondsBetweenTicks(timerStart, timerEnd);"]
         kl += ["}", ""]
 
+        kl += self.__generateKLPartialSolve(solveCode, controls, scalarAttributes)
+
         kl += ["function %s.evaluate!(KrakenClipContext context) {" % self.getKLExtensionName()]
         kl += ["  if(this.clip != null) {"]
         kl += ["    KrakenKLRig rig = this;"]
@@ -551,22 +833,26 @@ class Builder(Builder):
         kl += ["  }"]
         kl += ["  this.solve();"]
         kl += ["  if(inGlobalSpace) {"]
-        for i in range(len(self.__krkDeformers)):
-            kl += ["    joints[%d] = this.%s.globalXfo;" % (i, self.__krkDeformers[i]['member'])]
+        if self.__soaLayout:
+            kl += ["    for(Size i=0;i<%d;i++)" % len(self.__krkDeformers)]
+            kl += ["      joints[i] = this.globalXfos[i];"]
+        else:
+            for i in range(len(self.__krkDeformers)):
+                kl += ["    joints[%d] = %s;" % (i, self.__klGlobalXfo(self.__krkDeformers[i]))]
         kl += ["  } else {", ]
         for i in range(len(self.__krkDeformers)):
             parentObj = self.findKLObjectForSI(self.__krkDeformers[i]['sceneItem'].getParent())
             if parentObj:
-                kl += ["    joints[%d] = this.%s.globalXfo.inverse() * this.%s.globalXfo;" % (i, parentObj['member'], self.__krkDeformers[i]['member'])]
+                kl += ["    joints[%d] = %s.inverse() * %s;" % (i, self.__klGlobalXfo(parentObj), self.__klGlobalXfo(self.__krkDeformers[i]))]
             else:
-                kl += ["    joints[%d] = this.%s.globalXfo;" % (i, self.__krkDeformers[i]['member'])]
+                kl += ["    joints[%d] = %s;" % (i, self.__klGlobalXfo(self.__krkDeformers[i]))]
         kl += ["  }"]
         kl += ["}", ""]
 
         kl += ["function Xfo[] %s.getControlXfos() {" % self.getKLExtensionName()]
         kl += ["  Xfo result[](%d);" % len(controls)]
         for i in range(len(controls)):
-            kl += ["  result[%d] = this.%s.xfo;" % (i, controls[i]['member'])]
+            kl += ["  result[%d] = %s;" % (i, self.__klXfo(controls[i]))]
         kl += ["  return result;"]
         kl += ["}", ""]
 
@@ -579,8 +865,12 @@ class Builder(Builder):
 
         kl += ["function Xfo[] %s.getJointXfos() {" % self.getKLExtensionName()]
         kl += ["  Xfo result[](%d);" % len(self.__krkDeformers)]
-        for i in range(len(self.__krkDeformers)):
-            kl += ["  result[%d] = this.%s.globalXfo;" % (i, self.__krkDeformers[i]['member'])]
+        if self.__soaLayout:
+            kl += ["  for(Size i=0;i<%d;i++)" % len(self.__krkDeformers)]
+            kl += ["    result[i] = this.globalXfos[i];"]
+        else:
+            for i in range(len(self.__krkDeformers)):
+                kl += ["  result[%d] = %s;" % (i, self.__klGlobalXfo(self.__krkDeformers[i]))]
         kl += ["  return result;"]
         kl += ["}", ""]
 
@@ -592,23 +882,30 @@ class Builder(Builder):
         kl += ["}", ""]
 
         kl += ["function Xfo[] %s.getAllXfos() {" % self.getKLExtensionName()]
-        kl += ["  Xfo result[](%d);" % len(self.__klObjects)]
-        for i in range(len(self.__klObjects)):
-            kl += ["  result[%d] = this.%s.globalXfo;" % (i, self.__klObjects[i]['member'])]
-        kl += ["  return result;"]
+        if self.__soaLayout:
+            kl += ["  return this.globalXfos;"]
+        else:
+            kl += ["  Xfo result[](%d);" % len(allObjects)]
+            for i in range(len(allObjects)):
+                kl += ["  result[%d] = %s;" % (i, self.__klGlobalXfo(allObjects[i]))]
+            kl += ["  return result;"]
         kl += ["}", ""]
 
         kl += ["function String[] %s.getAllNames() {" % self.getKLExtensionName()]
-        kl += ["  String result[](%d);" % len(self.__klObjects)]
-        for i in range(len(self.__klObjects)):
-            kl += ["  result[%d] = \"%s\";" % (i, self.__klObjects[i]['sceneItem'].getBuildName())]
+        kl += ["  String result[](%d);" % len(allObjects)]
+        for i in range(len(allObjects)):
+            kl += ["  result[%d] = \"%s\";" % (i, allObjects[i]['sceneItem'].getBuildName())]
         kl += ["  return result;"]
         kl += ["}", ""]
 
         kl += ["function Float32[] %s.getScalarAttributeValues() {" % self.getKLExtensionName()]
         kl += ["  Float32 result[](%d);" % len(scalarAttributes)]
-        for i in range(len(scalarAttributes)):
-            kl += ["  result[%d] = this.%s.value;" % (i, scalarAttributes[i]['member'])]
+        if self.__soaLayout:
+            kl += ["  for(Size i=0;i<%d;i++)" % len(scalarAttributes)]
+            kl += ["    result[i] = this.scalarValues[i];"]
+        else:
+            for i in range(len(scalarAttributes)):
+                kl += ["  result[%d] = %s;" % (i, self.__klValue(scalarAttributes[i]))]
         kl += ["  return result;"]
         kl += ["}", ""]
 
@@ -624,16 +921,29 @@ class Builder(Builder):
         kl += ["  if(values.size() != %d)" % len(controls)]
         kl += ["    throw(\"Expected number of values does not match (\"+values.size()+\" given, %d expected).\");" % len(controls)]
         for i in range(len(controls)):
-            kl += ["  this.%s.xfo = values[%d];" % (controls[i]['member'], i)]
+            kl += ["  %s = values[%d];" % (self.__klXfo(controls[i]), i)]
         kl += ["}", ""]        
 
         kl += ["function %s.setScalarAttributeValues!(Float32 values<>) {" % self.getKLExtensionName()]
         kl += ["  if(values.size() != %d)" % len(scalarAttributes)]
         kl += ["    throw(\"Expected number of values does not match (\"+values.size()+\" given, %d expected).\");" % len(scalarAttributes)]
-        for i in range(len(scalarAttributes)):
-            kl += ["  this.%s.value = values[%d];" % (scalarAttributes[i]['member'], i)]
+        if self.__soaLayout:
+            kl += ["  for(Size i=0;i<%d;i++)" % len(scalarAttributes)]
+            kl += ["    this.scalarValues[i] = values[i];"]
+        else:
+            for i in range(len(scalarAttributes)):
+                kl += ["  %s = values[%d];" % (self.__klValue(scalarAttributes[i]), i)]
         kl += ["}", ""]        
 
+        if self.__soaLayout:
+            kl += ["function Xfo %s.getGlobalXfo(UInt32 index) {" % self.getKLExtensionName()]
+            kl += ["  return this.globalXfos[index];"]
+            kl += ["}", ""]
+
+            kl += ["function %s.setLocalXfo!(UInt32 index, Xfo xfo) {" % self.getKLExtensionName()]
+            kl += ["  this.xfos[index] = xfo;"]
+            kl += ["}", ""]
+
         kl += ["function %s.setClip!(KrakenClip clip) {" % self.getKLExtensionName()]
         kl += ["  this.clip = clip;"]
         kl += ["}", ""]
@@ -723,7 +1033,9 @@ class Builder(Builder):
         }]
 
     def loadKLExtension(self, reloadExt = False):
-        ext = self.generateKLExtension()
+        self.__registerKLExtension(self.generateKLExtension(), reloadExt)
+
+    def __registerKLExtension(self, ext, reloadExt = False):
         client = ks.getCoreClient()
         client.registerKLExtension(
             self.getKLExtensionName(),
@@ -754,8 +1066,162 @@ class Builder(Builder):
         open(klFilePath, "w").write(ext[0]['sourceCode'])
         open(testFilePath, "w").write(self.getKLTestCode())
         self.saveDFGPresets()
+        if self.__buildHash is not None:
+            open(self.__getBuildHashFilePath(), "w").write(self.__buildHash)
         return True
 
+    # ========================
+    # Build Cache Methods
+    # ========================
+    def __encodeCacheValue(self, value):
+        if isinstance(value, dict):
+            # skip the RTVals and graph nodes, the scene items are encoded
+            # by the items they are stored in
+            return dict([(k, self.__encodeCacheValue(v)) for k, v in value.items()
+                         if k not in ['sceneItem', 'initialXfo', 'node', 'exec']])
+        if isinstance(value, (list, tuple)):
+            return [self.__encodeCacheValue(x) for x in value]
+        if isinstance(value, SceneItem):
+            return value.getDecoratedPath()
+        if isinstance(value, Xfo):
+            return [repr(x) for x in [value.tr.x, value.tr.y, value.tr.z,
+                                      value.ori.v.x, value.ori.v.y, value.ori.v.z, value.ori.w,
+                                      value.sc.x, value.sc.y, value.sc.z]]
+        if isinstance(value, float):
+            return repr(value)
+        if value is None or isinstance(value, (bool, int, long)):
+            return value
+        return str(value)
+
+    def __getBuildDataSignature(self):
+        """Returns the data collected while traversing the rig that the code
+        generation and the offset solving depend on.
+
+        Return:
+            dict: The encoded objects, attributes, constraints and operators.
+
+        """
+
+        objects = []
+        for obj in self.__klObjects:
+            data = self.__encodeCacheValue(obj)
+            data['initialXfo'] = self.__encodeCacheValue(obj['sceneItem'].xfo)
+            objects.append(data)
+
+        constraints = []
+        for constraint in self.__klConstraints:
+            data = self.__encodeCacheValue(constraint)
+            data['maintainOffset'] = constraint['sceneItem'].getMaintainOffset()
+            constraints.append(data)
+
+        operators = []
+        for op in self.__klSolvers + self.__klCanvasOps:
+            kOperator = op['sceneItem']
+            data = self.__encodeCacheValue(op)
+            data['inputs'] = self.__encodeCacheValue(kOperator.inputs)
+            data['outputs'] = self.__encodeCacheValue(kOperator.outputs)
+            if kOperator.isTypeOf('KLOperator'):
+                data['extension'] = kOperator.getExtension()
+                data['solverTypeName'] = kOperator.getSolverTypeName()
+
+                # The argument signature of the solver stands in for the
+                # sources of extensions outside the Kraken extensions.
+                solverArgs = []
+                args = kOperator.getSolverArgs()
+                for i in xrange(len(args)):
+                    arg = args[i]
+                    solverArgs.append([
+                        arg.name.getSimpleType(),
+                        arg.dataType.getSimpleType(),
+                        arg.connectionType.getSimpleType()
+                    ])
+
+                data['solverArgs'] = solverArgs
+            elif kOperator.isTypeOf('CanvasOperator'):
+                data['presetPath'] = kOperator.getPresetPath()
+                data['presetMTime'] = self.__encodeCacheValue(kOperator._getPresetMTime(kOperator.getPresetPath()))
+            operators.append(data)
+
+        return {
+            'objects': objects,
+            'attributes': self.__encodeCacheValue(self.__klAttributes),
+            'constraints': constraints,
+            'operators': operators,
+            'deformers': [x['path'] for x in self.__krkDeformers],
+            'preCode': self.__klPreCode,
+            'soaLayout': self.__soaLayout
+        }
+
+    def getBuildHash(self):
+        """Returns the hash the build cache is keyed by: a hash of the data
+        collected while traversing the rig, the config, the source of this
+        builder and the sources of the Kraken KL extensions.
+
+        Solvers from other extensions are only hashed by their type and
+        argument signature. After editing the body of such a solver, disable
+        the 'KLBuildCache' metadata or delete the .buildHash file.
+
+        Only valid once the rig has been traversed, from _postBuild.
+
+        Return:
+            str: The hexadecimal digest of the build.
+
+        """
+
+        config = self.getConfig()
+        configData = [
+            config.__class__.__module__ + '.' + config.__class__.__name__,
+            config.getAllMetaData()
+        ]
+
+        hasher = hashlib.sha1()
+        hasher.update(json.dumps(self.__getBuildDataSignature(), sort_keys=True))
+        hasher.update(json.dumps(configData, sort_keys=True, default=str))
+
+        builderFilePath = os.path.splitext(os.path.abspath(__file__))[0] + '.py'
+        hasher.update(open(builderFilePath, 'rb').read())
+
+        for folder, subFolders, fileNames in sorted(os.walk(krakenExtsDir)):
+            for fileName in sorted(fileNames):
+                if not fileName.endswith('.kl') and not fileName.endswith('.json'):
+                    continue
+
+                filePath = os.path.join(folder, fileName)
+                hasher.update(os.path.relpath(filePath, krakenExtsDir).replace(os.sep, '/'))
+                hasher.update(open(filePath, 'rb').read())
+
+        return hasher.hexdigest()
+
+    def __getBuildHashFilePath(self):
+        return os.path.join(self.__outputFolder, "%s.buildHash" % self.getKLExtensionName())
+
+    def __isBuildCached(self, buildHash):
+        """Returns whether the output folder holds the artifacts of a build
+        with the given hash."""
+
+        if not self.__outputFolder:
+            return False
+
+        extName = self.getKLExtensionName()
+        filePaths = [
+            os.path.join(self.__outputFolder, "%s.fpm.json" % extName),
+            os.path.join(self.__outputFolder, "%s.kl" % extName),
+            os.path.join(self.__outputFolder, 'DFG'),
+            self.__getBuildHashFilePath()
+        ]
+        for filePath in filePaths:
+            if not os.path.exists(filePath):
+                return False
+
+        return open(self.__getBuildHashFilePath()).read().strip() == buildHash
+
+    def __loadCachedKLExtension(self):
+        klFilePath = os.path.join(self.__outputFolder, "%s.kl" % self.getKLExtensionName())
+        self.__registerKLExtension([{
+            "filename": os.path.split(klFilePath)[1],
+            "sourceCode": open(klFilePath).read()
+        }])
+
     def saveDFGPresets(self):
         client = ks.getCoreClient()
         dfgHost = client.getDFGHost()
@@ -901,40 +1367,61 @@ class Builder(Builder):
         content = dfgBinding.exportJSON()
         open(filePath, "w").write(content)        
 
+    def __registerKLItem(self, items, collection, item):
+        """Appends an item to one of the KL collections and indexes it by its
+        member name. The first item registered for a member name is the one
+        found by the find methods."""
+
+        items.append(item)
+        self.__klIndexes[collection].setdefault(item['member'], item)
+
     def findKLObjectForSI(self, kSceneItem):
-        member = self.getUniqueName(kSceneItem)
-        for obj in self.__klObjects:
-            if obj['member'] == member:
-                return obj
-        return None
+        return self.__klIndexes['Objects'].get(self.getUniqueName(kSceneItem))
 
     def findKLAttribute(self, kAttribute):
-        member = self.getUniqueName(kAttribute)
-        for attr in self.__klAttributes:
-            if attr['member'] == member:
-                return attr
-        return None
+        return self.__klIndexes['Attributes'].get(self.getUniqueName(kAttribute))
 
     def findKLConstraint(self, kConstraint):
-        member = self.getUniqueName(kConstraint)
-        for constraint in self.__klConstraints:
-            if constraint['member'] == member:
-                return constraint
-        return None
+        return self.__klIndexes['Constraints'].get(self.getUniqueName(kConstraint))
 
     def findKLSolver(self, kOperator):
-        member = self.getUniqueName(kOperator)
-        for solver in self.__klSolvers:
-            if solver['member'] == member:
-                return solver
-        return None
+        return self.__klIndexes['Solvers'].get(self.getUniqueName(kOperator))
 
     def findKLCanvasOp(self, kOperator):
-        member = self.getUniqueName(kOperator)
-        for canvasOp in self.__klCanvasOps:
-            if canvasOp['member'] == member:
-                return canvasOp
-        return None
+        return self.__klIndexes['CanvasOps'].get(self.getUniqueName(kOperator))
+
+    def getBuildStats(self):
+        """Returns the number of members of each kind in the KL rig.
+
+        Return:
+            dict: Number of objects, attributes, constraints, solvers, canvas
+                operators and of all members of the rig.
+
+        """
+
+        return {
+            'objects': len(self.__klObjects),
+            'attributes': len(self.__klAttributes),
+            'constraints': len(self.__klConstraints),
+            'solvers': len(self.__klSolvers),
+            'canvasOps': len(self.__klCanvasOps),
+            'members': len(self.__klMembers)
+        }
+
+    def reportBuildStats(self):
+        """Reports the number of members of each kind in the KL rig.
+
+        Return:
+            bool: True if successful.
+
+        """
+
+        stats = self.getBuildStats()
+        self.report("Build stats: %d members, %d objects, %d attributes, %d constraints, %d solvers, %d canvas ops" % (
+            stats['members'], stats['objects'], stats['attributes'],
+            stats['constraints'], stats['solvers'], stats['canvasOps']))
+
+        return True
 
     def buildKLSceneItem(self, kSceneItem, buildName):
 
@@ -1008,8 +1495,11 @@ class Builder(Builder):
                 obj['parent'] = parent.getDecoratedPath()
                 obj['driver'] = parent
 
-        self.__klMembers.append({'name': self.getUniqueName(kSceneItem), 'type': obj['type']})
-        self.__klObjects.append(obj)
+        # objects are stored in the transform arrays in the structure of
+        # arrays layout
+        if not self.__soaLayout:
+            self.__klMembers.append({'name': self.getUniqueName(kSceneItem), 'type': obj['type']})
+        self.__registerKLItem(self.__klObjects, 'Objects', obj)
         return True
 
     def buildKLAttribute(self, kAttribute):
@@ -1046,7 +1536,7 @@ class Builder(Builder):
               attr['max'] = kAttribute.getMax()
 
         self.__klMembers.append({'name': self.getUniqueName(kAttribute), 'type': 'Kraken'+cls})
-        self.__klAttributes.append(attr)
+        self.__registerKLItem(self.__klAttributes, 'Attributes', attr)
         return kAttribute
 
     def buildKLConstraint(self, kConstraint):
@@ -1072,7 +1562,7 @@ class Builder(Builder):
             constrainee['driver'] = kConstraint
 
         self.__klMembers.append({'name': self.getUniqueName(kConstraint), 'type': constraint['type']})
-        self.__klConstraints.append(constraint)
+        self.__registerKLItem(self.__klConstraints, 'Constraints', constraint)
         return kConstraint
 
     # ========================
@@ -1433,7 +1923,7 @@ class Builder(Builder):
         }
 
         self.__klMembers.append({'name': self.getUniqueName(kOperator), 'type': solver['type']})
-        self.__klSolvers.append(solver)
+        self.__registerKLItem(self.__klSolvers, 'Solvers', solver)
 
         args = kOperator.getSolverArgs()
         for i in xrange(len(args)):
@@ -1490,7 +1980,7 @@ class Builder(Builder):
           "member": self.getUniqueName(kOperator),
           "path": kOperator.getDecoratedPath()
         }
-        self.__klCanvasOps.append(canvasOp)
+        self.__registerKLItem(self.__klCanvasOps, 'CanvasOps', canvasOp)
 
         for i in xrange(subExec.getExecPortCount()):
             portName = subExec.getExecPortName(i)
@@ -1633,6 +2123,7 @@ class Builder(Builder):
         self.__rigTitle = self.getConfig().getMetaData('RigTitle', 'Rig')
         self.__canvasGraph = GraphManager()
         self.__debugMode = False
+        self.__soaLayout = self.getConfig().getMetaData('KLStorageLayout', 'AoS') == 'SoA'
         self.__names = {}
         self.__pathToName = {}
         self.__klMembers = []
@@ -1641,6 +2132,13 @@ class Builder(Builder):
         self.__klConstraints = []
         self.__klSolvers = []
         self.__klCanvasOps = []
+        self.__klIndexes = {
+            'Objects': {},
+            'Attributes': {},
+            'Constraints': {},
+            'Solvers': {},
+            'CanvasOps': {}
+        }
         self.__klExtExecuted = False
         self.__klPreCode = []
         self.__krkItems = {}
@@ -1678,15 +2176,18 @@ class Builder(Builder):
             driver = item['driver']
             if isinstance(driver, Object3D):
                 driverObj = self.findKLObjectForSI(driver)
-                print 'Solving local xfo for '+item['member']
-                rig.solve("")
-
-                parentXfo = getattr(rig, driverObj['member']).globalXfo
+                if self.__soaLayout:
+                    parentXfo = rig.getGlobalXfo('Xfo', ks.rtVal('UInt32', driverObj['index']))
+                else:
+                    parentXfo = getattr(rig, driverObj['member']).globalXfo
                 initialXfo = item.get('initialXfo', Xfo().getRTVal())
                 localXfo = parentXfo.inverse('Xfo').multiply('Xfo', initialXfo)
-                krkObj = getattr(rig, item['member'])
-                krkObj.xfo = localXfo
-                setattr(rig, item['member'], krkObj)
+                if self.__soaLayout:
+                    rig.setLocalXfo('', ks.rtVal('UInt32', item['index']), localXfo)
+                else:
+                    krkObj = getattr(rig, item['member'])
+                    krkObj.xfo = localXfo
+                    setattr(rig, item['member'], krkObj)
                 item['xfo'] = self.__getXfoAsStr(Xfo(localXfo))
 
             elif isinstance(driver, Constraint):
@@ -1695,9 +2196,6 @@ class Builder(Builder):
                     return
                     
                 driverObj = self.findKLConstraint(driver)
-                print 'Solving offset for '+driverObj['member']
-                rig.solve("")
-
                 krkConstraint = getattr(rig, driverObj['member'])
                 initialXfo = item.get('initialXfo', Xfo().getRTVal())
                 offsetXfo = krkConstraint.computeOffset('Xfo', initialXfo)
@@ -1705,6 +2203,61 @@ class Builder(Builder):
                 setattr(rig, driverObj['member'], krkConstraint)
                 driverObj['offset'] = self.__getXfoAsStr(Xfo(offsetXfo))
 
+    def __needsOffset(self, item):
+        """Returns whether __computeOffset() sets a local transform or a
+        constraint offset for a visited object."""
+
+        if not isinstance(item['sceneItem'], Object3D):
+            return False
+
+        driver = item['driver']
+        if isinstance(driver, Object3D):
+            return True
+
+        return isinstance(driver, Constraint) and driver.getMaintainOffset()
+
+    def __getOffsetLevel(self, item, levels):
+        """Returns the dependency level of a visited object.
+
+        Objects that __computeOffset() handles are given one level more than
+        the objects their global transform depends on, all other objects the
+        level of those objects. An offset can therefore be computed from a
+        rig solved after all offsets of the lower levels were set.
+
+        """
+
+        key = id(item)
+        if key in levels:
+            return levels[key]
+
+        # Guard against cycles, the generated KL would not compile either.
+        levels[key] = 0
+
+        upstream = []
+        driver = item['driver']
+        if isinstance(driver, Object3D):
+            upstream.append(driver)
+        elif isinstance(driver, Constraint):
+            upstream.extend(driver.getConstrainers())
+        elif isinstance(driver, KLOperator):
+            for connected in driver.inputs.values():
+                if not isinstance(connected, list):
+                    connected = [connected]
+                upstream.extend([x for x in connected if isinstance(x, Object3D)])
+
+        level = 0
+        for upstreamItem in upstream:
+            upstreamObj = self.findKLObjectForSI(upstreamItem)
+            if upstreamObj is not None and upstreamObj is not item:
+                level = max(level, self.__getOffsetLevel(upstreamObj, levels))
+
+        if self.__needsOffset(item):
+            level += 1
+
+        levels[key] = level
+
+        return level
+
     def _postBuild(self):
         """Post-Build commands.
 
@@ -1713,6 +2266,19 @@ class Builder(Builder):
 
         """
 
+        # Reuse the artifacts of a previous build of the same rig, skipping
+        # the code generation and the offset solving. The cache can be
+        # disabled with the 'KLBuildCache' metadata of the config.
+        self.__buildHash = None
+        if self.getConfig().getMetaData('KLBuildCache', True):
+            buildHash = self.getBuildHash()
+            if self.__isBuildCached(buildHash):
+                self.report("Reusing the cached build %s of %s" % (buildHash, self.getKLExtensionName()))
+                self.__loadCachedKLExtension()
+                return True
+
+            self.__buildHash = buildHash
+
         # self.saveKLExtension()
         self.loadKLExtension()
         client = ks.getCoreClient()
@@ -1721,7 +2287,30 @@ class Builder(Builder):
         rt = client.RT.types
         rig = getattr(rt, self.getKLExtensionName()).create()
 
+        self.reportBuildStats()
+
+        # Group the offsets by dependency level and solve the rig once per
+        # level instead of once per offset.
+        startTime = time.time()
+        levels = {}
+        offsetLevels = {}
         for item in self.__krkVisitedObjects:
-            self.__computeOffset(item, rig)
+            if self.__needsOffset(item):
+                level = self.__getOffsetLevel(item, levels)
+                offsetLevels.setdefault(level, []).append(item)
+
+        numOffsets = 0
+        numSolves = 0
+        for level in sorted(offsetLevels.keys()):
+            items = offsetLevels[level]
+            self.report("Solving %d offsets of level %d" % (len(items), level))
+            rig.solve("")
+            numSolves += 1
+
+            for item in items:
+                self.__computeOffset(item, rig)
+                numOffsets += 1
+
+        self.report("Computed %d offsets with %d solves in %.3f seconds" % (numOffsets, numSolves, time.time() - startTime))
 
         return self.saveKLExtension()
@@ -41,7 +41,7 @@ class Builder(Builder):
                 except:
                     continue
 
-        self._buildElements = []
+        self._clearSceneItemPairs()
 
         si.SetValue("preferences.scripting.cmdlog", True, "")
 
@@ -49,21 +49,21 @@ class ComponentTreeWidget(QtGui.QTreeWidget):
         """
 
         for item in data['components']:
-            if data['components'][item] not in self.ks.registeredComponents.keys():
+            componentClassNames = self.ks.getComponentClassNames()
+            if data['components'][item] not in componentClassNames:
                 print ("Warning: Component module "+data['components'][item]+" not found in registered components:")
-                for component in self.ks.registeredComponents:
+                for component in componentClassNames:
                     print "  "+component
                 continue
 
             treeItem = QtGui.QTreeWidgetItem(parentWidget)
             treeItem.setData(0, QtCore.Qt.UserRole, data['components'][item])
             treeItem.setText(0, item)
-            component = self.ks.registeredComponents[data['components'][item]]
-            module = sys.modules[component.__module__]
-            treeItem.setToolTip(0, module.__file__)
+            filePath = self.ks.getComponentFilePath(data['components'][item])
+            treeItem.setToolTip(0, filePath)
 
             if parentWidget is not None:
-                parentWidget.setToolTip(0, os.path.dirname(module.__file__))
+                parentWidget.setToolTip(0, os.path.dirname(filePath))
 
         for item in data['subDirs'].keys():
 
@@ -87,8 +87,7 @@ class ComponentTreeWidget(QtGui.QTreeWidget):
 
         componentClassNames = []
         for componentClassName in sorted(self.ks.getComponentClassNames()):
-            cmpCls = self.ks.getComponentClass(componentClassName)
-            if cmpCls.getComponentType() != 'Guide':
+            if self.ks.getComponentType(componentClassName) != 'Guide':
                 continue
 
             componentClassNames.append(componentClassName)
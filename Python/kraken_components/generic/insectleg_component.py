@@ -2,6 +2,7 @@ import math
 
 from kraken.core.maths import Vec3
 from kraken.core.maths.xfo import Xfo
+from kraken.core.maths import Vec3Array, XfoArray
 from kraken.core.maths.xfo import xfoFromDirAndUpV
 
 from kraken.core.objects.components.base_example_component import BaseExampleComponent
@@ -149,20 +150,11 @@ class InsectLegComponentGuide(InsectLegComponent):
         fw = toTip.cross(toFirst).unit()
 
         # Calculate Xfos
-        boneXfos = []
-        boneLengths = []
-        for i in xrange(numJoints):
-            boneVec = self.jointCtrls[i + 1].xfo.tr.subtract(self.jointCtrls[i].xfo.tr)
-            boneLengths.append(boneVec.length())
-            bone1Normal = fw.cross(boneVec).unit()
-            bone1ZAxis = boneVec.cross(bone1Normal).unit()
-
-            xfo = Xfo()
-            xfo.setFromVectors(boneVec.unit(), bone1Normal, bone1ZAxis, self.jointCtrls[i].xfo.tr)
-
-            boneXfos.append(xfo)
+        positions = Vec3Array([ctrl.xfo.tr for ctrl in self.jointCtrls[:numJoints + 1]])
+        boneXfos = XfoArray()
+        boneLengths = boneXfos.setFromChainPositions(positions, fw)
 
-        data['boneXfos'] = boneXfos
+        data['boneXfos'] = boneXfos.toList()
         data['endXfo'] = self.jointCtrls[-1].xfo
         data['boneLengths'] = boneLengths
 
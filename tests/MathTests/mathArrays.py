@@ -0,0 +1,52 @@
+from kraken.core.maths import *
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+positions = Vec3Array([Vec3(0.0, 0.0, 0.0), Vec3(1.0, 0.0, 0.0), Vec3(2.0, 1.0, 0.0), Vec3(2.0, 3.0, 1.0)])
+print "len:" + str(len(positions))
+print "positions:" + str(positions)
+print "deltas:" + str(positions.deltas())
+print "lengths:" + str(positions.deltas().lengths())
+print "cross:" + str(positions.cross(Vec3(0.0, 0.0, 1.0)))
+print "unit:" + str(positions.unit())
+
+# Elements are views on the array.
+positions[1].x = 4.0
+print "view:" + str(positions[1])
+positions[1] = Vec3(1.0, 0.0, 0.0)
+print "setitem:" + str(positions[1])
+
+quats = QuatArray([Quat(Euler(0.6, 0.7, 0.8)), Quat()])
+print "quats:" + str(quats)
+print "rotateVectors:" + str(quats.rotateVectors(Vec3(1.0, 0.0, 0.0)))
+print "slerp:" + str(quats.sphericalLinearInterpolate(Quat(), 0.5))
+
+# Batched chain transforms match the per-bone Xfo.setFromVectors() results.
+fw = Vec3(0.0, 0.0, 1.0)
+boneXfos = XfoArray()
+boneLengths = boneXfos.setFromChainPositions(positions, fw)
+print "boneLengths:" + str(boneLengths)
+print "boneXfos:" + str(boneXfos)
+
+matches = True
+for i in xrange(len(positions) - 1):
+    boneVec = positions[i + 1].subtract(positions[i])
+    bone1Normal = fw.cross(boneVec).unit()
+    bone1ZAxis = boneVec.cross(bone1Normal).unit()
+
+    xfo = Xfo()
+    xfo.setFromVectors(boneVec.unit(), bone1Normal, bone1ZAxis, positions[i])
+    matches = matches and xfo.tr.almostEqual(boneXfos[i].tr) and xfo.ori.almostEqual(boneXfos[i].ori)
+
+print "matchesXfo:" + str(matches)
+
+parent = Xfo(tr=Vec3(0.0, 1.0, 0.0), ori=Quat(Euler(0.0, 0.5, 0.0)))
+globalXfos = boneXfos.preMultiply(parent)
+expected = parent.multiply(boneXfos[0])
+print "preMultiply:" + str(globalXfos[0].tr.almostEqual(expected.tr) and globalXfos[0].ori.almostEqual(expected.ori))
+print "inverse:" + str(globalXfos.multiply(globalXfos.inverse())[2].tr.almostEqual(Vec3()))
+print "tr:" + str(boneXfos.tr)
+
+setMathBackend(previousBackend)
@@ -0,0 +1,38 @@
+from kraken.core.maths import *
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+vec = Vec3(1.0, 0.0, 2.0)
+print "native:" + str(vec.isNative())
+print "length:" + str(vec.length())
+print "unit:" + str(vec.unit())
+print "cross:" + str(vec.cross(Vec3(0.0, 1.0, 0.0)))
+print "divide:" + str(Vec3(0.0, 1.0, 0.0) / Vec3(0.0, 0.0, 2.0))
+
+quat = Quat(Euler(0.6, 0.7, 0.8))
+print "quat:" + str(quat)
+print "rotateVector:" + str(quat.rotateVector(Vec3(1.0, 0.0, 0.0)))
+print "toEuler:" + str(quat.toEuler(RotationOrder('xyz')))
+
+mat33 = Euler(1.0, 0.0, 2.0, ro='zyx').toMat33()
+print "mat33:" + str(mat33)
+print "determinant:" + str(mat33.determinant())
+
+xfo = Xfo(tr=Vec3(1.0, 2.0, 3.0), ori=quat, sc=Vec3(2.0, 2.0, 2.0))
+print "xfo:" + str(xfo)
+print "toMat44:" + str(xfo.toMat44())
+print "inverse:" + str(xfo.inverse())
+print "transformVector:" + str(xfo.transformVector(Vec3(0.0, 1.0, 0.0)))
+
+fromMat44 = Xfo()
+fromMat44.setFromMat44(xfo.toMat44())
+print "setFromMat44:" + str(fromMat44.ori.almostEqual(xfo.ori) and fromMat44.tr.almostEqual(xfo.tr))
+
+# Members are returned by reference like the RTVal members.
+xfo.tr.x = 5.0
+xfo.ori.setFromAxisAndAngle(Vec3(0.0, 1.0, 0.0), 1.0)
+print "reference:" + str(xfo)
+
+setMathBackend(previousBackend)
@@ -0,0 +1,65 @@
+"""Kraken Build Name Test
+
+Checks that the memoized build names of objects are updated when the config,
+the name, the component, the location or the flags of an object change.
+
+"""
+
+from kraken.core.maths import *
+from kraken.core.configs.config import Config
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.joint import Joint
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.container import Container
+from kraken.core.objects.components.component import Component
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+config = Config.getInstance()
+
+container = Container('rig')
+layer = Layer('deformers', parent=container)
+component = Component('arm', container, location='L')
+locator = Locator('elbow', parent=layer)
+locator.setComponent(component)
+joint = Joint('wrist', parent=layer)
+joint.setComponent(component)
+
+print "container:" + container.getBuildName()
+print "layer:" + layer.getBuildName()
+print "locator:" + locator.getBuildName()
+print "joint:" + joint.getBuildName()
+
+locator.setName('shoulder')
+print "renamed:" + locator.getBuildName()
+
+component.setName('leg')
+print "componentRenamed:" + joint.getBuildName()
+
+component.setLocation('R')
+print "location:" + joint.getBuildName()
+
+locator.setFlag('inputObject')
+print "inputFlag:" + locator.getBuildName()
+locator.clearFlag('inputObject')
+locator.setFlag('outputObject')
+print "outputFlag:" + locator.getBuildName()
+
+joint.setFlag('EXPLICIT_NAME')
+print "explicitFlag:" + joint.getBuildName()
+joint.clearFlag('EXPLICIT_NAME')
+
+config.setExplicitNaming(True)
+print "explicitNaming:" + joint.getBuildName()
+config.setExplicitNaming(False)
+print "templateNaming:" + joint.getBuildName()
+
+config.getNameTemplate()['separator'] = '-'
+config.invalidateNameFormatters()
+print "separator:" + joint.getBuildName()
+config.getNameTemplate()['separator'] = '_'
+config.invalidateNameFormatters()
+
+setMathBackend(previousBackend)
@@ -0,0 +1,58 @@
+"""Kraken Child Name Index Test
+
+Adds many children with the same name and checks the names allocated to
+resolve the collisions and the child lookups by name.
+
+"""
+
+from kraken.core.maths import *
+from kraken.core.objects.locator import Locator
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+chain = Locator('chain')
+bones = [Locator('bone', parent=chain) for i in xrange(1000)]
+print "first:" + ",".join([x.getName() for x in bones[:4]])
+print "last:" + bones[-1].getName()
+print "byName:" + str(chain.getChildByName('bone500') is bones[500])
+print "byDecoratedName:" + str(chain.getChildByDecoratedName('bone999') is bones[-1])
+
+# Removed names are allocated again.
+chain.removeChild(bones[2])
+print "reused:" + Locator('bone', parent=chain).getName()
+print "next:" + Locator('bone', parent=chain).getName()
+
+# Renaming updates the indexes.
+bones[10].setName('tip')
+print "renamed:" + str(chain.getChildByName('tip') is bones[10]) + " " + str(chain.getChildByName('bone10'))
+print "renamedCollision:" + Locator('tip', parent=chain).getName()
+bones[11].setName('bone')
+print "renameToTaken:" + bones[11].getName()
+
+# Reparenting removes the child from the indexes of the previous parent.
+other = Locator('other')
+other.addChild(bones[20])
+print "reparented:" + str(chain.getChildByName('bone20')) + " " + str(other.getChildByName('bone20') is bones[20])
+
+# Names allocated from a name ending with digits are freed on removal.
+limbs = Locator('limbs')
+Locator('bone03', parent=limbs)
+collision = Locator('bone03', parent=limbs)
+print "collision:" + collision.getName()
+limbs.removeChild(collision)
+print "collisionReused:" + Locator('bone03', parent=limbs).getName()
+
+# A child renamed again on its previous parent while it is reparented does
+# not take the suffix it was first given on the new parent.
+first = Locator('first')
+second = Locator('second')
+Locator('joint', parent=first)
+Locator('joint01', parent=second)
+moved = Locator('joint', parent=second)
+first.addChild(moved)
+print "moved:" + moved.getName()
+print "afterMove:" + Locator('joint', parent=first).getName()
+
+setMathBackend(previousBackend)
@@ -0,0 +1,44 @@
+"""Kraken Component Build Order Test
+
+Checks that the builder orders the components of a rig after the components
+they take inputs from, and that it reports dependency cycles.
+
+"""
+
+from kraken.core.maths import *
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.components.component import Component
+from kraken.core.builder import Builder
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+rig = Rig('buildOrderRig')
+hand = Component('hand', rig)
+arm = Component('arm', rig)
+spine = Component('spine', rig)
+head = Component('head', rig)
+
+spineEnd = spine.createOutput('end', dataType='Xfo')
+armEnd = arm.createOutput('end', dataType='Xfo')
+
+arm.createInput('root', dataType='Xfo').setConnection(spineEnd)
+head.createInput('root', dataType='Xfo').setConnection(spineEnd)
+hand.createInput('root', dataType='Xfo').setConnection(armEnd)
+
+builder = Builder()
+print "order:" + ",".join([x.getName() for x in builder.getComponentBuildOrder(rig)])
+for i, level in enumerate(builder.getComponentBuildLevels(rig)):
+    print "level" + str(i) + ":" + ",".join([x.getName() for x in level])
+
+# Close a cycle spine -> arm -> hand -> spine.
+handEnd = hand.createOutput('end', dataType='Xfo')
+spine.createInput('root', dataType='Xfo').setConnection(handEnd)
+
+try:
+    builder.getComponentBuildOrder(rig)
+except Exception as e:
+    print str(e)
+
+setMathBackend(previousBackend)
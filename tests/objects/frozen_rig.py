@@ -0,0 +1,97 @@
+"""Kraken Frozen Rig Test
+
+Checks that a frozen rig stores the hierarchy, names, types, transforms and
+constraints of a rig and materializes its objects on demand.
+
+"""
+
+from kraken.core.maths import *
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.joint import Joint
+from kraken.core.objects.control import Control
+from kraken.core.objects.component_group import ComponentGroup
+from kraken.core.objects.components.component import Component
+from kraken.core.objects.frozen_rig import FrozenRig
+from kraken.core.io.kraken_saver import KrakenSaver
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+rig = Rig('rig')
+controlsLayer = Layer('controls', parent=rig)
+deformersLayer = Layer('deformers', parent=rig)
+arm = Component('arm', rig, location='L')
+
+armGrp = ComponentGroup('arm', arm, parent=controlsLayer)
+shoulder = Control('shoulder', parent=armGrp)
+shoulder.xfo = Xfo(Vec3(1.0, 2.0, 0.0))
+elbow = Control('elbow', parent=shoulder)
+elbow.xfo = Xfo(Vec3(3.0, 2.0, 0.0), Quat(Vec3(0.0, 0.0, 0.707106769085), 0.707106769085))
+elbow.setColor('yellow')
+wrist = Locator('wrist', parent=elbow)
+wrist.xfo = Xfo(Vec3(3.0, 4.0, 0.0))
+wrist.setFlag('outputObject')
+
+defGrp = ComponentGroup('arm', arm, parent=deformersLayer)
+elbowDef = Joint('elbow', parent=defGrp)
+elbowDef.constrainTo([elbow, wrist], maintainOffset=True)
+
+frozenRig = FrozenRig.fromRig(rig)
+
+print "numItems:" + str(frozenRig.getNumItems())
+for i in xrange(frozenRig.getNumItems()):
+    print str(i) + ":" + frozenRig.getPath(i, decorated=True) + " " + frozenRig.getTypeName(i) + \
+        " parent=" + str(frozenRig.getParentIndex(i)) + " component=" + str(frozenRig.getComponentIndex(i)) + \
+        " buildName=" + frozenRig.getBuildName(i)
+
+print "children:" + str(frozenRig.getChildIndices(frozenRig.getIndexByPath('rig.controls.arm:L.shoulder')))
+print "controls:" + str(frozenRig.getIndicesByType('Control'))
+print "curves:" + str(frozenRig.getIndicesByType('Curve', inheritedClass=False))
+print "location:" + frozenRig.getLocation(frozenRig.getIndexByPath('rig.arm:L'))
+print "flag:" + str(frozenRig.testFlag(frozenRig.getIndexByPath('rig.controls.arm:L.shoulder.elbow.wrist'), 'outputObject'))
+print "constraint:" + str(frozenRig.getConstraint(0))
+
+localXfos = frozenRig.getLocalXfos()
+print "localXfo:" + str(localXfos[frozenRig.getIndexByPath('rig.controls.arm:L.shoulder.elbow.wrist')].tr)
+
+materialized = frozenRig.getItem(frozenRig.getIndexByPath('rig.deformers.arm:L.elbow'))
+print "materialized:" + materialized.getPath() + " " + materialized.getBuildName()
+constraint = materialized.getConstraintByIndex(0)
+print "constrainers:" + ",".join([x.getPath() for x in constraint.getConstrainers()])
+print "color:" + str(constraint.getConstrainers()[0].getColor())
+print "xfo:" + str(constraint.getConstrainers()[1].xfo.tr)
+print "same:" + str(frozenRig.getItem(0) is materialized.getParent().getParent().getParent())
+
+# Named colors, Color objects and the channel tuples of components can be
+# mixed in a rig.
+mixed = Rig('mixed')
+mixedLayer = Layer('controls', parent=mixed)
+leg = Component('leg', mixed, location='R')
+legGrp = ComponentGroup('leg', leg, parent=mixedLayer)
+named = Locator('named', parent=legGrp)
+named.setColor('yellow')
+orange = Locator('orange', parent=legGrp)
+orange.setColor(Color(1.0, 0.5, 0.0, 1.0))
+orangeToo = Locator('orangeToo', parent=legGrp)
+orangeToo.setColor(Color(1.0, 0.5, 0.0, 1.0))
+mixedRig = FrozenRig.fromRig(mixed)
+print "colors:" + ",".join([str(mixedRig.getItem(i).getColor()) for i in xrange(mixedRig.getNumItems())])
+
+# The arrays are saved and loaded without materializing the objects.
+jsonData = mixedRig.jsonEncode(KrakenSaver())
+loadedRig = FrozenRig()
+loadedRig.jsonDecode(None, jsonData)
+print "loaded:" + str(loadedRig.getNumItems()) + " " + loadedRig.getPath(loadedRig.getNumItems() - 1) + " " + \
+    str(loadedRig.getIndicesByType('Locator')) + " " + str(loadedRig.getXfos()[0].tr)
+print "loadedColors:" + ",".join([str(loadedRig.getItem(i).getColor()) for i in xrange(loadedRig.getNumItems())])
+
+jsonData = frozenRig.jsonEncode(KrakenSaver())
+loadedRig = FrozenRig()
+loadedRig.jsonDecode(None, jsonData)
+print "loadedConstraint:" + str(loadedRig.getConstraint(0)) + " " + str(loadedRig.testFlag(5, 'outputObject'))
+print "loadedXfo:" + str(loadedRig.getXfos()[4])
+
+setMathBackend(previousBackend)
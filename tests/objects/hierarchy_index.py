@@ -0,0 +1,65 @@
+"""Kraken Hierarchy Index Test
+
+Checks that the type and component queries of a rig are kept up to date as
+objects are added, moved and removed.
+
+"""
+
+from kraken.core.maths import *
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.joint import Joint
+from kraken.core.objects.control import Control
+from kraken.core.objects.component_group import ComponentGroup
+from kraken.core.objects.components.component import Component
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+
+def names(items):
+    return ",".join([x.getName() for x in items])
+
+
+rig = Rig('rig')
+controlsLayer = Layer('controls', parent=rig)
+deformersLayer = Layer('deformers', parent=rig)
+arm = Component('arm', rig, location='L')
+leg = Component('leg', rig, location='R')
+
+armGrp = ComponentGroup('arm', arm, parent=controlsLayer)
+arm.addItem('ctrlCmpGrp', armGrp)
+shoulder = Control('shoulder', parent=armGrp)
+elbow = Control('elbow', parent=shoulder)
+elbowSpace = Locator('elbowSpace', parent=shoulder)
+wrist = Control('wrist', parent=elbow)
+
+legGrp = ComponentGroup('leg', leg, parent=controlsLayer)
+leg.addItem('ctrlCmpGrp', legGrp)
+hip = Control('hip', parent=legGrp)
+
+bicepDef = Joint('bicep', parent=deformersLayer)
+bicepDef.setComponent(arm)
+
+print "components:" + names(rig.getChildrenByType('Component'))
+print "controls:" + names(rig.getItemsByType('Control'))
+print "locators:" + names(rig.getItemsByType('Locator', inheritedClass=False))
+print "descendents:" + names(shoulder.getDescendents(classType='Control'))
+print "armNodes:" + names(arm.getHierarchyNodes(classType='Control'))
+print "armItems:" + names(rig.getComponentItems(arm))
+
+legGrp.addChild(wrist)
+print "moved:" + names(arm.getHierarchyNodes(classType='Control')) + " " + names(leg.getHierarchyNodes(classType='Control'))
+
+shoulder.removeChild(elbow)
+print "removed:" + names(rig.getItemsByType('Control'))
+
+bicepDef.setComponent(leg)
+print "componentItems:" + names(rig.getComponentItems(arm)) + " " + names(rig.getComponentItems(leg))
+
+leg.setName('foot')
+print "renamed:" + names(rig.getChildrenByType('Component'))
+
+setMathBackend(previousBackend)
@@ -0,0 +1,40 @@
+"""Kraken Path Cache Test
+
+Checks that the cached paths of scene items are updated when an item is
+renamed, reparented or its component location changes.
+
+"""
+
+from kraken.core.maths import *
+from kraken.core.objects.scene_item import getPathCacheStats, resetPathCacheStats
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.components.component import Component
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+root = Locator('root')
+component = Component('arm', root, location='L')
+parent = Locator('parent', parent=root)
+child = Locator('child', parent=parent)
+
+resetPathCacheStats()
+print "path:" + child.getPath()
+print "decoratedPath:" + child.getDecoratedPath()
+child.getPath()
+child.getDecoratedPath()
+stats = getPathCacheStats()
+print "stats:" + str(stats['hits']) + " " + str(stats['misses']) + " " + str(stats['hitRate'])
+
+parent.setName('elbow')
+print "renamed:" + child.getPath()
+
+other = Locator('other', parent=root)
+other.addChild(parent)
+print "reparented:" + child.getPath()
+
+component.setLocation('R')
+print "location:" + component.getDecoratedPath()
+
+setMathBackend(previousBackend)
@@ -0,0 +1,78 @@
+"""Kraken Rig Evaluator Test
+
+Checks that the rig evaluator computes global transforms from parents and
+constraints and only evaluates the objects downstream of a change. Constraint
+classes without solveXfo() are computed with compute().
+
+"""
+
+from kraken.core.maths import *
+from kraken.core.objects.rig import Rig
+from kraken.core.objects.layer import Layer
+from kraken.core.objects.locator import Locator
+from kraken.core.objects.control import Control
+from kraken.core.objects.constraints.constraint import Constraint
+from kraken.core.rig_evaluator import RigEvaluator
+
+
+class AboveConstraint(Constraint):
+    """Places the constrainee one unit above the constrainer."""
+
+    def compute(self, getGlobalXfoFunc):
+        xfo = Xfo(getGlobalXfoFunc(self.getConstrainee()))
+        xfo.tr = getGlobalXfoFunc(self.getConstrainers()[0]).tr.add(Vec3(0.0, 1.0, 0.0))
+
+        return xfo
+
+
+previousBackend = getMathBackend()
+setMathBackend(NATIVE_BACKEND)
+
+rig = Rig('rig')
+layer = Layer('controls', parent=rig)
+
+root = Control('root', parent=layer)
+root.xfo = Xfo(Vec3(0.0, 1.0, 0.0))
+arm = Control('arm', parent=root)
+arm.xfo = Xfo(Vec3(2.0, 1.0, 0.0))
+hand = Locator('hand', parent=arm)
+hand.xfo = Xfo(Vec3(4.0, 1.0, 0.0))
+
+target = Control('target', parent=layer)
+target.xfo = Xfo(Vec3(0.0, 5.0, 0.0))
+
+follow = Locator('follow', parent=layer)
+follow.xfo = Xfo(Vec3(1.0, 5.0, 0.0))
+follow.constrainTo(target, constraintType='Pose', maintainOffset=True)
+
+average = Locator('average', parent=layer)
+average.constrainTo([hand, target], constraintType='Position')
+
+above = Locator('above', parent=layer)
+aboveConstraint = AboveConstraint('above_To_hand_AboveConstraint')
+aboveConstraint.addConstrainer(hand)
+above.addConstraint(aboveConstraint)
+
+evaluator = RigEvaluator(rig)
+print "dirty:" + str(evaluator.getNumDirty())
+print "evaluated:" + str(evaluator.evaluate())
+
+evaluator.setGlobalXfo(root, Xfo(Vec3(0.0, 3.0, 0.0)))
+print "dirtyHand:" + str(evaluator.isDirty(hand)) + " dirtyTarget:" + str(evaluator.isDirty(target))
+print "evaluated:" + str(evaluator.evaluate())
+print "hand:" + str(hand.xfo.tr)
+print "average:" + str(average.xfo.tr)
+print "follow:" + str(follow.xfo.tr)
+print "above:" + str(above.xfo.tr)
+
+rotation = Quat()
+rotation.setFromAxisAndAngle(Vec3(0.0, 0.0, 1.0), Math_degToRad(90.0))
+evaluator.setLocalXfo(target, Xfo(Vec3(0.0, 5.0, 0.0), rotation))
+print "evaluated:" + str(evaluator.evaluate())
+print "follow:" + str(evaluator.getGlobalXfo(follow).tr)
+print "average:" + str(evaluator.getGlobalXfo(average).tr)
+
+evaluator.resetPose()
+print "reset:" + str(hand.xfo.tr) + " " + str(follow.xfo.tr)
+
+setMathBackend(previousBackend)
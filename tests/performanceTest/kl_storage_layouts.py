@@ -0,0 +1,37 @@
+import os
+import tempfile
+
+os.environ['KRAKEN_DCC'] = 'KL'
+
+from kraken import plugins
+from kraken.core.kraken_system import ks
+from kraken.core.objects.rig import Rig
+
+
+numSolves = 100
+rigFilePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'arms.krg')
+
+guideRig = Rig()
+guideRig.loadRigDefinitionFile(rigFilePath)
+
+for layout in ['AoS', 'SoA']:
+    rig = Rig()
+    rig.loadRigDefinition(guideRig.getRigBuildData())
+
+    builder = plugins.getBuilder()
+    builder.setOutputFolder(tempfile.mkdtemp())
+
+    config = builder.getConfig()
+    config.setMetaData('RigTitle', 'arms' + layout)
+    config.setMetaData('KLStorageLayout', layout)
+
+    builder.buildRig(rig)
+
+    klRig = getattr(ks.getCoreClient().RT.types, builder.getKLExtensionName()).create()
+
+    totalMs = 0.0
+    for i in xrange(numSolves):
+        klRig.solve('')
+        totalMs += klRig.solveTimeMs.getSimpleType()
+
+    print "%s: %.4f ms per solve" % (layout, totalMs / numSolves)
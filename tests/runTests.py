@@ -157,9 +157,13 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('--file', required=False, help = "The python or kl File to use in the test (optional)")
     parser.add_argument('--update', required=False, action='store_const', const=True, default=False, help = "Force the update of the reference file(s). (optional)")
+    parser.add_argument('--mathBackend', required=False, choices=['rtval', 'native'], help = "The backend used by the Kraken math types. (optional)")
     args = parser.parse_args()
     update = args.update
 
+    if args.mathBackend is not None:
+        os.environ['KRAKEN_MATH_BACKEND'] = args.mathBackend
+
     if args.file is not None:
         filepath = args.file
         if not os.path.exists(filepath):
@@ -0,0 +1,88 @@
+"""Kraken Component Manifest Test
+
+Loads a component module from a temporary Kraken path and checks that the
+component manifest lets later loads skip importing unchanged modules.
+
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+
+from kraken.core.kraken_system import ks
+
+
+componentSource = """
+from kraken.core.kraken_system import ks
+
+
+class ManifestTestComponent(object):
+
+    @classmethod
+    def getComponentType(cls):
+        return '%s'
+
+
+ks.registerComponent(ManifestTestComponent)
+"""
+
+tempDir = tempfile.mkdtemp()
+packageDir = os.path.join(tempDir, 'manifest_test_components')
+os.makedirs(packageDir)
+open(os.path.join(packageDir, '__init__.py'), 'w').close()
+
+modulePath = os.path.join(packageDir, 'test_component.py')
+with open(modulePath, 'w') as moduleFile:
+    moduleFile.write(componentSource % 'Guide')
+
+previousEnv = {}
+for key in ('KRAKEN_PATHS', 'KRAKEN_COMPONENT_MANIFEST'):
+    previousEnv[key] = os.environ.get(key)
+
+os.environ['KRAKEN_PATHS'] = tempDir
+os.environ['KRAKEN_COMPONENT_MANIFEST'] = os.path.join(tempDir, 'manifest.json')
+
+module = 'manifest_test_components.test_component'
+className = module + '.ManifestTestComponent'
+
+# First load, the module is not in the manifest and is imported.
+ks.loadComponentModules()
+print "indexed:" + str(className in ks.getComponentClassNames())
+print "imported:" + str(module in sys.modules)
+print "manifest:" + str(os.path.exists(os.environ['KRAKEN_COMPONENT_MANIFEST']))
+
+# Forget the module as if a new session was started.
+del ks.registeredComponents[className]
+del sys.modules[module]
+
+ks.loadComponentModules()
+print "importedFromManifest:" + str(module in sys.modules)
+print "type:" + ks.getComponentType(className)
+print "filePath:" + str(ks.getComponentFilePath(className) == modulePath)
+
+componentClass = ks.getComponentClass(className)
+print "lazyImport:" + componentClass.__name__ + " " + str(module in sys.modules)
+
+# Edit the module, only it is imported again.
+with open(modulePath, 'w') as moduleFile:
+    moduleFile.write(componentSource % 'Base')
+
+mtime = os.path.getmtime(modulePath) + 10.0
+os.utime(modulePath, (mtime, mtime))
+
+ks.loadComponentModules()
+print "typeAfterEdit:" + ks.getComponentType(className)
+print "reimported:" + str(ks.getComponentClass(className) is not componentClass)
+
+for key, value in previousEnv.iteritems():
+    if value is None:
+        del os.environ[key]
+    else:
+        os.environ[key] = value
+
+del ks.registeredComponents[className]
+del sys.modules[module]
+del sys.modules['manifest_test_components']
+sys.path.remove(tempDir)
+shutil.rmtree(tempDir)
@@ -0,0 +1,52 @@
+"""Kraken RTVal Type Names Test
+
+Checks that the type names of RTVals without getTypeNameStr() are parsed once
+per type and served from the cache afterwards. The RTVals are stand-ins that
+return a new Type wrapper on every call, like the Fabric client does.
+
+"""
+
+import json
+
+from kraken.core.kraken_system import KrakenSystem
+
+
+class SimpleValue(object):
+
+    def __init__(self, value):
+        self.value = value
+
+    def getSimpleType(self):
+        return self.value
+
+
+class TypeValue(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def jsonDesc(self, returnType):
+        return SimpleValue(json.dumps({'name': self.name, 'size': 4}))
+
+
+class RTValue(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def type(self, returnType):
+        return TypeValue(self.name)
+
+
+ks = KrakenSystem()
+ks._rtValClass = RTValue
+
+print "first:" + ks.getRTValTypeName(RTValue('Xfo'))
+print "second:" + ks.getRTValTypeName(RTValue('Xfo'))
+print "other:" + ks.getRTValTypeName(RTValue('Vec3'))
+print "notRTVal:" + ks.getRTValTypeName(1.0)
+print "isXfo:" + str(ks.isRTValOfType(RTValue('Xfo'), 'Xfo'))
+
+stats = ks.getRTValTypeNameStats()
+print "stats:" + str(stats['calls']) + " " + str(stats['cacheHits']) + " " + str(stats['slowPath'])
+print "cached:" + str(len(ks._rtValTypeNames))